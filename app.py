@@ -7,122 +7,115 @@ from kivy.uix.label import Label
 from kivy.uix.image import Image
 from kivy.uix.widget import Widget
 from kivy.uix.gridlayout import GridLayout
-from kivy.uix.modalview import ModalView
 from kivy.uix.button import Button
 from kivy.uix.textinput import TextInput
 from kivy.uix.tabbedpanel import TabbedPanel, TabbedPanelItem
-from kivy.uix.spinner import Spinner
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.core.window import Window
-from kivy.utils import get_color_from_hex
+from kivy.clock import Clock
+from kivy.logger import Logger
+from kivy.utils import escape_markup, get_hex_from_color
 from kivy.metrics import dp
+from bisect import bisect_left, bisect_right
+from itertools import groupby
 import os
-import sys
+import time
 
-# Set dark background color for window
-Window.clearcolor = get_color_from_hex('#1a1a1a')
+from calculations import (
+    ERROR_INCOMPATIBLE, ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE, ERROR_UNDERDETERMINED,
+    ERROR_UNKNOWN, ERROR_ZERO, INSTALLATION_AIR, INSTALLATION_GROUND, UNIT_FACTORS, UNIT_GROUPS,
+    UNITS, conversion_result, current_result, format_current, format_resistance, ohms_law_result,
+    resistor_result, voltage_table, wire_result
+)
+from history import CalculationHistory
+from parsing import parse_quantity
+from resources import load_image
+from symbol_catalogue import Section, Symbol, SymbolCatalogue
+import tables
+from theme import (
+    BUTTON_HEIGHT, FONT_BODY, FONT_LARGE, FONT_NOTE, FONT_SMALL, FONT_TITLE, PADDING, SPACING,
+    TITLE_HEIGHT, theme
+)
+from widgets import StaticText, TableView
 
+# Window background follows the theme
+theme.style(Window, clearcolor='background')
 
-# --- CHANGE: Added a function to find the path to resources ---
-# This function ensures that the application can find images, whether it's
-# running from a computer or as a final APK on a mobile device.
-def get_resource_path(relative_path):
-    """ Gets the absolute path to a resource, works for dev and for bundled app. """
-    try:
-        # In a bundled app (APK), the path is stored in sys._MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        # When running normally, the path is relative to this file.
-        # We need to go up two directories from app.py (src/elektrohelper) to the project root,
-        # and then into the 'resources' directory.
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "resources"))
-    
-    return os.path.join(base_path, relative_path)
+# Delay after the last change of an input before results are recalculated [s]
+LIVE_RECALCULATION_DELAY = 0.3
 
+# How often the table files are checked for changes in development mode [s]
+TABLE_RELOAD_INTERVAL = 1.0
 
-class ImageModal(ModalView):
-    """Modal popup for enlarged image view"""
+# Messages for the error codes of the calculators
+ERROR_TEXTS = {
+    ERROR_MISSING: "Chyba: Zadajte platné číselné hodnoty!",
+    ERROR_ZERO: "Chyba: Napätie nemôže byť nula!",
+    ERROR_NEGATIVE: "Chyba: Hodnota nemôže byť záporná!",
+    ERROR_RANGE: "Chyba: Výsledok je mimo rozsahu!",
+    ERROR_UNKNOWN: "Chyba: Neznáma hodnota!",
+    ERROR_INCOMPATIBLE: "Chyba: Nekompatibilné jednotky!",
+    ERROR_UNDERDETERMINED: "Nemožno vypočítať všetky hodnoty.\nSkontrolujte zadané vstupy.",
+}
+
+
+def record_calculation(kind, inputs, result):
+    """Append a calculation to the running app's history"""
+    history = getattr(App.get_running_app(), 'history', None)
+    if history is not None:
+        history.append(kind, inputs, result.replace("\n", " | "))
+
+
+class LiveRecalculation:
+    """Mixin recalculating a tab's result shortly after its inputs stop changing
     
-    def __init__(self, image_source, symbol_name, symbol_id, **kwargs):
-        super().__init__(**kwargs)
-        self.size_hint = (0.9, 0.8)
-        self.background_color = [0.1, 0.1, 0.1, 0.95]
-        
-        # Main layout for modal
-        layout = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(15))
-        
-        # Header with symbol info
-        header_layout = BoxLayout(
-            orientation='vertical', 
-            size_hint_y=None, 
-            height=dp(100),
-            spacing=dp(5)
-        )
-        
-        # Symbol number
-        number_label = Label(
-            text=f"#{symbol_id}",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='18sp',
-            bold=True,
-            size_hint_y=None,
-            height=dp(25)
-        )
-        
-        # Symbol name
-        name_label = Label(
-            text=symbol_name,
-            color=get_color_from_hex('#ffffff'),
-            font_size='14sp',
-            text_size=(None, None),
-            halign='center',
-            size_hint_y=None,
-            height=dp(60)
-        )
-        name_label.bind(size=name_label.setter('text_size'))
-        
-        header_layout.add_widget(number_label)
-        header_layout.add_widget(name_label)
-        layout.add_widget(header_layout)
-        
-        # Enlarged image
-        if os.path.exists(image_source):
-            enlarged_image = Image(
-                source=image_source,
-                allow_stretch=True,
-                keep_ratio=True
-            )
-        else:
-            enlarged_image = Label(
-                text="[size=72sp][font=DejaVuSans]📷[/font][/size]",
-                markup=True,
-                color=get_color_from_hex('#666666')
-            )
-        
-        layout.add_widget(enlarged_image)
-        
-        # Close button
-        close_button = Button(
-            text="Zavrieť",
-            size_hint_y=None,
-            height=dp(50),
-            background_color=get_color_from_hex('#ff8c00'),
-            color=get_color_from_hex('#1a1a1a'),
-            font_size='16sp',
-            bold=True
-        )
-        close_button.bind(on_press=lambda x: self.dismiss())
-        layout.add_widget(close_button)
-        
-        self.add_widget(layout)
+    Every change restarts a single Clock trigger, so fast typing leads to one
+    recalculation instead of a queue of them. Tabs implement live_inputs(),
+    returning the parsed inputs, and live_result(inputs), returning the
+    result text.
+    """
+    
+    def bind_live_inputs(self, result_label, *widgets):
+        """Recalculate result_label whenever the text of widgets changes"""
+        self._live_label = result_label
+        self._live_inputs = None
+        self._live_trigger = Clock.create_trigger(self._recalculate_live, LIVE_RECALCULATION_DELAY)
+        for widget in widgets:
+            widget.bind(text=self._restart_live_trigger)
+    
+    def _restart_live_trigger(self, *args):
+        self._live_trigger.cancel()
+        self._live_trigger()
+    
+    def keep_live_result(self):
+        """Don't recalculate for the current inputs, e.g. after filling them with rounded results"""
+        self._live_trigger.cancel()
+        self._live_inputs = self.live_inputs()
+    
+    def _recalculate_live(self, dt):
+        inputs = self.live_inputs()
+        # Edits that parse to the same values (e.g. "230" -> "230,") need no recalculation
+        if inputs == self._live_inputs:
+            return
+        self._live_inputs = inputs
+        try:
+            text = self.live_result(inputs)
+        except ArithmeticError:
+            text = "Chyba: Výsledok je mimo rozsahu!"
+        # Kivy ignores assigning an equal value, so an unchanged result isn't re-rendered
+        self._live_label.text = text
 
 
-class SymbolItem(BoxLayout):
-    """Widget for individual symbols"""
+class SymbolItem(RecycleDataViewBehavior, BoxLayout):
+    """Widget for individual symbols, reused by the RecycleView for any row"""
     
-    def __init__(self, symbol_id, symbol_name, **kwargs):
+    def __init__(self, symbol_id=None, symbol_name='', image=None, **kwargs):
         super().__init__(**kwargs)
-        self.symbol_id = symbol_id
-        self.symbol_name = symbol_name
+        # Symbol rows of the list showing this item and its position, for browsing in the popup
+        self.rows = None
+        self.index = 0
         self.orientation = 'horizontal'
         self.size_hint_y = None
         self.height = dp(80)
@@ -132,123 +125,356 @@ class SymbolItem(BoxLayout):
         # Background for item
         with self.canvas.before:
             from kivy.graphics import Color, Rectangle
-            Color(*get_color_from_hex('#2d2d2d'))
+            theme.style(Color(), owner=self, rgba='surface')
             self.rect = Rectangle(size=self.size, pos=self.pos)
         
         self.bind(size=self._update_rect, pos=self._update_rect)
         
-        # Symbol image
-        self.add_widget(self._create_image_widget(symbol_id))
+        # Symbol image, the slot shows either the image or the placeholder
+        self.image_slot = BoxLayout(size_hint=(None, None), size=(dp(64), dp(45)))
+        self.symbol_image = Image(
+            size_hint=(None, None),
+            size=(dp(64), dp(45)),
+            allow_stretch=True,
+            keep_ratio=True
+        )
+        # Placeholder if image doesn't exist
+        self.placeholder = theme.style(Label(
+            text="[size=24sp][font=DejaVuSans]📷[/font][/size]",
+            markup=True,
+            size_hint=(None, None),
+            size=(dp(64), dp(45))
+        ), color='muted')
+        self.add_widget(self.image_slot)
         
         # Text section - make it clickable
         text_layout = BoxLayout(orientation='vertical', spacing=dp(2))
         
         # Number label
-        number_label = Label(
-            text=f"#{symbol_id}",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='16sp',
+        self.number_label = theme.style(Label(
+            font_size=FONT_BODY,
             bold=True,
             size_hint_y=None,
             height=dp(20),
             halign='left',
             valign='middle'
-        )
-        number_label.bind(size=number_label.setter('text_size'))
-        text_layout.add_widget(number_label)
+        ), color='accent')
+        self.number_label.bind(size=self.number_label.setter('text_size'))
+        text_layout.add_widget(self.number_label)
         
         # Name label - clickable
-        name_label = Button(
-            text=symbol_name,
-            color=get_color_from_hex('#ffffff'),
+        self.name_label = theme.style(Button(
             background_color=(0, 0, 0, 0),  # Transparent background
-            font_size='16sp',
+            font_size=FONT_BODY,
             halign='left',
             valign='middle',
             text_size=(None, None)
-        )
-        name_label.bind(size=name_label.setter('text_size'))
-        name_label.bind(on_press=self._show_enlarged_image)
-        text_layout.add_widget(name_label)
+        ), color='text')
+        self.name_label.bind(size=self.name_label.setter('text_size'))
+        self.name_label.bind(on_press=self._show_enlarged_image)
+        text_layout.add_widget(self.name_label)
         
         self.add_widget(text_layout)
+        
+        if symbol_id is not None:
+            self.set_symbol(symbol_id, symbol_name, image)
+    
+    def refresh_view_attrs(self, rv, index, data):
+        """Show the symbol of a RecycleView data row"""
+        self.rows = data['rows']
+        self.index = data['position']
+        self.set_symbol(data['symbol_id'], data['symbol_name'], data['image'])
+    
+    def set_symbol(self, symbol_id, symbol_name, image=None):
+        """Display another symbol in this widget"""
+        self.symbol_id = symbol_id
+        self.symbol_name = symbol_name
+        self.image = image or f"images/{symbol_id}.png"
+        self.number_label.text = f"#{symbol_id}"
+        self.name_label.text = symbol_name
+        
+        self.image_slot.clear_widgets()
+        if load_image(self.symbol_image, self.image, self.symbol_image.size):
+            self.image_slot.add_widget(self.symbol_image)
+        else:
+            self.image_slot.add_widget(self.placeholder)
     
     def _update_rect(self, instance, value):
         """Update background when size/position changes"""
         self.rect.pos = instance.pos
         self.rect.size = instance.size
     
-    def _create_image_widget(self, symbol_id):
-        """Create widget for image"""
-        # CHANGE: Use the new function to find the correct path
-        image_path = get_resource_path(f"images/{symbol_id}.png")
-        
-        if os.path.exists(image_path):
-            img = Image(
-                source=image_path,
-                size_hint=(None, None),
-                size=(dp(64), dp(45)),
-                allow_stretch=True,
-                keep_ratio=True
-            )
-        else:
-            # Placeholder if image doesn't exist
-            img = Label(
-                text="[size=24sp][font=DejaVuSans]📷[/font][/size]",
-                markup=True,
-                color=get_color_from_hex('#666666'),
-                size_hint=(None, None),
-                size=(dp(64), dp(45))
-            )
-        
-        return img
-    
     def _show_enlarged_image(self, instance):
         """Show enlarged image in modal"""
-        # CHANGE: Use the new function to find the correct path
-        image_path = get_resource_path(f"images/{self.symbol_id}.png")
-        modal = ImageModal(image_path, self.symbol_name, self.symbol_id)
-        modal.open()
+        # Imported on first use, ModalView isn't needed at startup
+        from image_modal import show_symbol
+        if self.rows is None:
+            show_symbol([{'symbol_id': self.symbol_id, 'symbol_name': self.symbol_name,
+                          'image': self.image}], 0)
+        else:
+            show_symbol(self.rows, self.index)
+
+
+class SectionHeader(RecycleDataViewBehavior, Label):
+    """Header row of a symbol section"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        theme.style(self, color='accent')
+        self.font_size = FONT_BODY
+        self.bold = True
+        self.halign = 'left'
+        self.valign = 'middle'
+        self.bind(size=self.setter('text_size'))
+    
+    def refresh_view_attrs(self, rv, index, data):
+        """Show the title of a RecycleView data row"""
+        self.text = data['text']
+
+
+class SymbolRows:
+    """Popup rows of the symbols in display order, each built when accessed"""
+    
+    def __init__(self, symbol_at, count):
+        self.symbol_at = symbol_at
+        self.count = count
+    
+    def __len__(self):
+        return self.count
+    
+    def __getitem__(self, position):
+        if not 0 <= position < self.count:
+            raise IndexError(position)
+        symbol = self.symbol_at(position)
+        return {'symbol_id': symbol.id, 'symbol_name': symbol.name, 'image': symbol.image}
 
 
 class SymbolsTab(BoxLayout):
-    """Tab for electrical symbols"""
+    """Tab for electrical symbols, sectioned by category or first letter"""
+    
+    # Row geometry; section offsets are computed from these instead of a layout pass
+    ITEM_HEIGHT = dp(80)
+    HEADER_HEIGHT = dp(36)
+    SPACING = dp(5)
+    PADDING = dp(10)
+    
+    # Symbols per block; a block's rows are only created when it scrolls into view
+    BLOCK_ROWS = 50
     
     def __init__(self, symbols, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.symbols = symbols
+        # 'category' or 'name'
+        self.sort_mode = 'category' if hasattr(symbols, 'sections') else 'name'
+        self.section_titles = []
+        self.section_offsets = []
+        # [section index, first position, rows, loaded] per block and the block's scroll offset
+        self.blocks = []
+        self.block_offsets = []
+        self.symbol_rows = SymbolRows(None, 0)
+        self.content_height = 0
         self.create_symbols_view()
     
     def create_symbols_view(self):
         """Create symbols scrollable view"""
-        # ScrollView with content
-        scroll = ScrollView(
+        # Jump bar with a button per section
+        jump_scroll = theme.style(ScrollView(
+            do_scroll_x=True,
+            do_scroll_y=False,
+            size_hint_y=None,
+            height=dp(44),
+            bar_width=dp(2),
+            effect_cls='ScrollEffect'
+        ), bar_color='accent')
+        self.jump_bar = BoxLayout(
+            orientation='horizontal',
+            size_hint_x=None,
+            spacing=dp(5),
+            padding=[dp(10), dp(4), dp(10), dp(4)]
+        )
+        self.jump_bar.bind(minimum_width=self.jump_bar.setter('width'))
+        jump_scroll.add_widget(self.jump_bar)
+        self.add_widget(jump_scroll)
+        
+        # Sticky header with the section currently at the top
+        self.sticky_header = theme.style(Label(
+            font_size=FONT_BODY,
+            bold=True,
+            size_hint_y=None,
+            height=self.HEADER_HEIGHT,
+            halign='left',
+            valign='middle',
+            padding=[dp(10), 0]
+        ), color='accent')
+        self.sticky_header.bind(size=self.sticky_header.setter('text_size'))
+        self.add_widget(self.sticky_header)
+        
+        # RecycleView only creates widgets for the visible rows
+        self.symbols_view = theme.style(RecycleView(
             do_scroll_x=False,
             do_scroll_y=True,
             bar_width=dp(10),
-            bar_color=get_color_from_hex('#ff8c00'),
-            bar_inactive_color=get_color_from_hex('#666666'),
             effect_cls='ScrollEffect',
             scroll_type=['bars', 'content']
-        )
+        ), bar_color='accent', bar_inactive_color='muted')
+        self.symbols_view.key_viewclass = 'viewclass'
         
         # Layout for all symbols
-        symbols_layout = BoxLayout(
+        symbols_layout = RecycleBoxLayout(
             orientation='vertical',
-            spacing=dp(5),
-            padding=[dp(10), dp(10), dp(10), dp(10)],
+            spacing=self.SPACING,
+            padding=[self.PADDING, self.PADDING, self.PADDING, self.PADDING],
+            default_size=(None, self.ITEM_HEIGHT),
+            default_size_hint=(1, None),
+            key_size='row_size',
             size_hint_y=None
         )
         symbols_layout.bind(minimum_height=symbols_layout.setter('height'))
+        self.symbols_view.add_widget(symbols_layout)
+        self.symbols_view.bind(scroll_y=self._update_sticky_header)
+        self.symbols_view.bind(scroll_y=self._load_visible_blocks, height=self._load_visible_blocks)
+        self.add_widget(self.symbols_view)
         
-        # Add all symbols
-        for symbol_id, symbol_name in self.symbols.items():
-            symbol_item = SymbolItem(symbol_id, symbol_name)
-            symbols_layout.add_widget(symbol_item)
-        
-        scroll.add_widget(symbols_layout)
-        self.add_widget(scroll)
+        self.show_sections()
+    
+    def get_sections(self):
+        """(list of Section, function position -> Symbol) for the current sort mode"""
+        symbols = self.symbols
+        if self.sort_mode == 'category':
+            return symbols.sections, symbols.by_category
+        
+        if hasattr(symbols, 'by_name'):
+            symbol_at = symbols.by_name
+        else:
+            ordered = sorted(
+                (Symbol(symbol_id, symbol_name, '', f"images/{symbol_id}.png")
+                 for symbol_id, symbol_name in symbols.items()),
+                key=lambda symbol: symbol.name.casefold()
+            )
+            symbol_at = ordered.__getitem__
+        sections = []
+        start = 0
+        letters = (symbol_at(position).name[:1].upper() for position in range(len(symbols)))
+        for letter, group in groupby(letters):
+            count = sum(1 for _ in group)
+            sections.append(Section(letter, start, count))
+            start += count
+        return sections, symbol_at
+    
+    def show_sections(self):
+        """Fill the list and the jump bar, precomputing each section's scroll offset
+        
+        Each block of symbols starts as one empty row of the block's height,
+        so the offsets hold before any symbol row exists.
+        """
+        sections, symbol_at = self.get_sections()
+        data = []
+        self.section_titles = []
+        self.section_offsets = []
+        self.blocks = []
+        self.block_offsets = []
+        self.symbol_rows = SymbolRows(symbol_at, sum(section.count for section in sections))
+        offset = self.PADDING
+        row_height = self.ITEM_HEIGHT + self.SPACING
+        
+        for index, section in enumerate(sections):
+            self.section_titles.append(section.title)
+            self.section_offsets.append(offset)
+            data.append({'viewclass': 'SectionHeader', 'text': section.title, 'row_size': (None, self.HEADER_HEIGHT)})
+            offset += self.HEADER_HEIGHT + self.SPACING
+            end = section.start + section.count
+            for first in range(section.start, end, self.BLOCK_ROWS):
+                rows = min(self.BLOCK_ROWS, end - first)
+                self.blocks.append([index, first, rows, False])
+                self.block_offsets.append(offset)
+                data.append({'viewclass': 'Widget', 'row_size': (None, rows * row_height - self.SPACING)})
+                offset += rows * row_height
+        
+        self.content_height = offset - self.SPACING + self.PADDING
+        self.symbols_view.data = data
+        self.symbols_view.scroll_y = 1
+        self.sticky_header.text = self.section_titles[0] if self.section_titles else ""
+        self._create_jump_bar()
+        self._load_visible_blocks()
+    
+    def _load_visible_blocks(self, *args):
+        """Replace the empty rows of the blocks in view with their symbol rows"""
+        if not self.blocks:
+            return
+        top = max(0, (1 - self.symbols_view.scroll_y) * self._scrollable_height())
+        first = max(0, bisect_right(self.block_offsets, top) - 1)
+        last = bisect_right(self.block_offsets, top + self.symbols_view.height)
+        data = self.symbols_view.data
+        for block_index in range(first, last):
+            section, position, rows, loaded = self.blocks[block_index]
+            if loaded:
+                continue
+            # Data row of the block: the headers so far and every earlier block's rows
+            row = section + 1 + sum(block[2] if block[3] else 1 for block in self.blocks[:block_index])
+            data[row:row + 1] = [self.row_data(position) for position in range(position, position + rows)]
+            self.blocks[block_index][3] = True
+    
+    def row_data(self, position):
+        symbol = self.symbol_rows.symbol_at(position)
+        return {
+            'viewclass': 'SymbolItem',
+            'symbol_id': symbol.id,
+            'symbol_name': symbol.name,
+            'image': symbol.image,
+            'rows': self.symbol_rows,
+            'position': position,
+            'row_size': (None, self.ITEM_HEIGHT)
+        }
+    
+    def _create_jump_bar(self):
+        """Create mode toggle and one jump button per section"""
+        self.jump_bar.clear_widgets()
+        
+        if hasattr(self.symbols, 'sections'):
+            mode_btn = theme.style(Button(
+                text="A–Z" if self.sort_mode == 'category' else "Kategórie",
+                size_hint_x=None,
+                width=dp(90),
+                font_size=FONT_SMALL,
+                bold=True
+            ), background_color='muted', color='text')
+            mode_btn.bind(on_press=self.toggle_sort_mode)
+            self.jump_bar.add_widget(mode_btn)
+        
+        for index, title in enumerate(self.section_titles):
+            jump_btn = theme.style(Button(
+                text=title,
+                size_hint_x=None,
+                font_size=FONT_SMALL,
+                padding=[dp(10), 0]
+            ), background_color='surface', color='text')
+            jump_btn.bind(texture_size=lambda btn, size: setattr(btn, 'width', max(dp(36), size[0])))
+            jump_btn.bind(on_press=lambda btn, index=index: self.jump_to_section(index))
+            self.jump_bar.add_widget(jump_btn)
+    
+    def toggle_sort_mode(self, instance):
+        """Switch between category sections and A–Z sections"""
+        self.sort_mode = 'name' if self.sort_mode == 'category' else 'category'
+        self.show_sections()
+    
+    def _scrollable_height(self):
+        return self.content_height - self.symbols_view.height
+    
+    def jump_to_section(self, index):
+        """Scroll so that section index is at the top of the list"""
+        scrollable = self._scrollable_height()
+        if scrollable > 0:
+            self.symbols_view.scroll_y = max(0, 1 - self.section_offsets[index] / scrollable)
+        self.sticky_header.text = self.section_titles[index]
+    
+    def _update_sticky_header(self, instance, scroll_y):
+        """Show the title of the section at the top of the list"""
+        if not self.section_offsets:
+            return
+        top = max(0, (1 - scroll_y) * self._scrollable_height())
+        index = max(0, bisect_right(self.section_offsets, top) - 1)
+        self.sticky_header.text = self.section_titles[index]
 
 
 class ResistorColorCodeTab(BoxLayout):
@@ -257,476 +483,351 @@ class ResistorColorCodeTab(BoxLayout):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
-        self.padding = dp(20)
-        self.spacing = dp(15)
+        self.padding = PADDING
+        self.spacing = SPACING
         self.create_resistor_view()
     
     def create_resistor_view(self):
         """Create resistor color code interface"""
+        from kivy.uix.spinner import Spinner
         # Title
-        title = Label(
+        title = theme.style(Label(
             text="Farebný kód rezistorov",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='20sp',
+            font_size=FONT_TITLE,
             bold=True,
             size_hint_y=None,
-            height=dp(40)
-        )
+            height=TITLE_HEIGHT
+        ), color='accent')
         self.add_widget(title)
         
-        # Color options
-        colors = {
-            'Čierna': {'value': 0, 'hex': '#000000'},
-            'Hnedá': {'value': 1, 'hex': '#8B4513'},
-            'Červená': {'value': 2, 'hex': '#FF0000'},
-            'Oranžová': {'value': 3, 'hex': '#FFA500'},
-            'Žltá': {'value': 4, 'hex': '#FFFF00'},
-            'Zelená': {'value': 5, 'hex': '#008000'},
-            'Modrá': {'value': 6, 'hex': '#0000FF'},
-            'Fialová': {'value': 7, 'hex': '#8B008B'},
-            'Sivá': {'value': 8, 'hex': '#808080'},
-            'Biela': {'value': 9, 'hex': '#FFFFFF'}
-        }
-        
-        tolerance_colors = {
-            'Hnedá': 1, 'Červená': 2, 'Zelená': 0.5, 'Modrá': 0.25,
-            'Fialová': 0.1, 'Sivá': 0.05, 'Zlatá': 5, 'Strieborná': 10
-        }
+        # Color options of the active table edition
+        colors = tables.active().resistor_colors
+        tolerance_colors = tables.active().tolerance_colors
         
         # Color selection layout
         color_layout = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(200))
         
         # First digit
-        color_layout.add_widget(Label(text="1. číslica:", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.first_digit = Spinner(
+        color_layout.add_widget(theme.style(Label(text="1. číslica:", font_size=FONT_SMALL), color='text'))
+        self.first_digit = theme.style(Spinner(
             text='Čierna',
-            values=list(colors.keys()),
-            background_color=get_color_from_hex('#2d2d2d'),
-            color=get_color_from_hex('#ffffff')
-        )
+            values=list(colors.keys())
+        ), background_color='surface', color='text')
         color_layout.add_widget(self.first_digit)
         
         # Second digit
-        color_layout.add_widget(Label(text="2. číslica:", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.second_digit = Spinner(
+        color_layout.add_widget(theme.style(Label(text="2. číslica:", font_size=FONT_SMALL), color='text'))
+        self.second_digit = theme.style(Spinner(
             text='Čierna',
-            values=list(colors.keys()),
-            background_color=get_color_from_hex('#2d2d2d'),
-            color=get_color_from_hex('#ffffff')
-        )
+            values=list(colors.keys())
+        ), background_color='surface', color='text')
         color_layout.add_widget(self.second_digit)
         
         # Multiplier
-        color_layout.add_widget(Label(text="Násobiteľ:", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.multiplier = Spinner(
+        color_layout.add_widget(theme.style(Label(text="Násobiteľ:", font_size=FONT_SMALL), color='text'))
+        self.multiplier = theme.style(Spinner(
             text='Čierna',
-            values=list(colors.keys()),
-            background_color=get_color_from_hex('#2d2d2d'),
-            color=get_color_from_hex('#ffffff')
-        )
+            values=list(colors.keys())
+        ), background_color='surface', color='text')
         color_layout.add_widget(self.multiplier)
         
         # Tolerance
-        color_layout.add_widget(Label(text="Tolerancia:", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.tolerance = Spinner(
+        color_layout.add_widget(theme.style(Label(text="Tolerancia:", font_size=FONT_SMALL), color='text'))
+        self.tolerance = theme.style(Spinner(
             text='Zlatá',
-            values=list(tolerance_colors.keys()),
-            background_color=get_color_from_hex('#2d2d2d'),
-            color=get_color_from_hex('#ffffff')
-        )
+            values=list(tolerance_colors.keys())
+        ), background_color='surface', color='text')
         color_layout.add_widget(self.tolerance)
         
         self.add_widget(color_layout)
         
         # Calculate button
-        calc_btn = Button(
+        calc_btn = theme.style(Button(
             text="Vypočítať hodnotu",
             size_hint_y=None,
-            height=dp(50),
-            background_color=get_color_from_hex('#ff8c00'),
-            color=get_color_from_hex('#1a1a1a'),
-            font_size='16sp',
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
             bold=True
-        )
+        ), background_color='accent', color='on_accent')
         calc_btn.bind(on_press=self.calculate_resistor)
         self.add_widget(calc_btn)
         
         # Result
-        self.resistor_result = Label(
+        self.resistor_result = theme.style(Label(
             text="Vyberte farby a stlačte vypočítať",
-            color=get_color_from_hex('#ffffff'),
-            font_size='18sp',
+            font_size=FONT_LARGE,
             size_hint_y=None,
             height=dp(80),
             text_size=(None, None),
             halign='center'
-        )
+        ), color='text')
         self.resistor_result.bind(size=self.resistor_result.setter('text_size'))
         self.add_widget(self.resistor_result)
         
         # Quick reference
-        ref_title = Label(
+        ref_title = theme.style(Label(
             text="Rýchly prehľad farieb:",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='16sp',
+            font_size=FONT_BODY,
             bold=True,
             size_hint_y=None,
             height=dp(30)
-        )
+        ), color='accent')
         self.add_widget(ref_title)
         
-        ref_text = """Čierna=0, Hnedá=1, Červená=2, Oranžová=3, Žltá=4
-Zelená=5, Modrá=6, Fialová=7, Sivá=8, Biela=9
-Tolerancia: Zlatá=±5%, Strieborná=±10%"""
-        
-        ref_label = Label(
-            text=ref_text,
-            color=get_color_from_hex('#ffffff'),
-            font_size='12sp',
-            text_size=(None, None),
+        self.ref_label = theme.style(StaticText(
+            font_size=FONT_NOTE,
             halign='left'
-        )
-        ref_label.bind(size=ref_label.setter('text_size'))
-        self.add_widget(ref_label)
+        ), color='text')
+        self.add_widget(self.ref_label)
         
-        # Store color values for calculation
-        self.colors = colors
-        self.tolerance_colors = tolerance_colors
+        self.use_tables(tables.active())
+        tables.on_change(self.use_tables)
+    
+    def use_tables(self, active):
+        """Show the colours of a table edition"""
+        self.colors = active.resistor_colors
+        self.tolerance_colors = active.tolerance_colors
+        for spinner in (self.first_digit, self.second_digit, self.multiplier):
+            spinner.values = list(self.colors)
+        self.tolerance.values = list(self.tolerance_colors)
+        
+        digits = [f"{name}={color['value']}" for name, color in self.colors.items()]
+        tolerances = [f"{name}=±{tolerance}%" for name, tolerance in self.tolerance_colors.items()]
+        # Five digits and four tolerances per line
+        lines = [", ".join(digits[i:i + 5]) for i in range(0, len(digits), 5)]
+        tolerance_lines = [", ".join(tolerances[i:i + 4]) for i in range(0, len(tolerances), 4)]
+        tolerance_lines[0] = "Tolerancia: " + tolerance_lines[0]
+        self.ref_label.text = "\n".join(lines + tolerance_lines)
     
     def calculate_resistor(self, instance):
         """Calculate resistor value from colors"""
-        try:
-            first = self.colors[self.first_digit.text]['value']
-            second = self.colors[self.second_digit.text]['value']
-            mult = self.colors[self.multiplier.text]['value']
-            tol = self.tolerance_colors[self.tolerance.text]
-            
-            # Calculate resistance value
-            resistance = (first * 10 + second) * (10 ** mult)
-            
-            # Format result
-            if resistance >= 1000000:
-                formatted = f"{resistance/1000000:.1f} MΩ"
-            elif resistance >= 1000:
-                formatted = f"{resistance/1000:.1f} kΩ"
-            else:
-                formatted = f"{resistance:.0f} Ω"
-            
-            self.resistor_result.text = f"Hodnota: {formatted}\nTolerancia: ±{tol}%"
-            
-        except Exception as e:
-            self.resistor_result.text = f"Chyba: {str(e)}"
+        result = resistor_result(self.first_digit.text, self.second_digit.text, self.multiplier.text)
+        tol = self.tolerance_colors.get(self.tolerance.text)
+        if result.error is not None or tol is None:
+            self.resistor_result.text = ERROR_TEXTS[result.error or ERROR_UNKNOWN]
+            return
+        
+        # Format result
+        formatted = format_resistance(result.value)
+        
+        self.resistor_result.text = f"Hodnota: {formatted}\nTolerancia: ±{tol}%"
+        record_calculation(
+            'resistor',
+            f"{self.first_digit.text}, {self.second_digit.text}, {self.multiplier.text}, {self.tolerance.text}",
+            self.resistor_result.text
+        )
 
 
-class PowerCalculatorTab(BoxLayout):
+class PowerCalculatorTab(LiveRecalculation, BoxLayout):
     """Tab for power and current calculations at different voltages"""
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
-        self.padding = dp(20)
-        self.spacing = dp(15)
+        self.padding = PADDING
+        self.spacing = SPACING
         self.create_power_view()
     
     def create_power_view(self):
         """Create power calculator interface"""
         # Title
-        title = Label(
+        title = theme.style(Label(
             text="Výpočet výkonu a prúdu",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='20sp',
+            font_size=FONT_TITLE,
             bold=True,
             size_hint_y=None,
-            height=dp(40)
-        )
+            height=TITLE_HEIGHT
+        ), color='accent')
         self.add_widget(title)
         
         # Input section
         input_layout = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(100))
         
-        input_layout.add_widget(Label(text="Výkon (W):", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.power_input = TextInput(
+        input_layout.add_widget(theme.style(Label(text="Výkon (W):", font_size=FONT_SMALL), color='text'))
+        self.power_input = theme.style(TextInput(
             hint_text="Zadajte výkon v W",
             multiline=False,
-            font_size='16sp',
-            background_color=get_color_from_hex('#2d2d2d'),
-            foreground_color=get_color_from_hex('#ffffff')
-        )
+            font_size=FONT_BODY
+        ), background_color='surface', foreground_color='text')
         input_layout.add_widget(self.power_input)
         
-        input_layout.add_widget(Label(text="Napätie (V):", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.voltage_calc_input = TextInput(
+        input_layout.add_widget(theme.style(Label(text="Napätie (V):", font_size=FONT_SMALL), color='text'))
+        self.voltage_calc_input = theme.style(TextInput(
             hint_text="Napríklad: 230",
             multiline=False,
-            font_size='16sp',
-            background_color=get_color_from_hex('#2d2d2d'),
-            foreground_color=get_color_from_hex('#ffffff')
-        )
+            font_size=FONT_BODY
+        ), background_color='surface', foreground_color='text')
         input_layout.add_widget(self.voltage_calc_input)
         
         self.add_widget(input_layout)
         
         # Calculate button
-        calc_btn = Button(
+        calc_btn = theme.style(Button(
             text="Vypočítať prúd",
             size_hint_y=None,
-            height=dp(50),
-            background_color=get_color_from_hex('#ff8c00'),
-            color=get_color_from_hex('#1a1a1a'),
-            font_size='16sp',
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
             bold=True
-        )
+        ), background_color='accent', color='on_accent')
         calc_btn.bind(on_press=self.calculate_current)
         self.add_widget(calc_btn)
         
         # Multi-voltage button
-        multi_btn = Button(
+        multi_btn = theme.style(Button(
             text="Tabuľka pre bežné napätia",
             size_hint_y=None,
-            height=dp(50),
-            background_color=get_color_from_hex('#666666'),
-            color=get_color_from_hex('#ffffff'),
-            font_size='14sp'
-        )
+            height=BUTTON_HEIGHT,
+            font_size=FONT_SMALL
+        ), background_color='muted', color='text')
         multi_btn.bind(on_press=self.show_voltage_table)
         self.add_widget(multi_btn)
         
         # Result
-        self.power_result = Label(
+        self.power_result = theme.style(Label(
             text="Zadajte výkon a napätie pre výpočet prúdu",
-            color=get_color_from_hex('#ffffff'),
-            font_size='16sp',
+            font_size=FONT_BODY,
             text_size=(None, None),
             halign='center'
-        )
+        ), color='text')
         self.power_result.bind(size=self.power_result.setter('text_size'))
         self.add_widget(self.power_result)
+        
+        self.bind_live_inputs(self.power_result, self.power_input, self.voltage_calc_input)
     
     def calculate_current(self, instance):
         """Calculate current from power and voltage"""
-        try:
-            power = float(self.power_input.text)
-            voltage = float(self.voltage_calc_input.text)
-            
-            if voltage == 0:
-                self.power_result.text = "Chyba: Napätie nemôže byť nula!"
-                return
-            
-            current = power / voltage
-            
-            # Format current
-            if current >= 1:
-                current_str = f"{current:.2f} A"
-            else:
-                current_str = f"{current*1000:.0f} mA"
-            
-            self.power_result.text = f"Pre {power} W pri {voltage} V:\nPrúd = {current_str}"
-            
-        except ValueError:
-            self.power_result.text = "Chyba: Zadajte platné číselné hodnoty!"
-        except Exception as e:
-            self.power_result.text = f"Chyba: {str(e)}"
+        power = parse_quantity(self.power_input.text, 'W')
+        voltage = parse_quantity(self.voltage_calc_input.text, 'V')
+        
+        self.power_result.text = self.current_text(power, voltage)
+        if current_result(power, voltage).error is None:
+            record_calculation('power', f"{power} W, {voltage} V", self.power_result.text)
     
     def show_voltage_table(self, instance):
         """Show table for common voltages"""
-        try:
-            power = float(self.power_input.text)
-            
-            voltages = [12, 24, 110, 230, 400]
-            results = []
-            
-            for voltage in voltages:
-                current = power / voltage
-                if current >= 1:
-                    current_str = f"{current:.2f} A"
-                else:
-                    current_str = f"{current*1000:.0f} mA"
-                results.append(f"{voltage}V >> {current_str}")
-            
-            self.power_result.text = f"Pre {power} W:\n" + "\n".join(results)
-            
-        except ValueError:
+        power = parse_quantity(self.power_input.text, 'W')
+        if power is None:
             self.power_result.text = "Najprv zadajte výkon v W!"
-        except Exception as e:
-            self.power_result.text = f"Chyba: {str(e)}"
+            return
+        
+        self.power_result.text = self.voltage_table_text(power)
+        record_calculation('power', f"{power} W", self.power_result.text)
+    
+    def current_text(self, power, voltage):
+        """Result text for current at one voltage, or the error"""
+        result = current_result(power, voltage)
+        if result.error is not None:
+            return ERROR_TEXTS[result.error]
+        return f"Pre {power} W pri {voltage} V:\nPrúd = {format_current(result.value)}"
+    
+    def voltage_table_text(self, power):
+        """Result text for currents at common voltages"""
+        results = []
+        
+        three_phase_voltages = tables.active().three_phase_voltages
+        for voltage, current in voltage_table(power):
+            # Three-phase supplies draw P / (√3 U)
+            phases = " (3f)" if voltage in three_phase_voltages else ""
+            results.append(f"{voltage}V{phases} >> {format_current(current)}")
+        
+        return f"Pre {power} W:\n" + "\n".join(results)
+    
+    def live_inputs(self):
+        return parse_quantity(self.power_input.text, 'W'), parse_quantity(self.voltage_calc_input.text, 'V')
+    
+    def live_result(self, inputs):
+        """Current while typing, or the voltage table until a voltage is entered"""
+        power, voltage = inputs
+        if power is None:
+            return "Zadajte výkon a napätie pre výpočet prúdu"
+        if voltage is None:
+            return self.voltage_table_text(power)
+        return self.current_text(power, voltage)
 
 
-class WireTableTab(BoxLayout):
+class WireTableTab(LiveRecalculation, BoxLayout):
     """Tab for wire ampacity table"""
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
-        self.padding = dp(20)
-        self.spacing = dp(15)
+        self.padding = PADDING
+        self.spacing = SPACING
         self.create_wire_view()
     
     def create_wire_view(self):
         """Create wire ampacity table interface"""
+        from kivy.uix.spinner import Spinner
         # Title
-        title = Label(
+        title = theme.style(Label(
             text="Tabuľka istenia vodičov",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='20sp',
+            font_size=FONT_TITLE,
             bold=True,
             size_hint_y=None,
-            height=dp(40)
-        )
+            height=TITLE_HEIGHT
+        ), color='accent')
         self.add_widget(title)
         
         # Subtitle
-        subtitle = Label(
+        subtitle = theme.style(Label(
             text="Maximálny dovolený prúd pre Cu vodiče (30°C)",
-            color=get_color_from_hex('#ffffff'),
-            font_size='14sp',
+            font_size=FONT_SMALL,
             size_hint_y=None,
             height=dp(30)
-        )
+        ), color='text')
         self.add_widget(subtitle)
         
-        # Wire data
-        wire_data = [
-            ("1.5", "16", "19"),
-            ("2.5", "25", "27"),
-            ("4", "35", "38"),
-            ("6", "46", "50"),
-            ("10", "63", "69"),
-            ("16", "85", "92"),
-            ("25", "112", "119"),
-            ("35", "138", "147"),
-            ("50", "171", "179"),
-            ("70", "218", "229"),
-            ("95", "266", "278"),
-            ("120", "309", "321"),
-            ("150", "357", "370"),
-            ("185", "415", "430"),
-            ("240", "488", "504"),
-            ("300", "566", "583")
-        ]
+        # Wire data of the active table edition
+        wire_data = tables.active().wire_rows
         
         # ScrollView for table
-        scroll = ScrollView(
+        scroll = theme.style(ScrollView(
             do_scroll_x=False,
             do_scroll_y=True,
-            bar_width=dp(8),
-            bar_color=get_color_from_hex('#ff8c00')
-        )
+            bar_width=dp(8)
+        ), bar_color='accent')
         
-        # Table layout
-        table_layout = BoxLayout(
-            orientation='vertical',
-            spacing=dp(2),
-            size_hint_y=None,
-            padding=[dp(5), dp(5), dp(5), dp(5)]
-        )
-        table_layout.bind(minimum_height=table_layout.setter('height'))
-        
-        # Header
-        header = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40))
-        header.add_widget(Label(
-            text="Prierez\n[mm²]",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='14sp',
-            bold=True,
-            text_size=(None, None),
-            halign='center'
-        ))
-        header.add_widget(Label(
-            text="V zemi\n[A]",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='14sp',
-            bold=True,
-            text_size=(None, None),
-            halign='center'
-        ))
-        header.add_widget(Label(
-            text="Vo vzduchu\n[A]",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='14sp',
-            bold=True,
-            text_size=(None, None),
-            halign='center'
-        ))
-        table_layout.add_widget(header)
+        # Whole table is drawn by one widget, rows are selected by tapping
+        self.wire_table = theme.style(TableView(
+            columns=["Prierez\n[mm²]", "V zemi\n[A]", "Vo vzduchu\n[A]"],
+            rows=wire_data
+        ), header_color='accent', text_color='text', stripe_colors=('surface', 'surface_alt'))
+        self.wire_table.bind(on_row_select=self.show_wire_row)
         
-        # Table rows
-        for i, (cross_section, ground_current, air_current) in enumerate(wire_data):
-            row_color = '#2d2d2d' if i % 2 == 0 else '#252525'
-            row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(35))
-            
-            with row.canvas.before:
-                from kivy.graphics import Color, Rectangle
-                Color(*get_color_from_hex(row_color))
-                row.rect = Rectangle(size=row.size, pos=row.pos)
-            
-            def update_rect(instance, value):
-                instance.rect.pos = instance.pos
-                instance.rect.size = instance.size
-            
-            row.bind(size=update_rect, pos=update_rect)
-            
-            row.add_widget(Label(
-                text=cross_section,
-                color=get_color_from_hex('#ffffff'),
-                font_size='14sp',
-                halign='center'
-            ))
-            row.add_widget(Label(
-                text=ground_current,
-                color=get_color_from_hex('#ffffff'),
-                font_size='14sp',
-                halign='center'
-            ))
-            row.add_widget(Label(
-                text=air_current,
-                color=get_color_from_hex('#ffffff'),
-                font_size='14sp',
-                halign='center'
-            ))
-            
-            table_layout.add_widget(row)
-        
-        scroll.add_widget(table_layout)
+        scroll.add_widget(self.wire_table)
         self.add_widget(scroll)
         
         # Calculator section
-        calc_title = Label(
+        calc_title = theme.style(Label(
             text="Výber vodiča:",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='16sp',
+            font_size=FONT_BODY,
             bold=True,
             size_hint_y=None,
             height=dp(30)
-        )
+        ), color='accent')
         self.add_widget(calc_title)
         
-        calc_layout = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=dp(50))
+        calc_layout = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=BUTTON_HEIGHT)
         
-        self.current_input = TextInput(
+        self.current_input = theme.style(TextInput(
             hint_text="Prúd (A)",
             multiline=False,
-            font_size='16sp',
-            background_color=get_color_from_hex('#2d2d2d'),
-            foreground_color=get_color_from_hex('#ffffff'),
+            font_size=FONT_BODY,
             size_hint_x=0.4
-        )
+        ), background_color='surface', foreground_color='text')
         
-        self.installation_type = Spinner(
-            text='Vo vzduchu',
-            values=['Vo vzduchu', 'V zemi'],
-            size_hint_x=0.4,
-            background_color=get_color_from_hex('#2d2d2d'),
-            color=get_color_from_hex('#ffffff')
-        )
+        self.installation_type = theme.style(Spinner(
+            text=INSTALLATION_AIR,
+            values=[INSTALLATION_AIR, INSTALLATION_GROUND],
+            size_hint_x=0.4
+        ), background_color='surface', color='text')
         
-        find_btn = Button(
+        find_btn = theme.style(Button(
             text="Nájsť",
             size_hint_x=0.2,
-            background_color=get_color_from_hex('#ff8c00'),
-            color=get_color_from_hex('#1a1a1a'),
-            font_size='14sp',
+            font_size=FONT_SMALL,
             bold=True
-        )
+        ), background_color='accent', color='on_accent')
         find_btn.bind(on_press=self.find_wire)
         
         calc_layout.add_widget(self.current_input)
@@ -735,106 +836,119 @@ class WireTableTab(BoxLayout):
         self.add_widget(calc_layout)
         
         # Wire recommendation result
-        self.wire_result = Label(
+        self.wire_result = theme.style(Label(
             text="Zadajte prúd pre odporúčanie vodiča",
-            color=get_color_from_hex('#ffffff'),
-            font_size='16sp',
+            font_size=FONT_BODY,
             size_hint_y=None,
             height=dp(60),
             text_size=(None, None),
             halign='center'
-        )
+        ), color='text')
         self.wire_result.bind(size=self.wire_result.setter('text_size'))
         self.add_widget(self.wire_result)
         
         # Store wire data for lookup
         self.wire_data = wire_data
+        tables.on_change(self.use_tables)
+        
+        self.bind_live_inputs(self.wire_result, self.current_input, self.installation_type)
+    
+    def use_tables(self, active):
+        """Show the wire table of a table edition"""
+        self.wire_data = active.wire_rows
+        self.wire_table.rows = list(active.wire_rows)
+        # Same inputs, new table: force the recalculation
+        self._live_inputs = None
+        self._restart_live_trigger()
     
     def find_wire(self, instance):
         """Find appropriate wire for given current"""
-        try:
-            required_current = float(self.current_input.text)
-            installation = self.installation_type.text
-            
-            # Determine which column to use (1=ground, 2=air)
-            current_index = 1 if installation == 'V zemi' else 2
-            
-            recommended_wire = None
-            for cross_section, ground_current, air_current in self.wire_data:
-                max_current = float(ground_current) if current_index == 1 else float(air_current)
-                if max_current >= required_current:
-                    recommended_wire = cross_section
-                    break
-            
-            if recommended_wire:
-                self.wire_result.text = f"Pre prúd {required_current} A ({installation}):\nOdporúčaný prierez: {recommended_wire} mm²"
-            else:
-                self.wire_result.text = f"Pre prúd {required_current} A je potrebný\nvodič s priereezom > 300 mm²"
-                
-        except ValueError:
+        required_current = parse_quantity(self.current_input.text, 'A')
+        installation = self.installation_type.text
+        if required_current is None:
             self.wire_result.text = "Chyba: Zadajte platný prúd v A!"
-        except Exception as e:
-            self.wire_result.text = f"Chyba: {str(e)}"
+            return
+        
+        self.wire_result.text = self.wire_text(required_current, installation)
+        record_calculation('wire', f"{required_current} A, {installation}", self.wire_result.text)
+    
+    def show_wire_row(self, instance, index):
+        """Show the ampacity of a tapped table row"""
+        cross_section, ground_current, air_current = self.wire_data[index]
+        self.wire_result.text = (f"Prierez {cross_section} mm²:\n"
+                                 f"V zemi {ground_current} A, vo vzduchu {air_current} A")
+    
+    def wire_text(self, required_current, installation):
+        """Result text with the recommended cross section"""
+        result = wire_result(required_current, installation)
+        
+        if result.error is None:
+            return f"Pre prúd {required_current} A ({installation}):\nOdporúčaný prierez: {result.value} mm²"
+        if result.error == ERROR_RANGE:
+            return f"Pre prúd {required_current} A je potrebný\nvodič s priereezom > {self.wire_data[-1][0]} mm²"
+        return ERROR_TEXTS[result.error]
+    
+    def live_inputs(self):
+        return parse_quantity(self.current_input.text, 'A'), self.installation_type.text
+    
+    def live_result(self, inputs):
+        required_current, installation = inputs
+        if required_current is None:
+            return "Zadajte prúd pre odporúčanie vodiča"
+        return self.wire_text(required_current, installation)
 
 
-class UnitConverterTab(BoxLayout):
+class UnitConverterTab(LiveRecalculation, BoxLayout):
     """Tab for unit conversion"""
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
-        self.padding = dp(20)
-        self.spacing = dp(15)
+        self.padding = PADDING
+        self.spacing = SPACING
         self.create_converter_view()
     
     def create_converter_view(self):
         """Create unit converter interface"""
+        from kivy.uix.spinner import Spinner
         # Title
-        title = Label(
+        title = theme.style(Label(
             text="Prevodník elektrických jednotiek",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='20sp',
+            font_size=FONT_TITLE,
             bold=True,
             size_hint_y=None,
-            height=dp(40)
-        )
+            height=TITLE_HEIGHT
+        ), color='accent')
         self.add_widget(title)
         
         # Input section
-        input_layout = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=dp(50))
+        input_layout = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=BUTTON_HEIGHT)
         
-        self.input_value = TextInput(
+        self.input_value = theme.style(TextInput(
             hint_text="Zadajte hodnotu",
             multiline=False,
-            font_size='16sp',
-            background_color=get_color_from_hex('#2d2d2d'),
-            foreground_color=get_color_from_hex('#ffffff'),
+            font_size=FONT_BODY,
             size_hint_x=0.4
-        )
+        ), background_color='surface', foreground_color='text')
         
-        self.from_unit = Spinner(
+        self.from_unit = theme.style(Spinner(
             text='V',
-            values=['V', 'kV', 'mV', 'A', 'mA', 'kA', 'W', 'kW', 'MW', 'Ω', 'kΩ', 'MΩ', 'Hz', 'kHz', 'MHz'],
-            size_hint_x=0.25,
-            background_color=get_color_from_hex('#2d2d2d'),
-            color=get_color_from_hex('#ffffff')
-        )
+            values=UNITS,
+            size_hint_x=0.25
+        ), background_color='surface', color='text')
         
-        arrow_label = Label(
+        arrow_label = theme.style(Label(
             text=">>", 
-            color=get_color_from_hex('#ff8c00'), 
-            font_size='20sp', 
+            font_size=FONT_TITLE, 
             bold=True,
             size_hint_x=0.1
-        )
+        ), color='accent')
         
-        self.to_unit = Spinner(
+        self.to_unit = theme.style(Spinner(
             text='mV',
-            values=['V', 'kV', 'mV', 'A', 'mA', 'kA', 'W', 'kW', 'MW', 'Ω', 'kΩ', 'MΩ', 'Hz', 'kHz', 'MHz'],
-            size_hint_x=0.25,
-            background_color=get_color_from_hex('#2d2d2d'),
-            color=get_color_from_hex('#ffffff')
-        )
+            values=UNITS,
+            size_hint_x=0.25
+        ), background_color='surface', color='text')
         
         input_layout.add_widget(self.input_value)
         input_layout.add_widget(self.from_unit)
@@ -843,87 +957,77 @@ class UnitConverterTab(BoxLayout):
         self.add_widget(input_layout)
         
         # Convert button
-        convert_btn = Button(
+        convert_btn = theme.style(Button(
             text="Previesť",
             size_hint_y=None,
-            height=dp(50),
-            background_color=get_color_from_hex('#ff8c00'),
-            color=get_color_from_hex('#1a1a1a'),
-            font_size='16sp',
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
             bold=True
-        )
+        ), background_color='accent', color='on_accent')
         convert_btn.bind(on_press=self.convert_units)
         self.add_widget(convert_btn)
         
         # Result
-        self.result_label = Label(
+        self.result_label = theme.style(Label(
             text="Výsledok sa zobrazí tu",
-            color=get_color_from_hex('#ffffff'),
-            font_size='18sp',
+            font_size=FONT_LARGE,
             size_hint_y=None,
             height=dp(60)
-        )
+        ), color='text')
         self.add_widget(self.result_label)
         
         # Add conversion table
         self.add_conversion_table()
+        
+        self.bind_live_inputs(self.result_label, self.input_value, self.from_unit, self.to_unit)
     
     def convert_units(self, instance):
         """Convert between units"""
-        try:
-            value = float(self.input_value.text)
-            from_unit = self.from_unit.text
-            to_unit = self.to_unit.text
-            
-            # Conversion factors to base units
-            conversions = {
-                'V': 1, 'kV': 1000, 'mV': 0.001,
-                'A': 1, 'mA': 0.001, 'kA': 1000,
-                'W': 1, 'kW': 1000, 'MW': 1000000,
-                'Ω': 1, 'kΩ': 1000, 'MΩ': 1000000,
-                'Hz': 1, 'kHz': 1000, 'MHz': 1000000
-            }
-            
-            # Check if units are compatible
-            voltage_units = ['V', 'kV', 'mV']
-            current_units = ['A', 'mA', 'kA']
-            power_units = ['W', 'kW', 'MW']
-            resistance_units = ['Ω', 'kΩ', 'MΩ']
-            frequency_units = ['Hz', 'kHz', 'MHz']
-            
-            unit_groups = [voltage_units, current_units, power_units, resistance_units, frequency_units]
-            
-            compatible = False
-            for group in unit_groups:
-                if from_unit in group and to_unit in group:
-                    compatible = True
-                    break
-            
-            if not compatible:
-                self.result_label.text = "Chyba: Nekompatibilné jednotky!"
-                return
-            
-            # Convert
-            base_value = value * conversions[from_unit]
-            result = base_value / conversions[to_unit]
-            
-            self.result_label.text = f"{value} {from_unit} = {result:.6g} {to_unit}"
-            
-        except ValueError:
+        value = self.input_quantity()
+        from_unit = self.from_unit.text
+        to_unit = self.to_unit.text
+        if value is None:
             self.result_label.text = "Chyba: Zadajte platnú číselnou hodnotu!"
-        except Exception as e:
-            self.result_label.text = f"Chyba: {str(e)}"
+            return
+        
+        result = conversion_result(value, from_unit, to_unit)
+        if result.error is not None:
+            self.result_label.text = ERROR_TEXTS[result.error]
+            return
+        
+        self.result_label.text = self.conversion_text(value, from_unit, to_unit, result.value)
+        record_calculation('converter', f"{value} {from_unit} >> {to_unit}", self.result_label.text)
+    
+    def input_quantity(self):
+        """Typed value in the selected unit, None if it isn't a valid number"""
+        # "5" is 5 kV when kV is selected, "5 V" is 0.005 kV
+        value = parse_quantity(self.input_value.text, self.from_unit.text)
+        return None if value is None else value / UNIT_FACTORS[self.from_unit.text]
+    
+    def conversion_text(self, value, from_unit, to_unit, result):
+        return f"{value} {from_unit} = {result:.6g} {to_unit}"
+    
+    def live_inputs(self):
+        return self.input_quantity(), self.from_unit.text, self.to_unit.text
+    
+    def live_result(self, inputs):
+        value, from_unit, to_unit = inputs
+        if value is None:
+            return "Výsledok sa zobrazí tu"
+        result = conversion_result(value, from_unit, to_unit)
+        if result.error is not None:
+            return ERROR_TEXTS[result.error]
+        return self.conversion_text(value, from_unit, to_unit, result.value)
     
     def add_conversion_table(self):
         """Add quick conversion reference table"""
-        table_title = Label(
+        table_title = theme.style(Label(
             text="Rýchly prehľad prevodov:",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='16sp',
+            font_size=FONT_BODY,
             bold=True,
             size_hint_y=None,
             height=dp(30)
-        )
+        ), color='accent')
         self.add_widget(table_title)
         
         conversions_text = """1 kV = 1000 V = 1,000,000 mV
@@ -932,227 +1036,188 @@ class UnitConverterTab(BoxLayout):
 1 MΩ = 1000 kΩ = 1,000,000 Ω
 1 MHz = 1000 kHz = 1,000,000 Hz"""
         
-        table_label = Label(
+        table_label = theme.style(StaticText(
             text=conversions_text,
-            color=get_color_from_hex('#ffffff'),
-            font_size='12sp',
-            text_size=(None, None),
+            font_size=FONT_NOTE,
             halign='left'
-        )
-        table_label.bind(size=table_label.setter('text_size'))
+        ), color='text')
         self.add_widget(table_label)
 
 
-class OhmsLawTab(BoxLayout):
+class OhmsLawTab(LiveRecalculation, BoxLayout):
     """Tab for Ohm's law calculations"""
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
-        self.padding = dp(20)
-        self.spacing = dp(15)
+        self.padding = PADDING
+        self.spacing = SPACING
         self.create_ohms_law_view()
     
     def create_ohms_law_view(self):
         """Create Ohm's law calculator interface"""
         # Title
-        title = Label(
+        title = theme.style(Label(
             text="Ohmov zákon - Kalkulátor",
-            color=get_color_from_hex('#ff8c00'),
-            font_size='20sp',
+            font_size=FONT_TITLE,
             bold=True,
             size_hint_y=None,
-            height=dp(40)
-        )
+            height=TITLE_HEIGHT
+        ), color='accent')
         self.add_widget(title)
         
         # Formula display
-        formula_label = Label(
+        formula_label = theme.style(Label(
             text="U = I × R    |    P = U × I    |    P = I² × R    |    P = U² / R",
-            color=get_color_from_hex('#ffffff'),
-            font_size='14sp',
+            font_size=FONT_SMALL,
             size_hint_y=None,
             height=dp(30)
-        )
+        ), color='text')
         self.add_widget(formula_label)
         
         # Input fields
         inputs_layout = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(200))
         
         # Voltage input
-        inputs_layout.add_widget(Label(text="Napätie (U) [V]:", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.voltage_input = TextInput(
+        inputs_layout.add_widget(theme.style(Label(text="Napätie (U) [V]:", font_size=FONT_SMALL), color='text'))
+        self.voltage_input = theme.style(TextInput(
             hint_text="V",
             multiline=False,
-            font_size='16sp',
-            background_color=get_color_from_hex('#2d2d2d'),
-            foreground_color=get_color_from_hex('#ffffff')
-        )
+            font_size=FONT_BODY
+        ), background_color='surface', foreground_color='text')
         inputs_layout.add_widget(self.voltage_input)
         
         # Current input
-        inputs_layout.add_widget(Label(text="Prúd (I) [A]:", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.current_input = TextInput(
+        inputs_layout.add_widget(theme.style(Label(text="Prúd (I) [A]:", font_size=FONT_SMALL), color='text'))
+        self.current_input = theme.style(TextInput(
             hint_text="A",
             multiline=False,
-            font_size='16sp',
-            background_color=get_color_from_hex('#2d2d2d'),
-            foreground_color=get_color_from_hex('#ffffff')
-        )
+            font_size=FONT_BODY
+        ), background_color='surface', foreground_color='text')
         inputs_layout.add_widget(self.current_input)
         
         # Resistance input
-        inputs_layout.add_widget(Label(text="Odpor (R) [Ω]:", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.resistance_input = TextInput(
+        inputs_layout.add_widget(theme.style(Label(text="Odpor (R) [Ω]:", font_size=FONT_SMALL), color='text'))
+        self.resistance_input = theme.style(TextInput(
             hint_text="Ω",
             multiline=False,
-            font_size='16sp',
-            background_color=get_color_from_hex('#2d2d2d'),
-            foreground_color=get_color_from_hex('#ffffff')
-        )
+            font_size=FONT_BODY
+        ), background_color='surface', foreground_color='text')
         inputs_layout.add_widget(self.resistance_input)
         
         # Power input
-        inputs_layout.add_widget(Label(text="Výkon (P) [W]:", color=get_color_from_hex('#ffffff'), font_size='14sp'))
-        self.power_input = TextInput(
+        inputs_layout.add_widget(theme.style(Label(text="Výkon (P) [W]:", font_size=FONT_SMALL), color='text'))
+        self.power_input = theme.style(TextInput(
             hint_text="W",
             multiline=False,
-            font_size='16sp',
-            background_color=get_color_from_hex('#2d2d2d'),
-            foreground_color=get_color_from_hex('#ffffff')
-        )
+            font_size=FONT_BODY
+        ), background_color='surface', foreground_color='text')
         inputs_layout.add_widget(self.power_input)
         
         self.add_widget(inputs_layout)
         
         # Calculate button
-        calc_btn = Button(
+        calc_btn = theme.style(Button(
             text="Vypočítať",
             size_hint_y=None,
-            height=dp(50),
-            background_color=get_color_from_hex('#ff8c00'),
-            color=get_color_from_hex('#1a1a1a'),
-            font_size='16sp',
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
             bold=True
-        )
+        ), background_color='accent', color='on_accent')
         calc_btn.bind(on_press=self.calculate_ohms_law)
         self.add_widget(calc_btn)
         
         # Clear button
-        clear_btn = Button(
+        clear_btn = theme.style(Button(
             text="Vymazať všetko",
             size_hint_y=None,
             height=dp(40),
-            background_color=get_color_from_hex('#666666'),
-            color=get_color_from_hex('#ffffff'),
-            font_size='14sp'
-        )
+            font_size=FONT_SMALL
+        ), background_color='muted', color='text')
         clear_btn.bind(on_press=self.clear_inputs)
         self.add_widget(clear_btn)
         
         # Results
-        self.results_label = Label(
+        self.results_label = theme.style(Label(
             text="Zadajte aspoň 2 hodnoty pre výpočet",
-            color=get_color_from_hex('#ffffff'),
-            font_size='16sp',
+            font_size=FONT_BODY,
             text_size=(None, None),
             halign='center'
-        )
+        ), color='text')
         self.results_label.bind(size=self.results_label.setter('text_size'))
         self.add_widget(self.results_label)
+        
+        # Live results only update the label, the inputs are filled by the button
+        self.bind_live_inputs(
+            self.results_label,
+            self.voltage_input, self.current_input, self.resistance_input, self.power_input
+        )
     
     def calculate_ohms_law(self, instance):
         """Calculate missing values using Ohm's law"""
-        try:
-            # Get input values
-            voltage = self.get_float_value(self.voltage_input.text)
-            current = self.get_float_value(self.current_input.text)
-            resistance = self.get_float_value(self.resistance_input.text)
-            power = self.get_float_value(self.power_input.text)
-            
-            values = [voltage, current, resistance, power]
-            known_count = sum(1 for v in values if v is not None)
-            
-            if known_count < 2:
-                self.results_label.text = "Chyba: Zadajte aspoň 2 hodnoty!"
-                return
-            
-            # --- Calculation Logic ---
-            calc_values = {'U': voltage, 'I': current, 'R': resistance, 'P': power}
-            
-            for _ in range(2): 
-                # U
-                if calc_values['U'] is None:
-                    if calc_values['I'] is not None and calc_values['R'] is not None:
-                        calc_values['U'] = calc_values['I'] * calc_values['R']
-                    elif calc_values['P'] is not None and calc_values['I'] is not None and calc_values['I'] != 0:
-                        calc_values['U'] = calc_values['P'] / calc_values['I']
-                    elif calc_values['P'] is not None and calc_values['R'] is not None and calc_values['P'] >= 0 and calc_values['R'] >= 0:
-                        calc_values['U'] = (calc_values['P'] * calc_values['R']) ** 0.5
-                
-                # I
-                if calc_values['I'] is None:
-                    if calc_values['U'] is not None and calc_values['R'] is not None and calc_values['R'] != 0:
-                        calc_values['I'] = calc_values['U'] / calc_values['R']
-                    elif calc_values['P'] is not None and calc_values['U'] is not None and calc_values['U'] != 0:
-                        calc_values['I'] = calc_values['P'] / calc_values['U']
-                    elif calc_values['P'] is not None and calc_values['R'] is not None and calc_values['P'] >= 0 and calc_values['R'] > 0:
-                        calc_values['I'] = (calc_values['P'] / calc_values['R']) ** 0.5
-
-                # R
-                if calc_values['R'] is None:
-                    if calc_values['U'] is not None and calc_values['I'] is not None and calc_values['I'] != 0:
-                        calc_values['R'] = calc_values['U'] / calc_values['I']
-                    elif calc_values['P'] is not None and calc_values['I'] is not None and calc_values['I'] != 0:
-                        calc_values['R'] = calc_values['P'] / (calc_values['I'] ** 2)
-                    elif calc_values['P'] is not None and calc_values['U'] is not None and calc_values['P'] != 0:
-                        calc_values['R'] = (calc_values['U'] ** 2) / calc_values['P']
-                
-                # P
-                if calc_values['P'] is None:
-                    if calc_values['U'] is not None and calc_values['I'] is not None:
-                        calc_values['P'] = calc_values['U'] * calc_values['I']
-                    elif calc_values['I'] is not None and calc_values['R'] is not None:
-                        calc_values['P'] = (calc_values['I'] ** 2) * calc_values['R']
-                    elif calc_values['U'] is not None and calc_values['R'] is not None and calc_values['R'] != 0:
-                        calc_values['P'] = (calc_values['U'] ** 2) / calc_values['R']
-
-            # --- Display Results ---
-            results_text = []
-            if calc_values['U'] is not None:
-                self.voltage_input.text = f"{calc_values['U']:.3g}"
-            if calc_values['I'] is not None:
-                self.current_input.text = f"{calc_values['I']:.3g}"
-            if calc_values['R'] is not None:
-                self.resistance_input.text = f"{calc_values['R']:.3g}"
-            if calc_values['P'] is not None:
-                self.power_input.text = f"{calc_values['P']:.3g}"
+        # Get input values
+        voltage = self.get_float_value(self.voltage_input.text, 'V')
+        current = self.get_float_value(self.current_input.text, 'A')
+        resistance = self.get_float_value(self.resistance_input.text, 'Ω')
+        power = self.get_float_value(self.power_input.text, 'W')
+        
+        result = ohms_law_result(voltage, current, resistance, power)
+        if result.error == ERROR_MISSING:
+            self.results_label.text = "Chyba: Zadajte aspoň 2 hodnoty!"
+            return
+        if result.value is None:
+            self.results_label.text = ERROR_TEXTS[result.error]
+            return
+        
+        # --- Display Results ---
+        # Values that could be derived are filled in even if some are missing
+        calc_values = result.value
+        if calc_values['U'] is not None:
+            self.voltage_input.text = f"{calc_values['U']:.3g}"
+        if calc_values['I'] is not None:
+            self.current_input.text = f"{calc_values['I']:.3g}"
+        if calc_values['R'] is not None:
+            self.resistance_input.text = f"{calc_values['R']:.3g}"
+        if calc_values['P'] is not None:
+            self.power_input.text = f"{calc_values['P']:.3g}"
+        # The rounded inputs mustn't replace the precise results below
+        self.keep_live_result()
 
-            # Update results label after filling inputs
-            final_known_count = sum(1 for v in calc_values.values() if v is not None)
-            if final_known_count == 4:
-                self.results_label.text = (f"Napätie: {calc_values['U']:.4g} V\n"
-                                           f"Prúd: {calc_values['I']:.4g} A\n"
-                                           f"Odpor: {calc_values['R']:.4g} Ω\n"
-                                           f"Výkon: {calc_values['P']:.4g} W")
-            else:
-                self.results_label.text = "Nemožno vypočítať všetky hodnoty.\nSkontrolujte zadané vstupy."
-
-        except (ValueError, TypeError):
-            self.results_label.text = "Chyba: Zadajte platné číselné hodnoty!"
-        except ZeroDivisionError:
-            self.results_label.text = "Chyba: Delenie nulou! Skontrolujte vstupy."
-        except Exception as e:
-            self.results_label.text = f"Nastala neočakávaná chyba: {str(e)}"
+        # Update results label after filling inputs
+        if result.error is None:
+            self.results_label.text = self.results_text(calc_values)
+            record_calculation(
+                'ohms_law',
+                ", ".join(f"{name}={value:g}" for name, value in
+                          zip(('U', 'I', 'R', 'P'), (voltage, current, resistance, power))
+                          if value is not None),
+                self.results_label.text
+            )
+        else:
+            self.results_label.text = ERROR_TEXTS[result.error]
 
-    def get_float_value(self, text):
+    def results_text(self, calc_values):
+        """Result text with all four values"""
+        return (f"Napätie: {calc_values['U']:.4g} V\n"
+                f"Prúd: {calc_values['I']:.4g} A\n"
+                f"Odpor: {calc_values['R']:.4g} Ω\n"
+                f"Výkon: {calc_values['P']:.4g} W")
+    
+    def live_inputs(self):
+        return (parse_quantity(self.voltage_input.text, 'V'), parse_quantity(self.current_input.text, 'A'),
+                parse_quantity(self.resistance_input.text, 'Ω'), parse_quantity(self.power_input.text, 'W'))
+    
+    def live_result(self, inputs):
+        result = ohms_law_result(*inputs)
+        if result.error == ERROR_MISSING:
+            return "Zadajte aspoň 2 hodnoty pre výpočet"
+        if result.error is not None:
+            return ERROR_TEXTS[result.error]
+        return self.results_text(result.value)
+    
+    def get_float_value(self, text, unit=None):
         """Convert text to float or return None"""
-        if not text or text.strip() == "":
-            return None
-        try:
-            return float(text.replace(',', '.'))
-        except ValueError:
-            return None
+        return parse_quantity(text, unit)
     
     def clear_inputs(self, instance):
         """Clear all input fields and results"""
@@ -1163,6 +1228,1110 @@ class OhmsLawTab(BoxLayout):
         self.results_label.text = "Zadajte aspoň 2 hodnoty pre výpočet"
 
 
+class ReactanceTab(LiveRecalculation, BoxLayout):
+    """Tab for reactance, impedance, time constant and resonance of R, L and C"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = PADDING
+        self.spacing = SPACING
+        self.create_reactance_view()
+    
+    def create_reactance_view(self):
+        """Create reactive component calculator interface"""
+        title = theme.style(Label(
+            text="Reaktancia a rezonancia",
+            font_size=FONT_TITLE,
+            bold=True,
+            size_hint_y=None,
+            height=TITLE_HEIGHT
+        ), color='accent')
+        self.add_widget(title)
+        
+        formula_label = theme.style(Label(
+            text="Xc = 1 / (2πfC)    |    Xl = 2πfL    |    f0 = 1 / (2π√(LC))",
+            font_size=FONT_SMALL,
+            size_hint_y=None,
+            height=dp(30)
+        ), color='text')
+        self.add_widget(formula_label)
+        
+        inputs_layout = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(200))
+        self.inputs = {}
+        for key, label, unit in (('frequency', "Frekvencia (f) [Hz]:", 'Hz'),
+                                 ('resistance', "Odpor (R) [Ω]:", 'Ω'),
+                                 ('inductance', "Indukčnosť (L) [H]:", 'H'),
+                                 ('capacitance', "Kapacita (C) [F]:", 'F')):
+            inputs_layout.add_widget(theme.style(Label(text=label, font_size=FONT_SMALL), color='text'))
+            self.inputs[key] = theme.style(TextInput(
+                hint_text=unit,
+                multiline=False,
+                font_size=FONT_BODY
+            ), background_color='surface', foreground_color='text')
+            inputs_layout.add_widget(self.inputs[key])
+        self.add_widget(inputs_layout)
+        
+        calc_btn = theme.style(Button(
+            text="Vypočítať",
+            size_hint_y=None,
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
+            bold=True
+        ), background_color='accent', color='on_accent')
+        calc_btn.bind(on_press=self.calculate_reactance)
+        self.add_widget(calc_btn)
+        
+        self.results_label = theme.style(Label(
+            text="Zadajte f a aspoň jednu súčiastku, alebo L a C pre rezonanciu",
+            font_size=FONT_BODY,
+            text_size=(None, None),
+            halign='center'
+        ), color='text')
+        self.results_label.bind(size=self.results_label.setter('text_size'))
+        self.add_widget(self.results_label)
+        
+        self.bind_live_inputs(self.results_label, *self.inputs.values())
+    
+    def calculate_reactance(self, instance):
+        """Calculate and record the values the inputs determine"""
+        from reactance import rlc_result
+        inputs = self.live_inputs()
+        result = rlc_result(*inputs)
+        self.results_label.text = self.live_result(inputs)
+        if result.error is None:
+            record_calculation(
+                'reactance',
+                ", ".join(f"{name}={value:g}" for name, value in zip('fRLC', inputs) if value is not None),
+                self.results_label.text
+            )
+    
+    def results_text(self, values):
+        """Result text with the values that could be derived"""
+        lines = []
+        if values['Xl'] is not None:
+            lines.append(f"Xl = {values['Xl']:.4g} Ω")
+        if values['Xc'] is not None:
+            lines.append(f"Xc = {values['Xc']:.4g} Ω")
+        if values['Z'] is not None:
+            lines.append(f"|Z| = {values['Z']:.4g} Ω, φ = {values['phase']:.1f}°")
+        if values['tau'] is not None:
+            lines.append(f"τ = {values['tau']:.4g} s (99 % po 5τ)")
+        if values['f0'] is not None:
+            lines.append(f"f0 = {values['f0']:.4g} Hz")
+        if values['Q'] is not None:
+            lines.append(f"Q = {values['Q']:.3g}")
+        return "\n".join(lines)
+    
+    def live_inputs(self):
+        return (parse_quantity(self.inputs['frequency'].text, 'Hz'),
+                parse_quantity(self.inputs['resistance'].text, 'Ω'),
+                parse_quantity(self.inputs['inductance'].text, 'H'),
+                parse_quantity(self.inputs['capacitance'].text, 'F'))
+    
+    def live_result(self, inputs):
+        from reactance import rlc_result
+        result = rlc_result(*inputs)
+        if result.error in (ERROR_MISSING, ERROR_UNDERDETERMINED):
+            return "Zadajte f a aspoň jednu súčiastku, alebo L a C pre rezonanciu"
+        if result.error == ERROR_ZERO:
+            return "Chyba: f, L ani C nemôžu byť nula!"
+        if result.error is not None:
+            return ERROR_TEXTS[result.error]
+        return self.results_text(result.value)
+
+
+class DesignTab(LiveRecalculation, BoxLayout):
+    """Tab for LED resistor, Zener regulator, divider and resistor combination design"""
+    
+    # Mode -> input fields as (label, unit); unit None for plain numbers
+    MODES = {
+        'LED rezistor': [("Napájanie [V]:", 'V'), ("Napätie LED [V]:", 'V'),
+                         ("Prúd LED [A]:", 'A'), ("Počet LED:", None)],
+        'Zenerova dióda': [("Vstup min [V]:", 'V'), ("Vstup max [V]:", 'V'),
+                           ("Zenerovo napätie [V]:", 'V'), ("Prúd záťaže [A]:", 'A')],
+        'Delič napätia': [("Vstup [V]:", 'V'), ("Výstup [V]:", 'V'), ("Celkový odpor [Ω]:", 'Ω')],
+        'Kombinácia R': [("Cieľový odpor [Ω]:", 'Ω')],
+    }
+    
+    INPUT_COUNT = 4
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = PADDING
+        self.spacing = SPACING
+        self.create_design_view()
+    
+    def create_design_view(self):
+        """Create design calculator interface"""
+        from kivy.uix.spinner import Spinner
+        from design import E_SERIES
+        
+        title = theme.style(Label(
+            text="Návrh obvodov",
+            font_size=FONT_TITLE,
+            bold=True,
+            size_hint_y=None,
+            height=TITLE_HEIGHT
+        ), color='accent')
+        self.add_widget(title)
+        
+        choices = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=dp(40))
+        self.mode = theme.style(Spinner(
+            text='LED rezistor',
+            values=list(self.MODES)
+        ), background_color='surface', color='text')
+        choices.add_widget(self.mode)
+        self.series = theme.style(Spinner(
+            text='E24',
+            values=list(E_SERIES),
+            size_hint_x=0.4
+        ), background_color='surface', color='text')
+        choices.add_widget(self.series)
+        self.add_widget(choices)
+        
+        # The same inputs serve every mode, unused ones are hidden
+        inputs_layout = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(200))
+        self.labels = []
+        self.inputs = []
+        for _ in range(self.INPUT_COUNT):
+            label = theme.style(Label(font_size=FONT_SMALL), color='text')
+            text_input = theme.style(TextInput(
+                multiline=False,
+                font_size=FONT_BODY
+            ), background_color='surface', foreground_color='text')
+            inputs_layout.add_widget(label)
+            inputs_layout.add_widget(text_input)
+            self.labels.append(label)
+            self.inputs.append(text_input)
+        self.add_widget(inputs_layout)
+        
+        calc_btn = theme.style(Button(
+            text="Navrhnúť",
+            size_hint_y=None,
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
+            bold=True
+        ), background_color='accent', color='on_accent')
+        calc_btn.bind(on_press=self.calculate_design)
+        self.add_widget(calc_btn)
+        
+        self.results_label = theme.style(Label(
+            font_size=FONT_BODY,
+            text_size=(None, None),
+            halign='center'
+        ), color='text')
+        self.results_label.bind(size=self.results_label.setter('text_size'))
+        self.add_widget(self.results_label)
+        
+        self.mode.bind(text=self.show_mode)
+        self.show_mode(self.mode, self.mode.text)
+        self.bind_live_inputs(self.results_label, self.mode, self.series, *self.inputs)
+    
+    def show_mode(self, instance, mode):
+        """Label the inputs of a mode and hide the rest"""
+        fields = self.MODES[mode]
+        for i, (label, text_input) in enumerate(zip(self.labels, self.inputs)):
+            used = i < len(fields)
+            label.text = fields[i][0] if used else ""
+            text_input.hint_text = (fields[i][1] or "") if used else ""
+            text_input.disabled = not used
+            text_input.opacity = 1 if used else 0
+            if not used:
+                text_input.text = ""
+        self.results_label.text = "Zadajte hodnoty pre návrh"
+    
+    def calculate_design(self, instance):
+        """Design and record the circuit of the current mode"""
+        inputs = self.live_inputs()
+        self.results_label.text = self.live_result(inputs)
+        if self.design(inputs).error is None:
+            mode, series, values = inputs
+            record_calculation(
+                'design',
+                f"{mode} ({series}): " + ", ".join(f"{value:g}" for value in values if value is not None),
+                self.results_label.text
+            )
+    
+    def design(self, inputs):
+        """Result of the design function of a mode"""
+        from design import led_resistor, resistor_combination, voltage_divider, zener_regulator
+        mode, series, values = inputs
+        if mode == 'LED rezistor':
+            supply, forward_voltage, current, count = values
+            return led_resistor(supply, forward_voltage, current, 1 if count is None else count, series)
+        if mode == 'Zenerova dióda':
+            return zener_regulator(*values, series=series)
+        if mode == 'Delič napätia':
+            return voltage_divider(*values[:3], series=series)
+        return resistor_combination(values[0], series)
+    
+    def results_text(self, mode, value):
+        """Result text of a successful design"""
+        if mode == 'LED rezistor':
+            return (f"R = {format_resistance(value['resistance'])} (ideálne {value['ideal']:.4g} Ω)\n"
+                    f"Prúd LED: {format_current(value['current'])}\n"
+                    f"Výkon na R: {value['power']:.3g} W, {rating_text(value['rating'])}")
+        if mode == 'Zenerova dióda':
+            return (f"R = {format_resistance(value['resistance'])} (ideálne {value['ideal']:.4g} Ω)\n"
+                    f"Rezistor: {value['resistor_power']:.3g} W, {rating_text(value['resistor_rating'])}\n"
+                    f"Zenerova dióda: {value['zener_power']:.3g} W, {rating_text(value['zener_rating'])}")
+        if mode == 'Delič napätia':
+            return (f"R1 = {format_resistance(value['r1'])}, R2 = {format_resistance(value['r2'])}\n"
+                    f"Výstup: {value['output']:.4g} V (odchýlka {value['error'] * 100:.2f} %)\n"
+                    f"Prúd: {format_current(value['current'])}, výkon {value['power']:.3g} W")
+        parts = [format_resistance(part) for part in value.values]
+        joined = {'single': parts[0], 'series': " + ".join(parts), 'parallel': " ∥ ".join(parts)}[value.connection]
+        return (f"{joined} = {format_resistance(value.resistance)}\n"
+                f"Odchýlka: {value.error * 100:.2f} %")
+    
+    def live_inputs(self):
+        mode = self.mode.text
+        fields = self.MODES[mode]
+        values = tuple(parse_quantity(text_input.text, unit)
+                       for text_input, (_, unit) in zip(self.inputs, fields))
+        return mode, self.series.text, values + (None,) * (self.INPUT_COUNT - len(values))
+    
+    def live_result(self, inputs):
+        result = self.design(inputs)
+        if result.error == ERROR_MISSING:
+            return "Zadajte hodnoty pre návrh"
+        if result.error == ERROR_ZERO:
+            return "Chyba: Zadané hodnoty nemôžu byť nula!"
+        if result.error == ERROR_RANGE:
+            if inputs[0] == 'Kombinácia R':
+                return "Chyba: Odpor nemožno zložiť z dvoch rezistorov v tolerancii radu!"
+            if inputs[0] == 'LED rezistor':
+                return "Chyba: Návrh nie je možný, skontrolujte napätia a celý počet LED!"
+            return "Chyba: Návrh nie je možný, skontrolujte napätia!"
+        if result.error is not None:
+            return ERROR_TEXTS[result.error]
+        return self.results_text(inputs[0], result.value)
+
+
+def rating_text(rating):
+    """Text of a power rating picked by the design calculators"""
+    return f"súčiastka {rating:g} W" if rating is not None else "mimo bežných výkonov"
+
+
+class MachinesTab(LiveRecalculation, BoxLayout):
+    """Tab for motor and transformer nameplate calculations"""
+    
+    # Mode -> input fields as (label, unit); unit None for plain numbers
+    MODES = {
+        'Motor (3f)': [("Výkon [W]:", 'W'), ("Napätie [V]:", 'V'), ("cos φ:", None), ("Účinnosť η:", None)],
+        'Transformátor (3f)': [("Výkon [VA]:", 'VA'), ("Napätie U1 [V]:", 'V'), ("Napätie U2 [V]:", 'V'),
+                               ("uk [%]:", None)],
+    }
+    
+    START_METHODS = {
+        'Priamy štart': 'direct',
+        'Hviezda-trojuholník': 'star_delta',
+        'Softštartér': 'soft_start',
+        'Frekvenčný menič': 'frequency_converter',
+    }
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = PADDING
+        self.spacing = SPACING
+        self.create_machines_view()
+    
+    def create_machines_view(self):
+        """Create motor and transformer calculator interface"""
+        from kivy.uix.spinner import Spinner
+        
+        title = theme.style(Label(
+            text="Motory a transformátory",
+            font_size=FONT_TITLE,
+            bold=True,
+            size_hint_y=None,
+            height=TITLE_HEIGHT
+        ), color='accent')
+        self.add_widget(title)
+        
+        choices = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=dp(40))
+        self.mode = theme.style(Spinner(
+            text='Motor (3f)',
+            values=list(self.MODES)
+        ), background_color='surface', color='text')
+        choices.add_widget(self.mode)
+        self.start = theme.style(Spinner(
+            text='Priamy štart',
+            values=list(self.START_METHODS)
+        ), background_color='surface', color='text')
+        choices.add_widget(self.start)
+        self.add_widget(choices)
+        
+        inputs_layout = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(200))
+        self.labels = []
+        self.inputs = []
+        for _ in range(4):
+            label = theme.style(Label(font_size=FONT_SMALL), color='text')
+            text_input = theme.style(TextInput(
+                multiline=False,
+                font_size=FONT_BODY
+            ), background_color='surface', foreground_color='text')
+            inputs_layout.add_widget(label)
+            inputs_layout.add_widget(text_input)
+            self.labels.append(label)
+            self.inputs.append(text_input)
+        self.add_widget(inputs_layout)
+        
+        calc_btn = theme.style(Button(
+            text="Vypočítať",
+            size_hint_y=None,
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
+            bold=True
+        ), background_color='accent', color='on_accent')
+        calc_btn.bind(on_press=self.calculate_machine)
+        self.add_widget(calc_btn)
+        
+        self.results_label = theme.style(Label(
+            font_size=FONT_BODY,
+            text_size=(None, None),
+            halign='center'
+        ), color='text')
+        self.results_label.bind(size=self.results_label.setter('text_size'))
+        self.add_widget(self.results_label)
+        
+        self.mode.bind(text=self.show_mode)
+        self.show_mode(self.mode, self.mode.text)
+        self.bind_live_inputs(self.results_label, self.mode, self.start, *self.inputs)
+    
+    def show_mode(self, instance, mode):
+        """Label the inputs of a mode, the starting method only applies to motors"""
+        for label, text_input, (text, unit) in zip(self.labels, self.inputs, self.MODES[mode]):
+            label.text = text
+            text_input.hint_text = unit or ""
+        self.start.disabled = not mode.startswith('Motor')
+        self.start.opacity = 0 if self.start.disabled else 1
+        self.results_label.text = "Zadajte údaje zo štítku"
+    
+    def calculate_machine(self, instance):
+        """Calculate and record the values of the current mode"""
+        inputs = self.live_inputs()
+        self.results_label.text = self.live_result(inputs)
+        if self.machine_result(inputs).error is None:
+            mode, start, values = inputs
+            record_calculation(
+                'machines',
+                f"{mode}: " + ", ".join(f"{value:g}" for value in values if value is not None),
+                self.results_label.text
+            )
+    
+    def machine_result(self, inputs):
+        from machines import motor_result, transformer_result
+        mode, start, values = inputs
+        if mode.startswith('Motor'):
+            return motor_result(*values, start=self.START_METHODS[start])
+        return transformer_result(*values)
+    
+    def results_text(self, mode, value):
+        """Result text of a successful calculation"""
+        if mode.startswith('Motor'):
+            protection = (f"Istič: {value['breaker']} A, vodič {value['cross_section']} mm²"
+                          if value['breaker'] is not None else "Istič: mimo tabuľky ističov")
+            return (f"Menovitý prúd: {format_current(value['current'])}\n"
+                    f"Záberový prúd: {format_current(value['starting_current'])}\n"
+                    f"Príkon: {value['input_power'] / 1000:.4g} kW\n{protection}")
+        text = (f"Prúd I1: {format_current(value['primary_current'])}\n"
+                f"Prúd I2: {format_current(value['secondary_current'])}\n"
+                f"Prevod: {value['turns_ratio']:.4g}")
+        if value['impedance'] is not None:
+            text += (f"\nZk (strana U2): {value['impedance'] * 1000:.4g} mΩ\n"
+                     f"Skratový prúd: {value['short_circuit_current'] / 1000:.4g} kA")
+        return text
+    
+    def live_inputs(self):
+        mode = self.mode.text
+        values = tuple(parse_quantity(text_input.text, unit)
+                       for text_input, (_, unit) in zip(self.inputs, self.MODES[mode]))
+        return mode, self.start.text, values
+    
+    def live_result(self, inputs):
+        result = self.machine_result(inputs)
+        if result.error == ERROR_MISSING:
+            return "Zadajte údaje zo štítku"
+        if result.error == ERROR_ZERO:
+            if inputs[0] == 'Motor (3f)':
+                return "Chyba: Napätie, cos φ ani η nemôžu byť nula!"
+            return "Chyba: Výkon ani napätia nemôžu byť nula!"
+        if result.error == ERROR_RANGE:
+            return "Chyba: Zadané hodnoty alebo výsledok sú mimo rozsahu!"
+        if result.error is not None:
+            return ERROR_TEXTS[result.error]
+        return self.results_text(inputs[0], result.value)
+
+
+class EarthingTab(LiveRecalculation, BoxLayout):
+    """Tab for the resistance of earth electrodes and rod arrays"""
+    
+    # Mode -> input fields as (label, unit); unit None for plain numbers, resistivity in Ωm
+    MODES = {
+        'Tyč': [("Rezistivita ρ [Ωm]:", None), ("Dĺžka L [m]:", 'm'), ("Priemer d [m]:", 'm')],
+        'Doska': [("Rezistivita ρ [Ωm]:", None), ("Plocha A [m²]:", None)],
+        'Pásik': [("Rezistivita ρ [Ωm]:", None), ("Dĺžka L [m]:", 'm'), ("Šírka w [m]:", 'm'),
+                  ("Hĺbka h [m]:", 'm')],
+        'Sústava tyčí': [("Rezistivita ρ [Ωm]:", None), ("Dĺžka tyče L [m]:", 'm'), ("Počet tyčí:", None),
+                         ("Rozostup s [m]:", 'm')],
+        'Návrh sústavy': [("Rezistivita ρ [Ωm]:", None), ("Dĺžka tyče L [m]:", 'm'),
+                          ("Požadovaný odpor [Ω]:", 'Ω'), ("Rozostup s [m]:", 'm')],
+    }
+    
+    ELECTRODES = {'Tyč': 'rod', 'Doska': 'plate', 'Pásik': 'strip'}
+    
+    LAYOUT_NAMES = {'line': 'V rade', 'ring': 'Do kruhu', 'hollow_square': 'Po obvode štvorca', 'grid': 'Mriežka'}
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = PADDING
+        self.spacing = SPACING
+        self.create_earthing_view()
+    
+    def create_earthing_view(self):
+        """Create earth electrode calculator interface"""
+        from kivy.uix.spinner import Spinner
+        from earthing import SOIL_RESISTIVITY
+        
+        title = theme.style(Label(
+            text="Uzemnenie",
+            font_size=FONT_TITLE,
+            bold=True,
+            size_hint_y=None,
+            height=TITLE_HEIGHT
+        ), color='accent')
+        self.add_widget(title)
+        
+        choices = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=dp(40))
+        self.mode = theme.style(Spinner(
+            text='Tyč',
+            values=list(self.MODES)
+        ), background_color='surface', color='text')
+        choices.add_widget(self.mode)
+        self.arrangement = theme.style(Spinner(
+            text=self.LAYOUT_NAMES['line'],
+            values=list(self.LAYOUT_NAMES.values())
+        ), background_color='surface', color='text')
+        choices.add_widget(self.arrangement)
+        self.soil = theme.style(Spinner(
+            text='Pôda',
+            values=list(SOIL_RESISTIVITY)
+        ), background_color='surface', color='text')
+        self.soil.bind(text=self.use_soil)
+        choices.add_widget(self.soil)
+        self.add_widget(choices)
+        
+        inputs_layout = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(200))
+        self.labels = []
+        self.inputs = []
+        for _ in range(4):
+            label = theme.style(Label(font_size=FONT_SMALL), color='text')
+            text_input = theme.style(TextInput(
+                multiline=False,
+                font_size=FONT_BODY
+            ), background_color='surface', foreground_color='text')
+            inputs_layout.add_widget(label)
+            inputs_layout.add_widget(text_input)
+            self.labels.append(label)
+            self.inputs.append(text_input)
+        self.add_widget(inputs_layout)
+        
+        calc_btn = theme.style(Button(
+            text="Vypočítať",
+            size_hint_y=None,
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
+            bold=True
+        ), background_color='accent', color='on_accent')
+        calc_btn.bind(on_press=self.calculate_earthing)
+        self.add_widget(calc_btn)
+        
+        self.results_label = theme.style(Label(
+            font_size=FONT_BODY,
+            text_size=(None, None),
+            halign='center'
+        ), color='text')
+        self.results_label.bind(size=self.results_label.setter('text_size'))
+        self.add_widget(self.results_label)
+        
+        self.mode.bind(text=self.show_mode)
+        self.show_mode(self.mode, self.mode.text)
+        self.bind_live_inputs(self.results_label, self.mode, self.arrangement, *self.inputs)
+    
+    def show_mode(self, instance, mode):
+        """Label the inputs of a mode and hide the ones it doesn't use"""
+        fields = self.MODES[mode]
+        for i, (label, text_input) in enumerate(zip(self.labels, self.inputs)):
+            used = i < len(fields)
+            label.text = fields[i][0] if used else ""
+            text_input.hint_text = (fields[i][1] or "") if used else ""
+            text_input.disabled = not used
+            text_input.opacity = 1 if used else 0
+        # Only a single array has a layout to choose, the design mode tries them all
+        self.arrangement.disabled = mode != 'Sústava tyčí'
+        self.arrangement.opacity = 0 if self.arrangement.disabled else 1
+        self.results_label.text = "Zadajte rezistivitu pôdy a rozmery"
+    
+    def use_soil(self, instance, soil):
+        """Fill in the typical resistivity of a soil type"""
+        from earthing import SOIL_RESISTIVITY
+        if soil in SOIL_RESISTIVITY:
+            self.inputs[0].text = f"{SOIL_RESISTIVITY[soil]:g}"
+    
+    def calculate_earthing(self, instance):
+        """Calculate and record the resistance of the current electrode"""
+        inputs = self.live_inputs()
+        self.results_label.text = self.live_result(inputs)
+        if self.earthing_result(inputs).error is None:
+            mode, layout, values = inputs
+            record_calculation(
+                'earthing',
+                f"{mode}: " + ", ".join(f"{value:g}" for value in values if value is not None),
+                self.results_label.text
+            )
+    
+    def layout_key(self, name):
+        return next(key for key, value in self.LAYOUT_NAMES.items() if value == name)
+    
+    def earthing_result(self, inputs):
+        from earthing import electrode_result, rod_array_design, rod_array_result
+        mode, layout, values = inputs
+        if mode in self.ELECTRODES:
+            return electrode_result(self.ELECTRODES[mode], *values)
+        if mode == 'Sústava tyčí':
+            return rod_array_result(*values, layout=self.layout_key(layout))
+        resistivity, length, target, spacing = values
+        return rod_array_design(resistivity, length, target, [spacing])
+    
+    def results_text(self, mode, value):
+        """Result text of a successful calculation"""
+        if mode != 'Návrh sústavy':
+            return f"Odpor uzemnenia: {format_resistance(value)}"
+        if not value:
+            return "Požadovaný odpor sa nedá dosiahnuť,\nskúste dlhšie tyče alebo väčší rozostup"
+        # Fewest rods of every layout
+        best = {}
+        for array in value:
+            best.setdefault(array.layout, array)
+        return "\n".join(f"{self.LAYOUT_NAMES[array.layout]}: {array.count} tyčí, "
+                         f"{format_resistance(array.resistance)}"
+                         for array in sorted(best.values(), key=lambda array: array.count))
+    
+    def live_inputs(self):
+        mode = self.mode.text
+        values = tuple(parse_quantity(text_input.text, unit)
+                       for text_input, (_, unit) in zip(self.inputs, self.MODES[mode]))
+        return mode, self.arrangement.text, values
+    
+    def live_result(self, inputs):
+        result = self.earthing_result(inputs)
+        if result.error == ERROR_MISSING:
+            return "Zadajte rezistivitu pôdy a rozmery"
+        if result.error == ERROR_ZERO:
+            return "Chyba: Hodnota nemôže byť nula!"
+        if result.error == ERROR_RANGE:
+            if inputs[0] == 'Sústava tyčí':
+                return "Chyba: Takýto počet tyčí rozloženie nemá!"
+            return "Chyba: Rozmery sú mimo platnosti vzorca!"
+        if result.error is not None:
+            return ERROR_TEXTS[result.error]
+        return self.results_text(inputs[0], result.value)
+
+
+class LoadRowItem(RecycleDataViewBehavior, Button):
+    """Row of the load schedule, tapping it opens the load for editing"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        theme.style(self, background_color='surface', color='text')
+        self.background_normal = ''
+        self.font_size = FONT_SMALL
+        self.halign = 'left'
+        self.valign = 'middle'
+        self.padding = [dp(10), dp(5)]
+        self.bind(size=self.setter('text_size'))
+        self.load_id = None
+        self.on_select = None
+    
+    def refresh_view_attrs(self, rv, index, data):
+        """Show the load of a RecycleView data row"""
+        self.text = data['text']
+        self.load_id = data['load_id']
+        self.on_select = data['on_select']
+    
+    def on_release(self):
+        if self.on_select is not None:
+            self.on_select(self.load_id)
+
+
+class LoadScheduleTab(BoxLayout):
+    """Tab with a list of consumers and their totals per circuit and phase"""
+    
+    # Circuits shown one by one, the rest only count into the totals
+    SHOWN_CIRCUITS = 5
+    
+    # Height of a line of the totals
+    TOTALS_LINE_HEIGHT = dp(22)
+    
+    def __init__(self, **kwargs):
+        from loads import LoadSchedule
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = PADDING
+        self.spacing = dp(10)
+        self.schedule = LoadSchedule()
+        # Load ids of the rows; ids only grow, so the list stays sorted
+        self.row_ids = []
+        self.editing_id = None
+        self.create_schedule_view()
+    
+    def create_schedule_view(self):
+        """Create load form, totals and the list of loads"""
+        from kivy.uix.spinner import Spinner
+        from loads import PHASES, THREE_PHASE
+        
+        title = theme.style(Label(
+            text="Bilancia záťaže",
+            font_size=FONT_TITLE,
+            bold=True,
+            size_hint_y=None,
+            height=TITLE_HEIGHT
+        ), color='accent')
+        self.add_widget(title)
+        
+        form = GridLayout(cols=2, spacing=dp(5), size_hint_y=None, height=dp(6 * 40 + 5 * 5))
+        self.inputs = {}
+        for key, text, hint in (('name', "Spotrebič:", "Napríklad: Bojler"),
+                                ('power', "Výkon (W):", "Príkon v W"),
+                                ('cos_phi', "cos φ:", "1"),
+                                ('demand_factor', "Súčiniteľ náročnosti:", "1"),
+                                ('circuit', "Obvod:", "Napríklad: Kuchyňa")):
+            form.add_widget(theme.style(Label(text=text, font_size=FONT_SMALL), color='text'))
+            self.inputs[key] = theme.style(TextInput(
+                hint_text=hint,
+                multiline=False,
+                font_size=FONT_BODY
+            ), background_color='surface', foreground_color='text')
+            form.add_widget(self.inputs[key])
+        form.add_widget(theme.style(Label(text="Fáza:", font_size=FONT_SMALL), color='text'))
+        self.phase = theme.style(Spinner(
+            text=PHASES[0],
+            values=list(PHASES) + [THREE_PHASE]
+        ), background_color='surface', color='text')
+        form.add_widget(self.phase)
+        self.add_widget(form)
+        
+        buttons = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=dp(45))
+        self.save_btn = theme.style(Button(
+            text="Pridať spotrebič",
+            font_size=FONT_SMALL,
+            bold=True
+        ), background_color='accent', color='on_accent')
+        self.save_btn.bind(on_press=self.save_load)
+        buttons.add_widget(self.save_btn)
+        self.remove_btn = theme.style(Button(
+            text="Odstrániť",
+            font_size=FONT_SMALL,
+            disabled=True
+        ), background_color='muted', color='text')
+        self.remove_btn.bind(on_press=self.remove_load)
+        buttons.add_widget(self.remove_btn)
+        self.add_widget(buttons)
+        
+        self.totals_label = theme.style(Label(
+            font_size=FONT_SMALL,
+            size_hint_y=None,
+            halign='left',
+            valign='top'
+        ), color='text')
+        self.totals_label.bind(size=self.totals_label.setter('text_size'))
+        self.add_widget(self.totals_label)
+        
+        # RecycleView keeps schedules with thousands of loads cheap to show
+        self.loads_view = theme.style(RecycleView(
+            do_scroll_x=False,
+            bar_width=dp(8),
+            effect_cls='ScrollEffect'
+        ), bar_color='accent')
+        self.loads_view.viewclass = 'LoadRowItem'
+        loads_layout = RecycleBoxLayout(
+            orientation='vertical',
+            spacing=dp(2),
+            default_size=(None, dp(45)),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        loads_layout.bind(minimum_height=loads_layout.setter('height'))
+        self.loads_view.add_widget(loads_layout)
+        self.add_widget(self.loads_view)
+        
+        self.update_totals()
+    
+    def read_form(self):
+        """Load from the form, raises ValueError for invalid values"""
+        from loads import Load
+        power = parse_quantity(self.inputs['power'].text, 'W')
+        if power is None:
+            raise ValueError("Zadajte výkon v W!")
+        cos_phi = parse_quantity(self.inputs['cos_phi'].text or "1")
+        demand_factor = parse_quantity(self.inputs['demand_factor'].text or "1")
+        if cos_phi is None or not 0 < cos_phi <= 1:
+            raise ValueError("cos φ musí byť v rozsahu (0, 1]!")
+        if demand_factor is None or not 0 <= demand_factor <= 1:
+            raise ValueError("Súčiniteľ náročnosti musí byť v rozsahu 0 až 1!")
+        if power < 0:
+            raise ValueError("Výkon nemôže byť záporný!")
+        return Load(self.inputs['name'].text.strip() or "Spotrebič", power, self.phase.text,
+                    cos_phi, demand_factor, self.inputs['circuit'].text.strip())
+    
+    def row_data(self, load_id, load):
+        circuit = f", {load.circuit}" if load.circuit else ""
+        return {
+            'text': f"{load.name}: {load.power:g} W, {load.phase}, cos φ {load.cos_phi:g}, "
+                    f"k {load.demand_factor:g}{circuit}",
+            'load_id': load_id,
+            'on_select': self.select_load,
+        }
+    
+    def save_load(self, instance):
+        """Add the load from the form, or save the edited one"""
+        try:
+            load = self.read_form()
+        except ValueError as e:
+            self.totals_label.text = f"Chyba: {e}"
+            return
+        
+        if self.editing_id is None:
+            load_id = self.schedule.add(load)
+            self.row_ids.append(load_id)
+            self.loads_view.data.append(self.row_data(load_id, load))
+        else:
+            self.schedule.update(self.editing_id, load)
+            self.loads_view.data[self.row_of(self.editing_id)] = self.row_data(self.editing_id, load)
+            self.clear_selection()
+        self.update_totals()
+    
+    def row_of(self, load_id):
+        """Index of a load's row in the list"""
+        return bisect_left(self.row_ids, load_id)
+    
+    def select_load(self, load_id):
+        """Fill the form with a load for editing"""
+        load = self.schedule[load_id]
+        self.editing_id = load_id
+        self.inputs['name'].text = load.name
+        self.inputs['power'].text = f"{load.power:g}"
+        self.inputs['cos_phi'].text = f"{load.cos_phi:g}"
+        self.inputs['demand_factor'].text = f"{load.demand_factor:g}"
+        self.inputs['circuit'].text = load.circuit
+        self.phase.text = load.phase
+        self.save_btn.text = "Uložiť zmenu"
+        self.remove_btn.disabled = False
+    
+    def clear_selection(self):
+        self.editing_id = None
+        self.save_btn.text = "Pridať spotrebič"
+        self.remove_btn.disabled = True
+    
+    def remove_load(self, instance):
+        """Remove the load being edited"""
+        if self.editing_id is None:
+            return
+        index = self.row_of(self.editing_id)
+        self.schedule.remove(self.editing_id)
+        del self.row_ids[index]
+        del self.loads_view.data[index]
+        self.clear_selection()
+        self.update_totals()
+    
+    def update_totals(self):
+        """Show schedule totals, phase currents, the supply sizing and the circuits"""
+        if not len(self.schedule):
+            self.totals_label.text = "Pridajte spotrebiče pre výpočet bilancie"
+            self.totals_label.height = self.TOTALS_LINE_HEIGHT * 5
+            return
+        totals = self.schedule.totals()
+        supply = self.schedule.size_supply()
+        currents = "  ".join(f"{phase} {current:.1f} A" for phase, current in supply['phase_currents'].items())
+        balance = "vyvážené" if supply['balanced'] else "nevyvážené!"
+        if supply['breaker'] is None:
+            sizing = "Prúd presahuje tabuľku ističov"
+        else:
+            sizing = f"Istič {supply['breaker']} A, prierez {supply['cross_section'] or '> 300'} mm²"
+        lines = [
+            f"Spotrebičov: {len(self.schedule)}",
+            f"P = {totals.active / 1000:.2f} kW, S = {totals.apparent / 1000:.2f} kVA, cos φ = {totals.cos_phi:.2f}",
+            currents,
+            f"Nesymetria {supply['unbalance'] * 100:.0f} % ({balance})",
+            sizing,
+        ]
+        for name, circuit in self.schedule.circuit_totals(self.SHOWN_CIRCUITS).items():
+            lines.append(f"{name or 'Bez obvodu'}: P = {circuit.active / 1000:.2f} kW, "
+                         f"S = {circuit.apparent / 1000:.2f} kVA, cos φ = {circuit.cos_phi:.2f}")
+        hidden = self.schedule.circuit_count() - self.SHOWN_CIRCUITS
+        if hidden > 0:
+            lines.append(f"... a ďalšie obvody ({hidden})")
+        self.totals_label.text = "\n".join(lines)
+        self.totals_label.height = self.TOTALS_LINE_HEIGHT * len(lines)
+
+
+class EnergyTab(BoxLayout):
+    """Tab for the energy, peak demand and cost of a load profile from a CSV file"""
+    
+    # Meters shown one by one, the rest only count into the totals
+    SHOWN_METERS = 8
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = PADDING
+        self.spacing = SPACING
+        self.reader = None
+        self.reading = None
+        self.create_energy_view()
+    
+    def create_energy_view(self):
+        """Create load profile import interface"""
+        from kivy.uix.spinner import Spinner
+        from energy import TARIFFS
+        
+        title = theme.style(Label(
+            text="Spotreba energie",
+            font_size=FONT_TITLE,
+            bold=True,
+            size_hint_y=None,
+            height=TITLE_HEIGHT
+        ), color='accent')
+        self.add_widget(title)
+        
+        form = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(150))
+        form.add_widget(theme.style(Label(text="Súbor CSV:", font_size=FONT_SMALL), color='text'))
+        self.path_input = theme.style(TextInput(
+            hint_text="Cesta k profilu zaťaženia",
+            multiline=False,
+            font_size=FONT_BODY
+        ), background_color='surface', foreground_color='text')
+        form.add_widget(self.path_input)
+        form.add_widget(theme.style(Label(text="Jednotka stĺpcov:", font_size=FONT_SMALL), color='text'))
+        self.unit = theme.style(Spinner(
+            text='kW',
+            values=[unit for group in UNIT_GROUPS if group[0] in ('W', 'Wh') for unit in group]
+        ), background_color='surface', color='text')
+        form.add_widget(self.unit)
+        form.add_widget(theme.style(Label(text="Tarifa:", font_size=FONT_SMALL), color='text'))
+        self.tariff = theme.style(Spinner(
+            text=TARIFFS['single'].name,
+            values=[tariff.name for tariff in TARIFFS.values()]
+        ), background_color='surface', color='text')
+        form.add_widget(self.tariff)
+        self.add_widget(form)
+        
+        read_btn = theme.style(Button(
+            text="Načítať profil",
+            size_hint_y=None,
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
+            bold=True
+        ), background_color='accent', color='on_accent')
+        read_btn.bind(on_press=self.read_profile)
+        self.add_widget(read_btn)
+        
+        self.results_label = theme.style(Label(
+            text="Zadajte súbor s časovým priebehom výkonu",
+            font_size=FONT_SMALL,
+            text_size=(None, None),
+            halign='center'
+        ), color='text')
+        self.results_label.bind(size=self.results_label.setter('text_size'))
+        self.add_widget(self.results_label)
+    
+    def read_profile(self, instance):
+        """Start reading the profile, a chunk per frame so the UI stays responsive"""
+        from energy import TARIFFS, ProfileError, ProfileReader
+        self.stop_reading()
+        tariff = next(tariff for tariff in TARIFFS.values() if tariff.name == self.tariff.text)
+        try:
+            self.reader = ProfileReader(self.path_input.text.strip(), tariff, self.unit.text)
+        except ProfileError as e:
+            self.results_label.text = f"Chyba: {e}"
+            return
+        self.results_label.text = "Načítavam..."
+        self.reading = Clock.schedule_interval(self.read_chunk, 0)
+    
+    def stop_reading(self):
+        if self.reading is not None:
+            self.reading.cancel()
+            self.reading = None
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+    
+    def read_chunk(self, dt):
+        from energy import ProfileError
+        try:
+            more = self.reader.step()
+        except ProfileError as e:
+            self.results_label.text = f"Chyba: {e}"
+            self.stop_reading()
+            return False
+        if more:
+            self.results_label.text = f"Načítavam... {self.reader.rows} vzoriek"
+            return True
+        self.results_label.text = self.results_text(self.reader)
+        record_calculation('energy', f"{self.path_input.text.strip()}, {self.tariff.text}",
+                           self.results_label.text)
+        self.stop_reading()
+        return False
+    
+    def results_text(self, reader):
+        """Result text of a fully read profile"""
+        from energy import format_energy, format_power
+        summaries = reader.summaries()
+        lines = [f"{reader.rows} vzoriek po {reader.interval / 60:g} min, "
+                 f"{reader.start:%d.%m.%Y} - {reader.end:%d.%m.%Y}"]
+        for summary in summaries[:self.SHOWN_METERS]:
+            if summary.peak is None:
+                lines.append(f"{summary.name}: bez platných hodnôt")
+                continue
+            load_factor = f", LF {summary.load_factor:.2f}" if summary.load_factor is not None else ""
+            lines.append(f"{summary.name}: {format_energy(summary.energy)}, "
+                         f"max. {format_power(summary.peak)}{load_factor}, {summary.cost:.2f} €")
+        if len(summaries) > 1:
+            lines.append(f"Spolu ({len(summaries)} meraní): "
+                         f"{format_energy(sum(summary.energy for summary in summaries))}, "
+                         f"{sum(summary.cost or 0 for summary in summaries):.2f} €")
+        missing = sum(summary.missing for summary in summaries)
+        if missing:
+            lines.append(f"Chýbajúcich hodnôt: {missing}")
+        return "\n".join(lines)
+
+
+class HistoryRecordItem(RecycleDataViewBehavior, Label):
+    """Row of the calculation history"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        theme.style(self, color='text')
+        self.font_size = FONT_SMALL
+        self.halign = 'left'
+        self.valign = 'middle'
+        self.markup = True
+        self.padding = [dp(10), dp(5)]
+        self.bind(size=self.setter('text_size'))
+    
+    def refresh_view_attrs(self, rv, index, data):
+        """Show the record of a RecycleView data row"""
+        self.text = data['text']
+
+
+class HistoryTab(BoxLayout):
+    """Tab with the persistent calculation history, newest first"""
+    
+    # Records shown per page, only these are read from disk
+    PAGE_SIZE = 100
+    
+    KIND_NAMES = {
+        'ohms_law': "Ohmov zákon",
+        'power': "Výkon",
+        'wire': "Vodiče",
+        'resistor': "Rezistory",
+        'converter': "Prevodník",
+        'reactance': "Reaktancia",
+        'design': "Návrh",
+        'machines': "Stroje",
+        'earthing': "Uzemnenie",
+        'energy': "Energia"
+    }
+    
+    def __init__(self, history, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = PADDING
+        self.spacing = dp(10)
+        self.history = history
+        self.page_start = 0
+        self.create_history_view()
+        # The record headers are markup in the accent colour
+        theme.bind(accent=self.refresh)
+    
+    def create_history_view(self):
+        """Create history list with paging buttons"""
+        title = theme.style(Label(
+            text="História výpočtov",
+            font_size=FONT_TITLE,
+            bold=True,
+            size_hint_y=None,
+            height=TITLE_HEIGHT
+        ), color='accent')
+        self.add_widget(title)
+        
+        self.page_label = theme.style(Label(
+            font_size=FONT_SMALL,
+            size_hint_y=None,
+            height=dp(25)
+        ), color='text')
+        self.add_widget(self.page_label)
+        
+        self.records_view = theme.style(RecycleView(
+            do_scroll_x=False,
+            bar_width=dp(8),
+            effect_cls='ScrollEffect'
+        ), bar_color='accent')
+        self.records_view.viewclass = 'HistoryRecordItem'
+        records_layout = RecycleBoxLayout(
+            orientation='vertical',
+            spacing=dp(2),
+            default_size=(None, dp(60)),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        records_layout.bind(minimum_height=records_layout.setter('height'))
+        self.records_view.add_widget(records_layout)
+        self.add_widget(self.records_view)
+        
+        paging_layout = BoxLayout(orientation='horizontal', spacing=dp(10), size_hint_y=None, height=BUTTON_HEIGHT)
+        for text, step in (("Novšie", -self.PAGE_SIZE), ("Obnoviť", 0), ("Staršie", self.PAGE_SIZE)):
+            page_btn = theme.style(Button(
+                text=text,
+                font_size=FONT_SMALL
+            ), background_color='muted', color='text')
+            page_btn.bind(on_press=lambda btn, step=step: self.move_page(step))
+            paging_layout.add_widget(page_btn)
+        self.add_widget(paging_layout)
+        
+        self.refresh()
+    
+    def move_page(self, step):
+        """Move by step records towards older (positive) or newer ones"""
+        if step == 0:
+            self.page_start = 0
+        else:
+            self.page_start = min(max(0, self.page_start + step),
+                                  max(0, len(self.history) - 1))
+        self.refresh()
+    
+    def refresh(self, *args):
+        """Read the current page of records from the history"""
+        total = len(self.history)
+        records = self.history.recent(self.page_start, self.PAGE_SIZE)
+        accent = get_hex_from_color(theme.accent)
+        self.records_view.data = [
+            {'text': (f"[color={accent}]{time.strftime('%d.%m.%Y %H:%M', time.localtime(record.timestamp))}"
+                      f"  {self.KIND_NAMES.get(record.kind, record.kind)}[/color]\n"
+                      f"{escape_markup(record.inputs)} >> {escape_markup(record.result)}")}
+            for record in records
+        ]
+        if records:
+            self.page_label.text = f"Záznamy {self.page_start + 1}–{self.page_start + len(records)} z {total}"
+        else:
+            self.page_label.text = "História je prázdna"
+
+
 class ElectricalHelperApp(App):
     """Main application class"""
     
@@ -1170,139 +2339,93 @@ class ElectricalHelperApp(App):
         super().__init__(**kwargs)
         # Application window title
         self.title = "Elektrotechnický pomocník"
-        self.symbols = {
-            1: "Zásuvka (všeobecná značka)", 2: "Zásuvkové spojenie", 3: "Zásuvka zapojená z krabicovej rozvodky",
-            4: "Zásuvka (priebežné zapojenie)", 5: "Dvojitá zásuvka", 6: "Zásuvka s nezameniteľnými kontaktmi",
-            7: "Telefónna zásuvka", 8: "Anténna zásuvka", 9: "Žiarovkové svietidlo", 10: "Žiarovkové svietidlo nástenné",
-            11: "Žiarovkové svietidlo so spínačom", 12: "Núdzové osvetlenie", 13: "Žiarovkový svetlomet",
-            14: "Žiarivkové svietidlo", 15: "Žiarivkové svietidlo so žiarovkou", 16: "Halogénové svietidlo",
-            17: "Halogénový svetlomet", 18: "Žiarovka, signálka", 19: "Spínač jednopólový č.1",
-            20: "Spínač dvojpólový č.2", 21: "Spínač trojpólový č.3", 22: "Striedavý prepínač č.6",
-            23: "Sériový prepínač č.5", 24: "Krížový prepínač č.7", 25: "Sériový prepínač striedavý č.5A",
-            26: "Dvojitý prepínač striedavý č.5B", 27: "Spínač so signálkou", 28: "Koncový spínač",
-            29: "Odstredivý spínač", 30: "Plávačkový spínač", 31: "Tlakový spínač", 32: "Časový spínač",
-            33: "Tepelný spínač (termostat)", 34: "Okrúhla krabica", 35: "Krabica (rozvodná skriňa)",
-            36: "Okrúhla odbočná alebo spoj", 37: "Svorka", 38: "Tlačidlový ovládač", 39: "Tlačidlový ovládač dvojitý",
-            40: "Signálka", 41: "Tlačidlo so signálkou", 42: "Zvonček", 43: "Domový telefón s tlačidlom",
-            44: "Domový telefón", 45: "Húkačka", 46: "Siréna", 47: "Reproduktor", 48: "Kamera", 49: "Mikrofón",
-            50: "Spoločná anténa", 51: "Elektrický zámok", 52: "Tepelný spotrebič", 53: "Motor",
-            54: "Zariadenie s elektrickým motorom", 55: "Zariadenie s motorom aj el. kúrením", 56: "Infražiarič",
-            57: "Bojler", 58: "Ventilátor", 59: "Sušička", 60: "Práčka", 61: "Umývačka riadu", 63: "El. sporák",
-            64: "Chladnička", 65: "Transformátor", 66: "Regulačný odpor", 67: "Kondenzátorová batéria",
-            68: "Usmerňovač", 69: "Batéria", 70: "Zosilňovač", 71: "Záchytná tyč", 72: "Vodivé spojenie",
-            73: "Skúšobná svorka", 74: "Skúšobná svorka v skriňke", 75: "Hromozvádzač", 76: "Iskrisko", 77: "Uzemnenie",
-            78: "Doskový zemník", 79: "Tyčový zemník", 80: "Lúčový zemník", 81: "Uzemnenie", 82: "Bezšumová zem",
-            83: "Uzemnenie ochranné", 84: "Spojenie s kostrou", 85: "Spojenie s kostrou", 86: "Ekvipotenciál",
-            87: "Počet pólov, žíl", 88: "Vodič PEN", 89: "Stredný vodič N", 90: "Ochranný vodič PE",
-            91: "Stúpacie vedenie", 92: "Vedenie v trubkách", 93: "Vedenie v izolátoroch", 94: "Vedenie na povrchu",
-            95: "Vedenie pod omietkou", 96: "Vedenie v podlahe", 97: "Vedenie v podlahovej lište",
-            98: "Vedenie v kanáli", 99: "Vedenie po rošte", 100: "Vedenie na podperách", 101: "Vedenie v zemi",
-            102: "Vonkajšie vedenie na podperkách", 103: "Závesný kábel", 104: "Samonosný kábel",
-            105: "Jednopólový istič (FA)", 106: "Dvojpólový istič (FA)", 107: "Trojfázový istič (FA)",
-            108: "Poisky (FU)", 109: "Poistkový spínač", 110: "Poistkový odpojovač", 111: "Prerážka",
-            112: "Prúdový chránič", 113: "Prepäťová ochrana", 114: "+ obmedzovacia impedancia",
-            115: "Tepelná ochrana (R100 ap.)", 116: "Kontakt stýkača - spínací", 117: "Kontakt stýkača - rozpínací",
-            118: "Cievka stýkača (KM)", 119: "Pomocný kontakt zapínací", 120: "Pomocný kontakt vypínací",
-            121: "Spínač (SV)", 122: "Termostat (ST)", 123: "Relé (KR, KA)", 124: "Cievka relé (KR, KA)",
-            125: "Odpojovač", 126: "Odpínač", 127: "Otočný spínač", 128: "Stýkací spínač", 129: "Odpojovač",
-            130: "Odpínač", 131: "So spoždeným návratom", 132: "So spoždeným nábeihom", 133: "Termostat (ST)",
-            134: "Tlakový spínač (SP)", 135: "Koncový spínač (SQ)", 136: "Koncový spínač (SQ)",
-            137: "Pneumatické a hydraulické ovládanie", 138: "Ovládanie vačkou", 139: "Ovládanie elektromotorm",
-            140: "Ovládanie membránou", 141: "Ovládanie plávačkoin (BC)", 142: "Ovládanie odstredivým regulátorom",
-            143: "Ovládanie riadiacim kolesom", 144: "Ovládanie pákoui", 145: "Ovládanie špeciálnym kľúčom",
-            146: "Ovládanie prúdením", 147: "Ovládanie nohou", 148: "EP ventil (YV)", 149: "Jednoduché",
-            150: "Prepínací kontakt", 151: "Kontakt s predstihom", 152: "Kontakt so spoždením",
-            153: "Vypínací kontakt s predstihom", 154: "Vypínací kontakt so spoždením", 155: "Tlačidlo zapínací (SB)",
-            156: "Tlačidlo vypínací (SB)", 157: "Ťahový ovládač", 158: "Ťahový s vypínacím kontaktom",
-            159: "Otočný ovládač (SA)", 160: "Otočný s vypínacím kontaktom", 161: "Motor striedavý",
-            162: "Motor jednosmerný", 163: "Kotva jednosmerného motora", 164: "Vinutie jednosmerného motora",
-            165: "Generátor", 166: "Dynamo", 167: "Cievka, vinutie", 168: "Transformátor (T)",
-            169: "Vysielač teploty (BT)", 170: "Vysielač tlaku (BP)", 171: "Snímač otáčok (BP)",
-            172: "Termoelektrický článok", 173: "Voltmeter (PU)", 174: "Ampérmeter (PA)", 175: "Wattmeter",
-            176: "Frekvencmer", 177: "Otáčkomer", 178: "Bočník (RM)", 179: "Meraciý transformátor prúdu",
-            180: "Elektrické hodiny", 181: "Počítadlo impulzov", 182: "Elektromer (ET)", 183: "Transformátor (VT)",
-            184: "Dióda (VD)", 185: "Zenerová dióda (VHL)", 186: "LED dióda (HL)", 187: "Odpor", 188: "Potenciometer",
-            189: "Trimmer", 190: "Kondenzátor", 191: "Elektrolytický kondenzátor", 192: "Transformovňa",
-            193: "Usmerňovacia stanica", 194: "Zastrešená elektrická stanica", 195: "Zapúzdrená elektrická stanica",
-            196: "Stožiarová transformovňa", 197: "Hromozvádzač", 198: "Vyfukovací hromozvádzač",
-            199: "Ventilový hromozvádzač", 200: "Vákuový hromozvádzač", 201: "Výbojový hromozvádzač",
-            202: "Stožiar drevený", 203: "Stožiar oceľový", 204: "Stožiar príhradový", 205: "Stožiar železobetónový",
-            206: "Stožiar portálový", 207: "Stožiar s dvojitým závesom", 208: "Stožiar s kovovými reťazami",
-            209: "Kotvenie stožiara pätkou", 210: "Kotvenie stožiara kotvou", 211: "Nástenná konzola priebežná",
-            212: "Nástenná konzola odbočná", 213: "Upevnenie hákami na jednej strane",
-            214: "Upevnenie konzoly na jednej strane", 215: "Tlmič kmitov", 216: "Kondenzátorová batéria",
-            217: "Pupinačná cievka", 218: "Svietidlo", 219: "Rozhlas"
-        }
+        # Symbol catalogue is memory-mapped, rows are read on demand
+        self.symbols = SymbolCatalogue()
     
     def build(self):
         """Build main interface with tabs"""
+        self.history = CalculationHistory(os.path.join(self.user_data_dir, 'history'))
+        
         main_layout = BoxLayout(orientation='vertical')
         
         header = BoxLayout(
             orientation='horizontal', size_hint_y=None, height=dp(80),
-            padding=[dp(20), dp(15), dp(20), dp(15)]
+            padding=[PADDING, SPACING, PADDING, SPACING]
         )
         
         with header.canvas.before:
             from kivy.graphics import Color, Rectangle
-            Color(*get_color_from_hex('#1a1a1a'))
+            theme.style(Color(), owner=header, rgba='background')
             header.rect = Rectangle(size=header.size, pos=header.pos)
         header.bind(size=self._update_header_rect, pos=self._update_header_rect)
         
         # Main application heading
-        title_label = Label(
+        title_label = theme.style(Label(
             text="Elektrotechnický pomocník",
-            color=get_color_from_hex('#ff8c00'), font_size='22sp', bold=True,
+            font_size='22sp', bold=True,
             halign='center', valign='middle'
-        )
+        ), color='accent')
         title_label.bind(size=title_label.setter('text_size'))
         header.add_widget(title_label)
         
+        # Switches between the dark, light and high contrast palettes
+        theme_button = theme.style(Button(
+            text="Téma", size_hint_x=None, width=dp(80), font_size=FONT_SMALL,
+            background_normal=''
+        ), background_color='surface', color='text')
+        theme_button.bind(on_press=lambda instance: theme.next_theme())
+        header.add_widget(theme_button)
+        
         main_layout.add_widget(header)
         
-        tab_panel = TabbedPanel(
-            do_default_tab=False, background_color=get_color_from_hex('#1a1a1a'),
-            border=[0, 0, 0, 0], tab_height=dp(50), tab_width=dp(120),
+        tab_panel = theme.style(TabbedPanel(
+            do_default_tab=False, border=[0, 0, 0, 0], tab_height=BUTTON_HEIGHT, tab_width=dp(120),
             tab_pos='top_mid', background_image=''
-        )
+        ), background_color='background')
         
         # --- IMPLEMENTATION OF ACTIVE TAB HIGHLIGHTING ---
         # Common properties for ALL tabs
         tab_item_props = {
             'background_normal': '',  # Disable the default image (important for showing the color)
             'background_down': '',    # Disable the default image for the active state
-            'background_color': get_color_from_hex('#2d2d2d'), # Color of the INACTIVE tab
-            'color': get_color_from_hex('#ffffff'),
-            'font_size': '14sp'
+            'font_size': FONT_SMALL
         }
 
-        # Color for the ACTIVE tab
-        active_tab_color = get_color_from_hex('#ff8c00')
-        
-        # Creating individual tabs with color settings
-        symbols_tab = TabbedPanelItem(text='Značky', **tab_item_props)
-        symbols_tab.background_color_down = active_tab_color # Sets the color for the active state
-        symbols_tab.add_widget(SymbolsTab(self.symbols))
-        
-        converter_tab = TabbedPanelItem(text='Prevodník', **tab_item_props)
-        converter_tab.background_color_down = active_tab_color
-        converter_tab.add_widget(UnitConverterTab())
-        
-        resistor_tab = TabbedPanelItem(text='Rezistory', **tab_item_props)
-        resistor_tab.background_color_down = active_tab_color
-        resistor_tab.add_widget(ResistorColorCodeTab())
-        
-        power_tab = TabbedPanelItem(text='Výkon', **tab_item_props)
-        power_tab.background_color_down = active_tab_color
-        power_tab.add_widget(PowerCalculatorTab())
-        
-        wire_tab = TabbedPanelItem(text='Vodiče', **tab_item_props)
-        wire_tab.background_color_down = active_tab_color
-        wire_tab.add_widget(WireTableTab())
+        # Theme roles for the INACTIVE tab, its text and the ACTIVE tab
+        tab_item_roles = {
+            'background_color': 'surface',
+            'color': 'text',
+            'background_color_down': 'accent'
+        }
         
-        ohms_tab = TabbedPanelItem(text='Ohmov zákon', **tab_item_props)
-        ohms_tab.background_color_down = active_tab_color
-        ohms_tab.add_widget(OhmsLawTab())
+        def lazy_tab(text, factory):
+            """Tab whose content is built by factory when it is first opened"""
+            tab = theme.style(TabbedPanelItem(text=text, **tab_item_props), **tab_item_roles)
+            
+            def build_content(tab, state):
+                if state == 'down' and tab.content is None:
+                    tab.add_widget(factory())
+            
+            tab.bind(state=build_content)
+            return tab
+        
+        # Tab contents are created on first use, so startup only builds the default tab
+        symbols_tab = lazy_tab('Značky', lambda: SymbolsTab(self.symbols))
+        converter_tab = lazy_tab('Prevodník', UnitConverterTab)
+        resistor_tab = lazy_tab('Rezistory', ResistorColorCodeTab)
+        power_tab = lazy_tab('Výkon', PowerCalculatorTab)
+        wire_tab = lazy_tab('Vodiče', WireTableTab)
+        ohms_tab = lazy_tab('Ohmov zákon', OhmsLawTab)
+        reactance_tab = lazy_tab('Reaktancia', ReactanceTab)
+        design_tab = lazy_tab('Návrh', DesignTab)
+        machines_tab = lazy_tab('Stroje', MachinesTab)
+        earthing_tab = lazy_tab('Uzemnenie', EarthingTab)
+        loads_tab = lazy_tab('Bilancia', LoadScheduleTab)
+        energy_tab = lazy_tab('Energia', EnergyTab)
+        history_tab = lazy_tab('História', lambda: HistoryTab(self.history))
+        # Re-read the newest records whenever the tab is opened again
+        history_tab.bind(state=lambda tab, state: state == 'down' and tab.content is not None
+                         and tab.content.refresh())
         
         # Adding tabs to the panel
         tab_panel.add_widget(symbols_tab)
@@ -1311,15 +2434,37 @@ class ElectricalHelperApp(App):
         tab_panel.add_widget(power_tab)
         tab_panel.add_widget(wire_tab)
         tab_panel.add_widget(ohms_tab)
+        tab_panel.add_widget(reactance_tab)
+        tab_panel.add_widget(design_tab)
+        tab_panel.add_widget(machines_tab)
+        tab_panel.add_widget(earthing_tab)
+        tab_panel.add_widget(loads_tab)
+        tab_panel.add_widget(energy_tab)
+        tab_panel.add_widget(history_tab)
         
         tab_panel.default_tab = symbols_tab
         main_layout.add_widget(tab_panel)
         
+        # Development mode: edited table files are picked up without a restart
+        if os.environ.get('ELECTRICAL_HELPER_DEV'):
+            Clock.schedule_interval(self._reload_tables, TABLE_RELOAD_INTERVAL)
+        
         return main_layout
     
+    def _reload_tables(self, dt):
+        try:
+            if tables.reload_if_changed():
+                Logger.info(f"Tables: reloaded {tables.active().path}")
+        except tables.TableError as e:
+            Logger.error(f"Tables: {e}")
+    
     def _update_header_rect(self, instance, value):
         instance.rect.pos = instance.pos
         instance.rect.size = instance.size
+    
+    def on_stop(self):
+        """Write pending history records before exit"""
+        self.history.close()
 
 if __name__ == '__main__':
     ElectricalHelperApp().run()
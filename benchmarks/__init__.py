@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Benchmark suite for the calculation paths, parallel scaling, UI construction and memory budgets."""
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of the pure calculation paths in calculations.py"""
+
+import io
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+from calculations import (
+    INSTALLATION_AIR, INSTALLATION_GROUND, RESISTOR_COLORS, UNIT_GROUPS,
+    convert_units, current_batch, current_from_power, decode_resistor,
+    find_wire, solve_ohms_law
+)
+from design import resistor_combination
+from earthing import rod_array_design
+from energy import TARIFFS, summarize
+from export import KERNEL_FIELDS, export_rows
+from machines import motor_batch
+from reactance import frequency_sweep
+
+# Batch sizes from a single call up to 10^6 calls
+BATCH_SIZES = [1, 10, 100, 1000, 10000, 100000, 1000000]
+
+# Meters of the load profile case
+PROFILE_METERS = 10
+
+
+def _ohms_law_inputs(rng, size):
+    """Two known values out of U, I, R, P per row"""
+    rows = []
+    for _ in range(size):
+        values = [None, None, None, None]
+        for index in rng.sample(range(4), 2):
+            values[index] = rng.uniform(0.1, 1000)
+        rows.append(values)
+    return rows
+
+
+def _current_inputs(rng, size):
+    return [(rng.uniform(1, 10000), rng.choice((12, 24, 110, 230, 400))) for _ in range(size)]
+
+
+def _dirty_current_inputs(rng, size):
+    """Like _current_inputs, but about every fifth row is missing a value or divides by zero"""
+    rows = _current_inputs(rng, size)
+    for index in range(0, size, 5):
+        rows[index] = rng.choice(((None, 230), (100.0, None), (100.0, 0)))
+    return rows
+
+
+def _wire_inputs(rng, size):
+    installations = (INSTALLATION_AIR, INSTALLATION_GROUND)
+    return [(rng.uniform(1, 600), rng.choice(installations)) for _ in range(size)]
+
+
+def _resistor_inputs(rng, size):
+    names = list(RESISTOR_COLORS)
+    return [(rng.choice(names), rng.choice(names), rng.choice(names)) for _ in range(size)]
+
+
+def _conversion_inputs(rng, size):
+    rows = []
+    for _ in range(size):
+        group = rng.choice(UNIT_GROUPS)
+        rows.append((rng.uniform(0, 1000), rng.choice(group), rng.choice(group)))
+    return rows
+
+
+def _run_ohms_law(rows):
+    for voltage, current, resistance, power in rows:
+        solve_ohms_law(voltage, current, resistance, power)
+
+
+def _run_current(rows):
+    for power, voltage in rows:
+        current_from_power(power, voltage)
+
+
+def _run_current_batch(rows):
+    current_batch([power for power, _ in rows], [voltage for _, voltage in rows])
+
+
+def _run_export_csv(rows):
+    input_fields, output_fields = KERNEL_FIELDS['current']
+    with tempfile.TemporaryDirectory() as directory:
+        export_rows(os.path.join(directory, 'export.csv'), input_fields + output_fields,
+                    ((power, voltage, power / voltage) for power, voltage in rows))
+
+
+def _combination_inputs(rng, size):
+    return [10 ** rng.uniform(0, 6) for _ in range(size)]
+
+
+def _run_combination(targets):
+    for target in targets:
+        resistor_combination(target)
+
+
+def _motor_inputs(rng, size):
+    return [(rng.uniform(100, 200000), rng.choice((230, 400, 690)), rng.uniform(0.7, 0.95), rng.uniform(0.8, 0.97))
+            for _ in range(size)]
+
+
+def _run_motor_batch(rows):
+    motor_batch(*(list(column) for column in zip(*rows)))
+
+
+def _sweep_points(rng, size):
+    return size
+
+
+def _run_sweep(points):
+    frequency_sweep(10, 1e-3, 1e-6, 10, 1e6, points)
+
+
+def _run_wire(rows):
+    for current, installation in rows:
+        find_wire(current, installation)
+
+
+def _run_resistor(rows):
+    for first, second, multiplier in rows:
+        decode_resistor(first, second, multiplier)
+
+
+def _earthing_inputs(rng, size):
+    return [(rng.uniform(30, 3000), rng.uniform(1, 6), rng.uniform(1, 50), rng.uniform(1, 10))
+            for _ in range(size)]
+
+
+def _run_earthing(rows):
+    for resistivity, length, target, spacing in rows:
+        rod_array_design(resistivity, length, target, [spacing])
+
+
+def _profile_inputs(rng, size):
+    """CSV text of size one-minute samples of PROFILE_METERS meters"""
+    header = "time," + ",".join(f"meter{meter} [kW]" for meter in range(PROFILE_METERS))
+    lines = [header]
+    start = datetime(2024, 1, 1)
+    for minute in range(size):
+        timestamp = (start + timedelta(minutes=minute)).isoformat(sep=' ', timespec='minutes')
+        lines.append(timestamp + "," + ",".join(f"{rng.uniform(0, 50):.3f}" for _ in range(PROFILE_METERS)))
+    return "\n".join(lines) + "\n"
+
+
+def _run_profile(text):
+    summarize(io.StringIO(text), TARIFFS['dual'], interval=1)
+
+
+def _run_conversion(rows):
+    for value, from_unit, to_unit in rows:
+        convert_units(value, from_unit, to_unit)
+
+
+# name -> (input generator, runner)
+CASES = {
+    'ohms_law': (_ohms_law_inputs, _run_ohms_law),
+    'current_from_power': (_current_inputs, _run_current),
+    # Invalid rows are flagged, not raised, so dirty data should run as fast as clean
+    'current_batch': (_current_inputs, _run_current_batch),
+    'current_batch_dirty': (_dirty_current_inputs, _run_current_batch),
+    # Formatting cost of streaming records to CSV
+    'export_csv': (_current_inputs, _run_export_csv),
+    # A plant's motor register evaluated as columns
+    'motor_batch': (_motor_inputs, _run_motor_batch),
+    # Best one or two E24 resistors for a target, each answer should be interactive
+    'resistor_combination': (_combination_inputs, _run_combination),
+    # Every rod array layout and count for a target resistance, should update while typing
+    'rod_array_design': (_earthing_inputs, _run_earthing),
+    # Energy and time-of-use cost of a load profile, size is the number of samples
+    'energy_profile': (_profile_inputs, _run_profile),
+    # Bode response of a series RLC circuit, size is the number of points
+    'frequency_sweep': (_sweep_points, _run_sweep),
+    'find_wire': (_wire_inputs, _run_wire),
+    'decode_resistor': (_resistor_inputs, _run_resistor),
+    'convert_units': (_conversion_inputs, _run_conversion),
+}
+
+
+# Largest batch size of cases too slow per call for a million calls
+CASE_MAX_SIZES = {'resistor_combination': 10000, 'rod_array_design': 10000, 'energy_profile': 100000}
+
+
+def run(timer, max_size=BATCH_SIZES[-1], seed=0):
+    """Time every calculation case at every batch size up to max_size"""
+    results = {}
+    for name, (make_inputs, runner) in CASES.items():
+        for size in BATCH_SIZES:
+            if size > min(max_size, CASE_MAX_SIZES.get(name, max_size)):
+                break
+            rows = make_inputs(random.Random(seed), size)
+            stats = timer(lambda: runner(rows), repeat=3 if size >= 100000 else 7)
+            stats['per_call_ns'] = stats['median'] / size * 1e9
+            results[f"calc.{name}.n{size}"] = stats
+    return results
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Scaling of parallel.run with the number of worker processes.
+
+Every worker count from 1 up to the number of CPUs (doubling) runs the same
+voltage-drop job. speedup is against one worker, efficiency is the speedup
+per worker; near-linear scaling keeps efficiency close to 1.
+"""
+
+import os
+import random
+
+from parallel import run as run_parallel
+
+ROWS = 2000000
+
+
+def _inputs(rng, size):
+    currents = [rng.uniform(1, 100) for _ in range(size)]
+    lengths = [rng.uniform(1, 200) for _ in range(size)]
+    cross_sections = [rng.choice((1.5, 2.5, 4, 6, 10)) for _ in range(size)]
+    return [currents, lengths, cross_sections]
+
+
+def _worker_counts():
+    counts = []
+    count = 1
+    while count < (os.cpu_count() or 1):
+        counts.append(count)
+        count *= 2
+    return counts + [os.cpu_count() or 1]
+
+
+def run(timer, rows=ROWS, seed=0):
+    """Time the voltage-drop job at every worker count"""
+    columns = _inputs(random.Random(seed), rows)
+    results = {}
+    single = None
+    for workers in _worker_counts():
+        stats = timer(lambda: run_parallel('voltage_drop', columns, workers=workers), repeat=3)
+        single = single or stats['median']
+        stats['speedup'] = single / stats['median']
+        stats['efficiency'] = stats['speedup'] / workers
+        results[f"parallel.voltage_drop.w{workers}"] = stats
+    return results
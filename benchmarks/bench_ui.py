@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of tab construction time and widget counts.
+
+Needs a Kivy window. On a machine without a display run the suite under a
+virtual framebuffer, e.g. ``xvfb-run -a python -m benchmarks.run --suite ui``.
+"""
+
+import os
+import subprocess
+import sys
+
+# Keep Kivy from parsing our command line and from logging every widget
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+os.environ.setdefault('KIVY_NO_FILELOG', '1')
+
+# Symbol catalogue sizes for SymbolsTab
+CATALOGUE_SIZES = [200, 2000, 20000]
+
+
+def _synthetic_catalogue(size):
+    return {i: f"Značka {i} (syntetická)" for i in range(1, size + 1)}
+
+
+def _widget_count(widget):
+    return sum(1 for _ in widget.walk(restrict=True))
+
+
+def _import_app():
+    # A fresh interpreter, so the cost of every module imported at startup counts
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, '-c', 'import app'], cwd=root, check=True)
+
+
+def run(timer):
+    """Time app import and construction of every tab class, record widget counts"""
+    import app
+
+    results = {'ui.import_app': timer(_import_app, repeat=5)}
+    cases = {}
+    for size in CATALOGUE_SIZES:
+        catalogue = _synthetic_catalogue(size)
+        cases[f"ui.SymbolsTab.n{size}"] = (lambda catalogue=catalogue: app.SymbolsTab(catalogue), 3)
+    for tab_class in (app.ResistorColorCodeTab, app.PowerCalculatorTab, app.WireTableTab,
+                      app.UnitConverterTab, app.OhmsLawTab):
+        cases[f"ui.{tab_class.__name__}"] = (tab_class, 7)
+
+    for name, (factory, repeat) in cases.items():
+        built = [None]
+
+        def construct(factory=factory, built=built):
+            # Keep only the latest tab alive so large catalogues don't pile up
+            built[0] = None
+            built[0] = factory()
+
+        stats = timer(construct, repeat=repeat)
+        stats['widgets'] = _widget_count(built[0])
+        results[name] = stats
+    return results
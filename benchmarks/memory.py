@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""Memory footprint of every tab, checked against budgets.
+
+For each tab class the report has the widget count, the bytes of the
+textures its canvases draw and the Python heap growth measured with
+tracemalloc, once after construction and once after a scripted round of
+typical use. A tab fails when a measurement exceeds its budget in
+memory_budgets.json ("default" applies to tabs without an entry).
+
+Usage (from the repository root, needs a Kivy window like the ui suite):
+
+    python -m benchmarks.memory
+    python -m benchmarks.memory --tab SymbolsTab --output memory.json
+
+Exits with status 1 when a budget is exceeded.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+# Keep Kivy from parsing our command line and from logging every widget
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+os.environ.setdefault('KIVY_NO_FILELOG', '1')
+
+DEFAULT_BUDGETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'memory_budgets.json')
+
+# Window of a small phone, textures scale with it
+WINDOW_SIZE = (480, 800)
+
+# Values typed into every text input of a tab during the use phase
+SAMPLE_INPUTS = ['230', '2300', '0,5', '12', '1e6', '']
+
+# How many times the use phase opens and closes the symbol image popup
+MODAL_OPENS = 10
+
+# Memory of a texture per pixel, by colour format
+_BYTES_PER_PIXEL = {'rgba': 4, 'bgra': 4, 'rgb': 3, 'bgr': 3,
+                    'luminance_alpha': 2, 'luminance': 1, 'alpha': 1}
+
+MEASUREMENTS = ('widgets', 'texture_bytes', 'heap_bytes')
+
+
+def _frames(count=3):
+    """Let Kivy run layouts and render pending textures"""
+    from kivy.clock import Clock
+    for _ in range(count):
+        Clock.tick()
+
+
+def _canvas_textures(canvas, found):
+    for instruction in canvas.children:
+        texture = getattr(instruction, 'texture', None)
+        if texture is not None:
+            # A region shares the memory of the texture it was cut from
+            texture = getattr(texture, 'owner', None) or texture
+            found[texture.id] = texture.width * texture.height * _BYTES_PER_PIXEL.get(texture.colorfmt, 4)
+        if hasattr(instruction, 'children'):
+            _canvas_textures(instruction, found)
+
+
+def _window_usage():
+    """(widget count, texture bytes) of everything on the window"""
+    from kivy.core.window import Window
+
+    widgets = 0
+    textures = {}
+    for root in Window.children:
+        for widget in root.walk(restrict=True):
+            widgets += 1
+            for canvas in (widget.canvas.before, widget.canvas, widget.canvas.after):
+                _canvas_textures(canvas, textures)
+    return widgets, sum(textures.values())
+
+
+def _measure(base):
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot()
+    widgets, texture_bytes = _window_usage()
+    growth = snapshot.compare_to(base, 'lineno')
+    return {
+        'widgets': widgets,
+        'texture_bytes': texture_bytes,
+        'heap_bytes': sum(stat.size_diff for stat in growth),
+        'top_allocations': [f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} {stat.size_diff}"
+                            for stat in growth[:5]],
+    }
+
+
+def _type_inputs(tab):
+    """Type sample values into every text input and cycle every spinner"""
+    from kivy.uix.spinner import Spinner
+    from kivy.uix.textinput import TextInput
+    import app
+
+    widgets = list(tab.walk(restrict=True))
+    for widget in widgets:
+        if isinstance(widget, TextInput):
+            values = SAMPLE_INPUTS
+        elif isinstance(widget, Spinner):
+            values = widget.values
+        else:
+            continue
+        for value in values:
+            widget.text = value
+            if isinstance(tab, app.LiveRecalculation):
+                # Run the debounced recalculation now instead of waiting for it
+                tab._recalculate_live(0)
+            elif isinstance(tab, app.ResistorColorCodeTab):
+                tab.calculate_resistor(None)
+            _frames(1)
+
+
+def _use_symbols(tab):
+    from kivy.core.window import Window
+    from kivy.uix.modalview import ModalView
+    import app
+
+    for _ in range(2):
+        for index in range(len(tab.section_titles)):
+            tab.jump_to_section(index)
+            _frames(1)
+        tab.toggle_sort_mode(None)
+        _frames()
+
+    item = next(widget for widget in tab.walk(restrict=True) if isinstance(widget, app.SymbolItem))
+    for _ in range(MODAL_OPENS):
+        item._show_enlarged_image(None)
+        _frames()
+        for widget in list(Window.children):
+            if isinstance(widget, ModalView):
+                widget.dismiss(animation=False)
+        _frames()
+
+
+def _use_wire_table(tab):
+    for index in range(len(tab.wire_data)):
+        tab.show_wire_row(None, index)
+        _frames(1)
+    _type_inputs(tab)
+
+
+def _use_load_schedule(tab):
+    phases = tab.phase.values
+    for i in range(500):
+        tab.inputs['power'].text = str(100 + i)
+        tab.phase.text = phases[i % len(phases)]
+        tab.save_load(None)
+    _frames()
+    for load_id in range(0, 500, 5):
+        tab.select_load(load_id)
+        tab.remove_load(None)
+    _frames()
+
+
+def _use_history(tab):
+    for step in (tab.PAGE_SIZE, tab.PAGE_SIZE, -tab.PAGE_SIZE, 0):
+        tab.move_page(step)
+        _frames(1)
+
+
+def _tab_cases(history):
+    """Tab name -> (factory, use) for every tab of the app"""
+    import app
+
+    return {
+        'SymbolsTab': (lambda: app.SymbolsTab(app.SymbolCatalogue()), _use_symbols),
+        'UnitConverterTab': (app.UnitConverterTab, _type_inputs),
+        'ResistorColorCodeTab': (app.ResistorColorCodeTab, _type_inputs),
+        'PowerCalculatorTab': (app.PowerCalculatorTab, _type_inputs),
+        'WireTableTab': (app.WireTableTab, _use_wire_table),
+        'OhmsLawTab': (app.OhmsLawTab, _type_inputs),
+        'ReactanceTab': (app.ReactanceTab, _type_inputs),
+        'DesignTab': (app.DesignTab, _type_inputs),
+        'MachinesTab': (app.MachinesTab, _type_inputs),
+        'EarthingTab': (app.EarthingTab, _type_inputs),
+        'LoadScheduleTab': (app.LoadScheduleTab, _use_load_schedule),
+        'EnergyTab': (app.EnergyTab, _type_inputs),
+        'HistoryTab': (lambda: app.HistoryTab(history), _use_history),
+    }
+
+
+def measure_tab(factory, use):
+    """Measurements of a tab after construction ('built') and after use ('used')"""
+    from kivy.core.window import Window
+
+    gc.collect()
+    base = tracemalloc.take_snapshot()
+    tab = factory()
+    Window.add_widget(tab)
+    _frames()
+    built = _measure(base)
+    use(tab)
+    _frames()
+    used = _measure(base)
+    Window.remove_widget(tab)
+    return {'built': built, 'used': used}
+
+
+def check_budgets(report, budgets):
+    """List of messages for measurements over their budget"""
+    overruns = []
+    for name, phases in sorted(report.items()):
+        budget = budgets.get(name, budgets.get('default', {}))
+        for phase, values in phases.items():
+            for measurement in MEASUREMENTS:
+                limit = budget.get(measurement)
+                if limit is not None and values[measurement] > limit:
+                    overruns.append(f"{name} ({phase}): {measurement} {values[measurement]} > {limit}")
+    return overruns
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budgets', default=DEFAULT_BUDGETS, help="JSON file with the budgets")
+    parser.add_argument('--tab', action='append', help="measure only this tab class (repeatable)")
+    parser.add_argument('--output', help="write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    with open(args.budgets, encoding='utf-8') as f:
+        budgets = json.load(f)
+
+    from kivy.core.window import Window
+    from history import CalculationHistory
+
+    Window.size = WINDOW_SIZE
+    tracemalloc.start()
+
+    with tempfile.TemporaryDirectory() as directory:
+        history = CalculationHistory(directory)
+        for i in range(1000):
+            history.append('power', f"{i} W, 230 V", f"Prúd: {i / 230:.2f} A")
+        history.flush()
+
+        cases = _tab_cases(history)
+        report = {}
+        for name, (factory, use) in cases.items():
+            if args.tab and name not in args.tab:
+                continue
+            report[name] = measure_tab(factory, use)
+        history.close()
+
+    tracemalloc.stop()
+
+    for name, phases in report.items():
+        for phase, values in phases.items():
+            print(f"{name:22s} {phase:5s} {values['widgets']:6d} widgets "
+                  f"{values['texture_bytes'] / 1024:10.1f} KiB textures "
+                  f"{values['heap_bytes'] / 1024:10.1f} KiB heap")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    overruns = check_budgets(report, budgets)
+    for message in overruns:
+        print(f"OVER BUDGET {message}")
+    return 1 if overruns else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
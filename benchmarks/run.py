@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Run the benchmark suite, save the results as JSON and compare to a baseline.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --output new.json --baseline bench.json
+
+Exits with status 1 when a benchmark is slower than the baseline by more
+than the tolerance or a tab builds more widgets than before.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+
+
+def timer(func, repeat=5):
+    """Time repeated calls of func, return statistics in seconds"""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'max': max(samples),
+        'repeat': repeat,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """List of regression messages of results against baseline"""
+    regressions = []
+    for name, stats in sorted(results.items()):
+        old = baseline.get(name)
+        if old is None:
+            continue
+        if stats['median'] > old['median'] * (1 + tolerance):
+            regressions.append(
+                f"{name}: {stats['median'] * 1000:.3f} ms vs "
+                f"{old['median'] * 1000:.3f} ms baseline "
+                f"(+{(stats['median'] / old['median'] - 1) * 100:.0f} %)"
+            )
+        if 'widgets' in stats and 'widgets' in old and stats['widgets'] > old['widgets']:
+            regressions.append(f"{name}: {stats['widgets']} widgets vs {old['widgets']} baseline")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--suite', choices=['calc', 'ui', 'parallel', 'all'], default='all')
+    parser.add_argument('--max-size', type=int, default=1000000,
+                        help="largest batch size of the calculation benchmarks")
+    parser.add_argument('--output', help="write results to this JSON file")
+    parser.add_argument('--baseline', help="compare against this JSON file")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed slowdown against the baseline (0.2 = 20 %%)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    if args.suite in ('calc', 'all'):
+        from benchmarks import bench_calculations
+        results.update(bench_calculations.run(timer, max_size=args.max_size))
+    if args.suite in ('ui', 'all'):
+        from benchmarks import bench_ui
+        results.update(bench_ui.run(timer))
+    if args.suite in ('parallel', 'all'):
+        from benchmarks import bench_parallel
+        results.update(bench_parallel.run(timer))
+
+    for name, stats in sorted(results.items()):
+        extra = f"  {stats['widgets']} widgets" if 'widgets' in stats else ''
+        if 'speedup' in stats:
+            extra = f"  {stats['speedup']:.2f}x speedup, {stats['efficiency']:.0%} efficiency"
+        print(f"{name:40s} {stats['median'] * 1000:12.3f} ms{extra}")
+
+    if args.output:
+        report = {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -15,6 +15,17 @@ source.dir = .
 # <--- DÔLEŽITÉ: Uistite sa, že toto je správny názov vášho súboru!
 source.main_py = main.py
 
+# (list) Source files to include, symbol images ship inside resources.zip
+# (build it with: python image_variants.py images && python resources.py resources.zip images)
+source.include_exts = py,png,bin,zip,json
+
+# (list) Directories and files not needed on the device
+source.exclude_dirs = benchmarks, tests, images, __pycache__
+source.exclude_patterns = prtsc_*.jpg, requests.jsonl, server.py
+
+# (bool) Ship precompiled bytecode (.pyc) instead of the .py sources
+android.no-byte-compile-python = False
+
 # (optional) Icon of the application
 # <--- ZMENA: Cesta opravená podľa vašej štruktúry
 icon.filename = %(source.dir)s/icon.png
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""Calculation functions shared by the GUI tabs and headless tools.
+
+Nothing in this module imports Kivy, so it can be used from benchmarks,
+scripts and batch jobs without creating a window.
+
+The calculators are memoized (see memo.py), repeated queries are answered
+from a bounded cache. Returned dicts and tuples are shared, don't mutate them.
+
+The *_result functions validate their inputs and return a Result with
+either a value or an error code instead of raising, the *_batch functions
+do the same for whole columns and return the values with a parallel list
+of error codes (None for valid rows).
+"""
+
+import math
+from bisect import bisect_left
+from collections import namedtuple
+
+import tables
+from memo import memoize
+
+# Installation types used by the wire ampacity table
+INSTALLATION_GROUND = 'V zemi'
+INSTALLATION_AIR = 'Vo vzduchu'
+
+# Reference tables of the active edition (see tables.py), bound by _use_tables:
+# WIRE_DATA            rows of (cross section [mm²], max current in ground [A],
+#                      max current in air [A]) as display strings
+# RESISTOR_COLORS      band colour -> {'value': digit, 'hex': colour}
+# TOLERANCE_COLORS     tolerance band colour -> tolerance [%]
+# COMMON_VOLTAGES      voltages shown in the power calculator's quick table [V]
+# THREE_PHASE_VOLTAGES line voltages of three-phase systems among them [V]
+WIRE_DATA = RESISTOR_COLORS = TOLERANCE_COLORS = COMMON_VOLTAGES = THREE_PHASE_VOLTAGES = None
+
+# Numeric current columns of the wire table, by installation, for bisecting
+_WIRE_LIMITS = {}
+
+SQRT3 = math.sqrt(3)
+
+# Resistivity of copper at 20°C [Ω·mm²/m]
+COPPER_RESISTIVITY = 0.0178
+
+# Usual limit of the voltage drop from the supply point to a consumer [%]
+VOLTAGE_DROP_LIMIT = 4
+
+# Error codes of the validated calculators
+ERROR_MISSING = 'missing'                   # input not given or not a number
+ERROR_ZERO = 'zero'                         # divisor is zero
+ERROR_NEGATIVE = 'negative'                 # input must not be negative
+ERROR_RANGE = 'range'                       # input too large, or beyond the tables
+ERROR_UNKNOWN = 'unknown'                   # unknown colour, unit or installation
+ERROR_INCOMPATIBLE = 'incompatible'         # units of different quantities
+ERROR_UNDERDETERMINED = 'underdetermined'   # too few inputs to derive the rest
+
+# Inputs beyond this magnitude are rejected, so squares and products stay finite
+MAX_INPUT = 1e150
+
+Result = namedtuple('Result', 'value error')
+
+# Conversion factors to base units
+UNIT_FACTORS = {
+    'V': 1, 'kV': 1000, 'mV': 0.001,
+    'A': 1, 'mA': 0.001, 'kA': 1000,
+    'W': 1, 'kW': 1000, 'MW': 1000000,
+    'Ω': 1, 'kΩ': 1000, 'MΩ': 1000000,
+    'Hz': 1, 'kHz': 1000, 'MHz': 1000000,
+    'Wh': 1, 'kWh': 1000, 'MWh': 1000000
+}
+
+# Groups of mutually convertible units
+UNIT_GROUPS = [
+    ['V', 'kV', 'mV'],
+    ['A', 'mA', 'kA'],
+    ['W', 'kW', 'MW'],
+    ['Ω', 'kΩ', 'MΩ'],
+    ['Hz', 'kHz', 'MHz'],
+    ['Wh', 'kWh', 'MWh']
+]
+
+# Unit -> index of its group, for a single lookup per conversion
+_UNIT_GROUP_INDEX = {unit: i for i, group in enumerate(UNIT_GROUPS) for unit in group}
+
+# Units in the order shown by the converter spinners
+UNITS = [unit for group in UNIT_GROUPS for unit in group]
+
+
+def _ohms_law_key(voltage=None, current=None, resistance=None, power=None):
+    return (voltage, current, resistance, power)
+
+
+@memoize(maxsize=4096, key=_ohms_law_key)
+def solve_ohms_law(voltage=None, current=None, resistance=None, power=None):
+    """Fill in missing U, I, R, P values from the known ones.
+
+    Returns a dict with keys 'U', 'I', 'R', 'P'; values that could not be
+    derived stay None.
+    """
+    calc_values = {'U': voltage, 'I': current, 'R': resistance, 'P': power}
+
+    for _ in range(2):
+        # U
+        if calc_values['U'] is None:
+            if calc_values['I'] is not None and calc_values['R'] is not None:
+                calc_values['U'] = calc_values['I'] * calc_values['R']
+            elif calc_values['P'] is not None and calc_values['I'] is not None and calc_values['I'] != 0:
+                calc_values['U'] = calc_values['P'] / calc_values['I']
+            elif calc_values['P'] is not None and calc_values['R'] is not None and calc_values['P'] >= 0 and calc_values['R'] >= 0:
+                calc_values['U'] = (calc_values['P'] * calc_values['R']) ** 0.5
+
+        # I
+        if calc_values['I'] is None:
+            if calc_values['U'] is not None and calc_values['R'] is not None and calc_values['R'] != 0:
+                calc_values['I'] = calc_values['U'] / calc_values['R']
+            elif calc_values['P'] is not None and calc_values['U'] is not None and calc_values['U'] != 0:
+                calc_values['I'] = calc_values['P'] / calc_values['U']
+            elif calc_values['P'] is not None and calc_values['R'] is not None and calc_values['P'] >= 0 and calc_values['R'] > 0:
+                calc_values['I'] = (calc_values['P'] / calc_values['R']) ** 0.5
+
+        # R
+        if calc_values['R'] is None:
+            if calc_values['U'] is not None and calc_values['I'] is not None and calc_values['I'] != 0:
+                calc_values['R'] = calc_values['U'] / calc_values['I']
+            elif calc_values['P'] is not None and calc_values['I'] is not None and calc_values['I'] != 0:
+                calc_values['R'] = calc_values['P'] / (calc_values['I'] ** 2)
+            elif calc_values['P'] is not None and calc_values['U'] is not None and calc_values['P'] != 0:
+                calc_values['R'] = (calc_values['U'] ** 2) / calc_values['P']
+
+        # P
+        if calc_values['P'] is None:
+            if calc_values['U'] is not None and calc_values['I'] is not None:
+                calc_values['P'] = calc_values['U'] * calc_values['I']
+            elif calc_values['I'] is not None and calc_values['R'] is not None:
+                calc_values['P'] = (calc_values['I'] ** 2) * calc_values['R']
+            elif calc_values['U'] is not None and calc_values['R'] is not None and calc_values['R'] != 0:
+                calc_values['P'] = (calc_values['U'] ** 2) / calc_values['R']
+
+    return calc_values
+
+
+def current_from_power(power, voltage, three_phase=False):
+    """Current [A] drawn by a load of given power [W] at given voltage [V]
+
+    For a three-phase load voltage is the line voltage and the current is
+    P / (√3 U).
+    """
+    if three_phase:
+        return power / (SQRT3 * voltage)
+    return power / voltage
+
+
+@memoize(maxsize=4096)
+def format_current(current):
+    """Format current in A, or in mA below 1 A"""
+    if current >= 1:
+        return f"{current:.2f} A"
+    return f"{current*1000:.4g} mA"
+
+
+@memoize(maxsize=1024, key=lambda power, voltages=None: (power, voltages and tuple(voltages)))
+def voltage_table(power, voltages=None):
+    """Tuple of (voltage, current) pairs for a load at common voltages
+
+    voltages defaults to COMMON_VOLTAGES. Voltages in THREE_PHASE_VOLTAGES
+    are treated as three-phase supplies.
+    """
+    if voltages is None:
+        voltages = COMMON_VOLTAGES
+    return tuple((voltage, current_from_power(power, voltage, voltage in THREE_PHASE_VOLTAGES))
+                 for voltage in voltages)
+
+
+@memoize(maxsize=4096, key=lambda required_current, installation=INSTALLATION_AIR: (required_current, installation))
+def find_wire(required_current, installation=INSTALLATION_AIR):
+    """Smallest cross section [mm²] rated for the current, or None if none is"""
+    limits = _WIRE_LIMITS[installation]
+    # The table validation guarantees ascending currents
+    i = bisect_left(limits, required_current)
+    if i == len(limits):
+        return None
+    return WIRE_DATA[i][0]
+
+
+def voltage_drop(current, length, cross_section, three_phase=False, resistivity=COPPER_RESISTIVITY):
+    """Voltage drop [V] along a cable of given length [m] and cross section [mm²]
+
+    A single-phase circuit has the drop of both conductors, 2 I R; for a
+    three-phase circuit it is the drop of the line voltage, √3 I R.
+    """
+    resistance = resistivity * length / cross_section
+    if three_phase:
+        return SQRT3 * current * resistance
+    return 2 * current * resistance
+
+
+@memoize(maxsize=1024)
+def decode_resistor(first, second, multiplier):
+    """Resistance [Ω] from the colour names of the first three bands"""
+    return ((RESISTOR_COLORS[first]['value'] * 10 + RESISTOR_COLORS[second]['value'])
+            * (10 ** RESISTOR_COLORS[multiplier]['value']))
+
+
+@memoize(maxsize=1024)
+def format_resistance(resistance):
+    """Format resistance in Ω, kΩ or MΩ with up to four significant digits"""
+    if resistance >= 1000000:
+        return f"{resistance/1000000:.4g} MΩ"
+    elif resistance >= 1000:
+        return f"{resistance/1000:.4g} kΩ"
+    return f"{resistance:.4g} Ω"
+
+
+@memoize(maxsize=4096)
+def convert_units(value, from_unit, to_unit):
+    """Convert value between units of the same quantity.
+
+    Returns None when the units are not compatible.
+    """
+    if _UNIT_GROUP_INDEX[from_unit] != _UNIT_GROUP_INDEX[to_unit]:
+        return None
+    return value * UNIT_FACTORS[from_unit] / UNIT_FACTORS[to_unit]
+
+
+def _number_error(value):
+    """Error code for an unusable numeric input, or None"""
+    if value is None:
+        return ERROR_MISSING
+    if not -MAX_INPUT <= value <= MAX_INPUT:
+        # Also true for NaN
+        return ERROR_RANGE
+    return None
+
+
+def _finite_result(value):
+    """Result of a computed value, ERROR_RANGE if it overflowed"""
+    if not -math.inf < value < math.inf:
+        # Also true for NaN
+        return Result(None, ERROR_RANGE)
+    return Result(value, None)
+
+
+def current_result(power, voltage, three_phase=False):
+    """Result of current_from_power with validated inputs"""
+    error = _number_error(power) or _number_error(voltage)
+    if error is not None:
+        return Result(None, error)
+    if voltage == 0:
+        return Result(None, ERROR_ZERO)
+    return _finite_result(current_from_power(power, voltage, three_phase))
+
+
+def wire_result(required_current, installation=INSTALLATION_AIR):
+    """Result of find_wire with validated inputs, ERROR_RANGE above 300 mm²"""
+    error = _number_error(required_current)
+    if error is not None:
+        return Result(None, error)
+    if required_current < 0:
+        return Result(None, ERROR_NEGATIVE)
+    if installation not in _WIRE_LIMITS:
+        return Result(None, ERROR_UNKNOWN)
+    cross_section = find_wire(required_current, installation)
+    if cross_section is None:
+        return Result(None, ERROR_RANGE)
+    return Result(cross_section, None)
+
+
+def voltage_drop_result(current, length, cross_section, three_phase=False, resistivity=COPPER_RESISTIVITY):
+    """Result of voltage_drop with validated inputs"""
+    error = _number_error(current) or _number_error(length) or _number_error(cross_section)
+    if error is not None:
+        return Result(None, error)
+    if current < 0 or length < 0 or cross_section < 0:
+        return Result(None, ERROR_NEGATIVE)
+    if cross_section == 0:
+        return Result(None, ERROR_ZERO)
+    return _finite_result(voltage_drop(current, length, cross_section, three_phase, resistivity))
+
+
+def resistor_result(first, second, multiplier):
+    """Result of decode_resistor, ERROR_UNKNOWN for unknown colours"""
+    if first not in RESISTOR_COLORS or second not in RESISTOR_COLORS or multiplier not in RESISTOR_COLORS:
+        return Result(None, ERROR_UNKNOWN)
+    return Result(decode_resistor(first, second, multiplier), None)
+
+
+def conversion_result(value, from_unit, to_unit):
+    """Result of convert_units with validated inputs"""
+    error = _number_error(value)
+    if error is not None:
+        return Result(None, error)
+    if from_unit not in UNIT_FACTORS or to_unit not in UNIT_FACTORS:
+        return Result(None, ERROR_UNKNOWN)
+    converted = convert_units(value, from_unit, to_unit)
+    if converted is None:
+        return Result(None, ERROR_INCOMPATIBLE)
+    return _finite_result(converted)
+
+
+def ohms_law_result(voltage=None, current=None, resistance=None, power=None):
+    """Result of solve_ohms_law with validated inputs
+
+    ERROR_MISSING when fewer than two values are given. When they don't
+    determine all four the error is ERROR_UNDERDETERMINED and the value
+    holds the values that could be derived.
+    """
+    known = 0
+    for value in (voltage, current, resistance, power):
+        if value is not None:
+            if _number_error(value) is not None:
+                return Result(None, ERROR_RANGE)
+            known += 1
+    if known < 2:
+        return Result(None, ERROR_MISSING)
+    try:
+        values = solve_ohms_law(voltage, current, resistance, power)
+    except OverflowError:
+        # A square of a derived value, like U² from U = I R
+        return Result(None, ERROR_RANGE)
+    if any(value is not None and not -math.inf < value < math.inf for value in values.values()):
+        # E.g. R = U² / P for a tiny power
+        return Result(None, ERROR_RANGE)
+    if None in values.values():
+        return Result(values, ERROR_UNDERDETERMINED)
+    return Result(values, None)
+
+
+def current_batch(powers, voltages, three_phase=False):
+    """(currents, errors) for paired columns of powers and voltages
+
+    Invalid rows get None in currents and an error code in errors.
+    """
+    scale = SQRT3 if three_phase else 1
+    currents = []
+    errors = []
+    add_current = currents.append
+    add_error = errors.append
+    # The checks of _number_error and current_result, inlined for the batch
+    for power, voltage in zip(powers, voltages):
+        if power is None or voltage is None:
+            error = ERROR_MISSING
+        elif not (-MAX_INPUT <= power <= MAX_INPUT and -MAX_INPUT <= voltage <= MAX_INPUT):
+            error = ERROR_RANGE
+        elif voltage == 0:
+            error = ERROR_ZERO
+        else:
+            current = power / (scale * voltage)
+            if -math.inf < current < math.inf:
+                add_current(current)
+                add_error(None)
+                continue
+            error = ERROR_RANGE
+        add_current(None)
+        add_error(error)
+    return currents, errors
+
+
+def wire_batch(currents, installation=INSTALLATION_AIR):
+    """(cross sections, errors) for a column of currents"""
+    results = [wire_result(current, installation) for current in currents]
+    return [result.value for result in results], [result.error for result in results]
+
+
+def voltage_drop_batch(currents, lengths, cross_sections, three_phase=False,
+                       resistivity=COPPER_RESISTIVITY):
+    """(voltage drops, errors) for paired columns of currents, lengths and cross sections"""
+    scale = (SQRT3 if three_phase else 2) * resistivity
+    drops = []
+    errors = []
+    add_drop = drops.append
+    add_error = errors.append
+    # The checks of voltage_drop_result, inlined for the batch
+    for current, length, cross_section in zip(currents, lengths, cross_sections):
+        if current is None or length is None or cross_section is None:
+            error = ERROR_MISSING
+        elif not (-MAX_INPUT <= current <= MAX_INPUT and -MAX_INPUT <= length <= MAX_INPUT
+                  and -MAX_INPUT <= cross_section <= MAX_INPUT):
+            error = ERROR_RANGE
+        elif current < 0 or length < 0 or cross_section < 0:
+            error = ERROR_NEGATIVE
+        elif cross_section == 0:
+            error = ERROR_ZERO
+        else:
+            drop = scale * current * length / cross_section
+            if drop < math.inf:
+                add_drop(drop)
+                add_error(None)
+                continue
+            error = ERROR_RANGE
+        add_drop(None)
+        add_error(error)
+    return drops, errors
+
+
+def conversion_batch(values, from_unit, to_unit):
+    """(converted values, errors) for a column of values in one unit"""
+    if from_unit not in UNIT_FACTORS or to_unit not in UNIT_FACTORS:
+        return [None] * len(values), [ERROR_UNKNOWN] * len(values)
+    if _UNIT_GROUP_INDEX[from_unit] != _UNIT_GROUP_INDEX[to_unit]:
+        return [None] * len(values), [ERROR_INCOMPATIBLE] * len(values)
+    # One factor for the whole column instead of a lookup per value
+    factor = UNIT_FACTORS[from_unit] / UNIT_FACTORS[to_unit]
+    converted = []
+    errors = []
+    for value in values:
+        error = _number_error(value)
+        converted.append(None if error else value * factor)
+        errors.append(error)
+    return converted, errors
+
+
+def _use_tables(active):
+    """Bind the reference tables of an edition and drop results cached from the previous one"""
+    global WIRE_DATA, RESISTOR_COLORS, TOLERANCE_COLORS, COMMON_VOLTAGES, THREE_PHASE_VOLTAGES, _WIRE_LIMITS
+    WIRE_DATA = active.wire_rows
+    RESISTOR_COLORS = active.resistor_colors
+    TOLERANCE_COLORS = active.tolerance_colors
+    COMMON_VOLTAGES = active.voltages
+    THREE_PHASE_VOLTAGES = active.three_phase_voltages
+    _WIRE_LIMITS = {INSTALLATION_GROUND: active.ground_limits, INSTALLATION_AIR: active.air_limits}
+    for func in (voltage_table, find_wire, decode_resistor):
+        func.cache.clear()
+
+
+_use_tables(tables.active())
+tables.on_change(_use_tables)
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Design of LED series resistors, Zener regulators and voltage dividers.
+
+Like calculations.py this module doesn't import Kivy. Resistors are
+picked from a standard E series, or from the values actually in stock,
+held as a sorted table that is searched with bisect. Two-resistor
+combinations look up the ideal partner of every value in the table, so a
+search costs O(n log n) for n values instead of trying all n² pairs.
+"""
+
+from bisect import bisect_left
+from collections import namedtuple
+
+from calculations import (
+    ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE, ERROR_UNKNOWN, ERROR_ZERO, MAX_INPUT, Result
+)
+from memo import memoize
+
+# Significant values of the standard resistor series (IEC 60063) in one decade
+E_SERIES = {
+    'E6': (1.0, 1.5, 2.2, 3.3, 4.7, 6.8),
+    'E12': (1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2),
+    'E24': (1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0,
+            3.3, 3.6, 3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2, 9.1),
+}
+
+# Tolerance of the series [%]
+E_TOLERANCES = {'E6': 20, 'E12': 10, 'E24': 5}
+
+# Decades the series tables cover: 1 Ω to 9.1 MΩ
+DECADES = range(0, 7)
+
+# Power ratings of resistors and Zener diodes [W]
+RESISTOR_POWER_RATINGS = (0.125, 0.25, 0.5, 1, 2, 3, 5, 10)
+ZENER_POWER_RATINGS = (0.25, 0.5, 1, 1.3, 3, 5)
+
+# A part should dissipate at most this fraction of its power rating
+POWER_DERATING = 0.5
+
+# Smallest current keeping a Zener diode in regulation, as a fraction of the load current
+ZENER_MIN_CURRENT_FRACTION = 0.1
+
+Combination = namedtuple('Combination', 'resistance values connection error')
+
+
+@memoize(maxsize=16)
+def series_values(series='E24'):
+    """Sorted tuple of all values [Ω] of a series over DECADES"""
+    return tuple(sorted(round(value * 10 ** decade, 2) for decade in DECADES for value in E_SERIES[series]))
+
+
+def resistor_values(series='E24', stock=None):
+    """Sorted tuple of the values to design with, stock overrides the series"""
+    if stock is not None:
+        return tuple(sorted(set(stock)))
+    return series_values(series)
+
+
+def nearest(values, target, direction=0):
+    """Value of a sorted table nearest to target, or None
+
+    direction 1 only accepts values >= target, -1 values <= target.
+    """
+    i = bisect_left(values, target)
+    above = values[i] if i < len(values) else None
+    if i < len(values) and values[i] == target:
+        return target
+    below = values[i - 1] if i > 0 else None
+    if direction > 0:
+        return above
+    if direction < 0:
+        return below
+    if above is None:
+        return below
+    if below is None:
+        return above
+    # Nearest on a log scale, as the series are spaced
+    return above if above / target < target / below else below
+
+
+def power_rating(power, ratings=RESISTOR_POWER_RATINGS):
+    """Smallest rating [W] that dissipates power within POWER_DERATING, or None"""
+    for rating in ratings:
+        if power <= rating * POWER_DERATING:
+            return rating
+    return None
+
+
+def best_combination(target, values):
+    """Combination of one or two values closest to target [Ω]
+
+    Tries every single value and, for every value, its ideal series and
+    parallel partner found by bisect. error is the relative deviation.
+    """
+    best = None
+
+    def consider(resistance, parts, connection):
+        nonlocal best
+        error = abs(resistance - target) / target
+        if best is None or error < best.error:
+            best = Combination(resistance, parts, connection, error)
+
+    single = nearest(values, target)
+    if single is not None:
+        consider(single, (single,), 'single')
+    for value in values:
+        if value < target:
+            partner = nearest(values, target - value)
+            if partner is not None:
+                consider(value + partner, (value, partner), 'series')
+        elif value > target:
+            # 1/target = 1/value + 1/partner
+            partner = nearest(values, target * value / (value - target))
+            if partner is not None:
+                consider(value * partner / (value + partner), (value, partner), 'parallel')
+        if best is not None and best.error == 0:
+            break
+    return best
+
+
+def _check(*values):
+    """Error code of unusable inputs, all of which must be positive"""
+    for value in values:
+        if value is None:
+            return ERROR_MISSING
+        if not -MAX_INPUT <= value <= MAX_INPUT:
+            return ERROR_RANGE
+        if value < 0:
+            return ERROR_NEGATIVE
+        if value == 0:
+            return ERROR_ZERO
+    return None
+
+
+def led_resistor(supply, forward_voltage, current, count=1, series='E24', stock=None):
+    """Result with the series resistor of count LEDs in series
+
+    The resistor is the nearest available value not below the ideal one,
+    so the LED current stays at or under current [A]. The dict has
+    'ideal', 'resistance', 'current', 'power', 'rating' and 'led_power'.
+    ERROR_RANGE when the supply doesn't exceed the LEDs' forward voltage
+    or count isn't a whole number.
+    """
+    error = _check(supply, forward_voltage, current, count)
+    if error is not None:
+        return Result(None, error)
+    if count != int(count):
+        return Result(None, ERROR_RANGE)
+    if series not in E_SERIES and stock is None:
+        return Result(None, ERROR_UNKNOWN)
+    headroom = supply - count * forward_voltage
+    if headroom <= 0:
+        return Result(None, ERROR_RANGE)
+    ideal = headroom / current
+    resistance = nearest(resistor_values(series, stock), ideal, 1)
+    if resistance is None:
+        return Result(None, ERROR_RANGE)
+    actual = headroom / resistance
+    power = actual ** 2 * resistance
+    return Result({
+        'ideal': ideal,
+        'resistance': resistance,
+        'current': actual,
+        'power': power,
+        'rating': power_rating(power),
+        'led_power': actual * forward_voltage,
+    }, None)
+
+
+def zener_regulator(supply_min, supply_max, zener_voltage, load_current, series='E24', stock=None,
+                    min_zener_current=None):
+    """Result with the series resistor and ratings of a Zener shunt regulator
+
+    The resistor is the nearest available value not above the ideal one,
+    so at supply_min the diode still gets min_zener_current [A] (by default
+    ZENER_MIN_CURRENT_FRACTION of the load current, at least 1 mA). The
+    worst case for both parts is supply_max with the load disconnected.
+    The dict has 'ideal', 'resistance', 'resistor_power', 'resistor_rating',
+    'zener_power' and 'zener_rating'.
+    """
+    error = _check(supply_min, supply_max, zener_voltage)
+    if error is not None:
+        return Result(None, error)
+    # The load may be disconnected, so zero is a valid load current
+    if load_current is None:
+        return Result(None, ERROR_MISSING)
+    if not 0 <= load_current <= MAX_INPUT:
+        return Result(None, ERROR_NEGATIVE if load_current < 0 else ERROR_RANGE)
+    if series not in E_SERIES and stock is None:
+        return Result(None, ERROR_UNKNOWN)
+    if supply_max < supply_min or supply_min <= zener_voltage:
+        return Result(None, ERROR_RANGE)
+    if min_zener_current is None:
+        min_zener_current = max(0.001, load_current * ZENER_MIN_CURRENT_FRACTION)
+    ideal = (supply_min - zener_voltage) / (load_current + min_zener_current)
+    resistance = nearest(resistor_values(series, stock), ideal, -1)
+    if resistance is None:
+        return Result(None, ERROR_RANGE)
+    worst_current = (supply_max - zener_voltage) / resistance
+    resistor_power = worst_current ** 2 * resistance
+    zener_power = worst_current * zener_voltage
+    return Result({
+        'ideal': ideal,
+        'resistance': resistance,
+        'resistor_power': resistor_power,
+        'resistor_rating': power_rating(resistor_power),
+        'zener_power': zener_power,
+        'zener_rating': power_rating(zener_power, ZENER_POWER_RATINGS),
+    }, None)
+
+
+def voltage_divider(supply, output, total=None, series='E24', stock=None):
+    """Result with the resistors of an unloaded divider from supply to output [V]
+
+    For every available R2 the ideal R1 = R2 (supply / output - 1) is looked
+    up by bisect, the pair with the output closest to the target wins. With
+    total [Ω], only pairs within a factor of two of it are considered. The
+    dict has 'r1', 'r2', 'output', 'error' (relative), 'current' and
+    'power' (of R1 and R2 together).
+    """
+    error = _check(supply, output)
+    if error is None and total is not None:
+        error = _check(total)
+    if error is not None:
+        return Result(None, error)
+    if output >= supply:
+        return Result(None, ERROR_RANGE)
+    if series not in E_SERIES and stock is None:
+        return Result(None, ERROR_UNKNOWN)
+    values = resistor_values(series, stock)
+    ratio = supply / output - 1
+    best = None
+    for r2 in values:
+        r1 = nearest(values, r2 * ratio)
+        if r1 is None:
+            continue
+        if total is not None and not total / 2 <= r1 + r2 <= total * 2:
+            continue
+        actual = supply * r2 / (r1 + r2)
+        deviation = abs(actual - output) / output
+        if best is None or deviation < best[0]:
+            best = (deviation, r1, r2, actual)
+    if best is None:
+        return Result(None, ERROR_RANGE)
+    deviation, r1, r2, actual = best
+    current = supply / (r1 + r2)
+    return Result({
+        'r1': r1,
+        'r2': r2,
+        'output': actual,
+        'error': deviation,
+        'current': current,
+        'power': supply * current,
+    }, None)
+
+
+def resistor_combination(target, series='E24', stock=None):
+    """Result with the best Combination of at most two resistors for target [Ω]
+
+    ERROR_RANGE when no combination is within the tolerance of the series,
+    for stock values that of E24.
+    """
+    error = _check(target)
+    if error is not None:
+        return Result(None, error)
+    if series not in E_SERIES and stock is None:
+        return Result(None, ERROR_UNKNOWN)
+    values = resistor_values(series, stock)
+    if not values:
+        return Result(None, ERROR_MISSING)
+    best = best_combination(target, values)
+    if best.error * 100 > E_TOLERANCES.get(series, E_TOLERANCES['E24']):
+        return Result(None, ERROR_RANGE)
+    return Result(best, None)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Resistance of earth electrodes: rods, plates, strips and rod arrays.
+
+Like calculations.py this module doesn't import Kivy. Soil resistivity is
+in Ωm, dimensions in m, resistances in Ω.
+
+Rods in parallel interfere: each raises the soil potential around the
+others. Following BS 7430, n rods of resistance R at spacing s give
+
+    R_n = R (1 + λ α) / n,    α = ρ / (2π R s)
+
+where the interference coefficient λ depends only on the layout and n. It
+is the mean over the rods of Σ s / d over the other rods at distance d,
+which reproduces the tabulated values of the standard for rods in line.
+interference_table() computes λ for every rod count of a layout once;
+the solvers then only index the table.
+"""
+
+import math
+from collections import namedtuple
+
+from calculations import ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE, ERROR_UNKNOWN, ERROR_ZERO, MAX_INPUT, Result
+from memo import memoize
+
+# Rod layouts and the rod counts their tables cover
+LAYOUTS = {
+    'line': range(1, 101),
+    # Rods evenly spaced on a circle, s between neighbours
+    'ring': range(1, 101),
+    # Rods on the perimeter of a square, k per side: n = 4 (k - 1)
+    'hollow_square': [4 * (k - 1) for k in range(2, 27)],
+    # Filled square grid, k per side: n = k²
+    'grid': [k * k for k in range(1, 21)],
+}
+
+# Typical soil resistivity [Ωm], for a first estimate without a measurement
+SOIL_RESISTIVITY = {
+    'Močiar, rašelina': 30,
+    'Íl, hlina': 100,
+    'Vlhký piesok': 200,
+    'Štrk': 1000,
+    'Suchý piesok': 2000,
+    'Skala': 3000,
+}
+
+# Diameter of a usual earth rod [m]
+ROD_DIAMETER = 0.016
+
+RodArray = namedtuple('RodArray', 'layout count spacing resistance')
+
+
+def rod_resistance(resistivity, length, diameter=ROD_DIAMETER):
+    """Vertical rod driven from the surface: ρ / (2π L) (ln(8 L / d) - 1)"""
+    return resistivity / (2 * math.pi * length) * (math.log(8 * length / diameter) - 1)
+
+
+def plate_resistance(resistivity, area):
+    """Buried plate of area [m²] (one side): ρ / 4 √(π / A)"""
+    return resistivity / 4 * math.sqrt(math.pi / area)
+
+
+def strip_resistance(resistivity, length, width, depth):
+    """Horizontal strip buried at depth: ρ / (π L) (ln(2 L / √(d h)) - 1)
+
+    The strip counts as a round conductor of diameter d = width / 2.
+    """
+    return resistivity / (math.pi * length) * (math.log(2 * length / math.sqrt(width / 2 * depth)) - 1)
+
+
+def _positions(layout, count):
+    """Rod positions in units of the spacing"""
+    if layout == 'line':
+        return [(i, 0) for i in range(count)]
+    if layout == 'ring':
+        # Circle radius giving a chord of 1 between neighbours
+        radius = 0.5 / math.sin(math.pi / count)
+        return [(radius * math.cos(2 * math.pi * i / count), radius * math.sin(2 * math.pi * i / count))
+                for i in range(count)]
+    side = math.isqrt(count) if layout == 'grid' else count // 4 + 1
+    return [(x, y) for x in range(side) for y in range(side)
+            if layout == 'grid' or x in (0, side - 1) or y in (0, side - 1)]
+
+
+def _interference(layout, count):
+    if count == 1:
+        return 0.0
+    if layout == 'line':
+        # Mean of Σ 1 / |i - j|, in closed form 2 Σ (n - k) / (n k) over the distances k
+        return 2 * sum((count - k) / k for k in range(1, count)) / count
+    if layout == 'ring':
+        # Every rod sees the same chords, sin(π/n) / sin(πk/n) in units of the spacing
+        return sum(math.sin(math.pi / count) / math.sin(math.pi * k / count) for k in range(1, count))
+    if layout == 'grid':
+        # Sum over displacements, each occurring (k - |dx|)(k - |dy|) times
+        side = math.isqrt(count)
+        total = 0.0
+        for dx in range(-side + 1, side):
+            for dy in range(-side + 1, side):
+                if dx or dy:
+                    total += (side - abs(dx)) * (side - abs(dy)) / math.hypot(dx, dy)
+        return total / count
+    positions = _positions(layout, count)
+    total = 0.0
+    for i, (x, y) in enumerate(positions):
+        for u, v in positions[i + 1:]:
+            total += 2 / math.hypot(x - u, y - v)
+    return total / count
+
+
+@memoize(maxsize=len(LAYOUTS))
+def interference_table(layout):
+    """Dict rod count -> interference coefficient λ of a layout"""
+    return {count: _interference(layout, count) for count in LAYOUTS[layout]}
+
+
+def rod_array_resistance(single, resistivity, count, spacing, layout='line'):
+    """Resistance of count rods of resistance single [Ω] in a layout at spacing [m]
+
+    count must be in LAYOUTS[layout].
+    """
+    alpha = resistivity / (2 * math.pi * single * spacing)
+    return single * (1 + interference_table(layout)[count] * alpha) / count
+
+
+def _positive_error(*values):
+    for value in values:
+        if value is None:
+            return ERROR_MISSING
+        if not -MAX_INPUT <= value <= MAX_INPUT:
+            return ERROR_RANGE
+        if value < 0:
+            return ERROR_NEGATIVE
+        if value == 0:
+            return ERROR_ZERO
+    return None
+
+
+def electrode_result(electrode, resistivity, *dimensions):
+    """Result with the resistance [Ω] of one electrode
+
+    electrode and dimensions: 'rod' (length, diameter), 'plate' (area)
+    or 'strip' (length, width, depth). ERROR_RANGE when the geometry is
+    outside the validity of the formula (a rod shorter than its diameter).
+    """
+    functions = {'rod': rod_resistance, 'plate': plate_resistance, 'strip': strip_resistance}
+    if electrode not in functions:
+        return Result(None, ERROR_UNKNOWN)
+    error = _positive_error(resistivity, *dimensions)
+    if error is not None:
+        return Result(None, error)
+    try:
+        resistance = functions[electrode](resistivity, *dimensions)
+    except TypeError:
+        # Wrong number of dimensions for the electrode
+        return Result(None, ERROR_MISSING)
+    except (ZeroDivisionError, ValueError):
+        # A denominator or the argument of a logarithm underflowed to zero
+        return Result(None, ERROR_RANGE)
+    return _resistance_result(resistance)
+
+
+def _resistance_result(resistance):
+    """Result of a computed resistance, ERROR_RANGE unless positive and finite"""
+    if not 0 < resistance < math.inf:
+        # Also true for NaN
+        return Result(None, ERROR_RANGE)
+    return Result(resistance, None)
+
+
+def rod_array_result(resistivity, length, count, spacing, layout='line', diameter=ROD_DIAMETER):
+    """Result with the resistance [Ω] of a rod array
+
+    ERROR_RANGE when the layout's table has no such rod count, e.g. a grid
+    of 10 rods.
+    """
+    if layout not in LAYOUTS:
+        return Result(None, ERROR_UNKNOWN)
+    single = electrode_result('rod', resistivity, length, diameter)
+    if single.error is not None:
+        return single
+    error = _positive_error(count, spacing)
+    if error is not None:
+        return Result(None, error)
+    table = interference_table(layout)
+    if count != int(count) or int(count) not in table:
+        return Result(None, ERROR_RANGE)
+    try:
+        resistance = rod_array_resistance(single.value, resistivity, int(count), spacing, layout)
+    except ZeroDivisionError:
+        # The single rod resistance times the spacing underflowed to zero
+        return Result(None, ERROR_RANGE)
+    return _resistance_result(resistance)
+
+
+def rod_array_batch(resistivity, length, spacings, layouts=tuple(LAYOUTS), diameter=ROD_DIAMETER,
+                    target=None):
+    """Every array of rods of one length: list of RodArray sorted by rod count
+
+    Tries every layout, every rod count of its table and every spacing.
+    With target [Ω] only arrays reaching it are returned, so the first is
+    the one with the fewest rods.
+    """
+    single = rod_resistance(resistivity, length, diameter)
+    arrays = []
+    for layout in layouts:
+        table = interference_table(layout)
+        for spacing in spacings:
+            # Constant of the layout and spacing, the table supplies λ per count
+            alpha = resistivity / (2 * math.pi * single * spacing)
+            for count, interference in table.items():
+                resistance = single * (1 + interference * alpha) / count
+                if target is None or resistance <= target:
+                    arrays.append(RodArray(layout, count, spacing, resistance))
+    arrays.sort(key=lambda array: (array.count, array.resistance))
+    return arrays
+
+
+def rod_array_design(resistivity, length, target, spacings, layouts=tuple(LAYOUTS), diameter=ROD_DIAMETER):
+    """Result with the list of RodArray reaching target [Ω], fewest rods first
+
+    An empty list when no array of the tables gets that low.
+    """
+    single = electrode_result('rod', resistivity, length, diameter)
+    if single.error is not None:
+        return single
+    error = _positive_error(target, *spacings)
+    if error is not None:
+        return Result(None, error)
+    if any(layout not in LAYOUTS for layout in layouts):
+        return Result(None, ERROR_UNKNOWN)
+    try:
+        return Result(rod_array_batch(resistivity, length, spacings, layouts, diameter, target), None)
+    except ZeroDivisionError:
+        return Result(None, ERROR_RANGE)
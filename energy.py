@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""Energy, peak demand and cost of time-series load profiles.
+
+A profile is a CSV file with a timestamp column followed by one column per
+meter, e.g. exported by a data logger or a distribution network operator:
+
+    time;kitchen [kW];workshop [kW]
+    2024-01-01 00:00;1,2;0,4
+    2024-01-01 00:15;1,1;0,6
+
+The delimiter is ',', ';' or a tab, whichever the header uses. Timestamps
+are ISO 8601 or "31.12.2024 23:45" and mark the start of a sample. Meter
+units are given in the header like in export.py files and are any power
+(W, kW, MW, the mean power of the sample) or energy (Wh, kWh, MWh per
+sample) unit of calculations.UNIT_FACTORS; columns without one use the
+unit argument. Samples are taken at a fixed interval, inferred from the
+first two timestamps unless given, and must ascend. Missing or unreadable
+cells are skipped and counted.
+
+ProfileReader streams the file in chunks of chunk_rows rows, so memory
+stays bounded for a year of one-minute data. A chunk is split into cells
+at once and every column taken as a slice, then reduced with the built-in
+sum() and max(); per cell Python only runs the float() conversion. Tariff
+bands are resolved per hour of the week, for a regular chunk by stepping
+over hour boundaries instead of looking up every timestamp. summarize_many()
+reads several files in worker processes. Like calculations.py this module
+doesn't import Kivy.
+"""
+
+import csv
+import operator
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+
+from calculations import UNIT_FACTORS, convert_units
+from parsing import parse_column
+
+# Rows per processed chunk
+CHUNK_ROWS = 16384
+
+HOURS_PER_WEEK = 7 * 24
+
+# Time-of-use band: price [€/kWh] in the given hours (0-23) of the given weekdays (0 is Monday)
+Band = namedtuple('Band', 'name price hours weekdays', defaults=(range(7),))
+
+# The first band covering an hour applies. demand_price [€/kW] is charged on the peak demand.
+Tariff = namedtuple('Tariff', 'name bands demand_price', defaults=(0,))
+
+# Example tariffs; the prices are placeholders for those of the supplier's price list
+TARIFFS = {
+    'single': Tariff('Jednotarif', [Band('VT', 0.16, range(24))]),
+    # Low tariff for 8 hours a night
+    'dual': Tariff('Dvojtarif', [
+        Band('NT', 0.11, (22, 23, 0, 1, 2, 3, 4, 5)),
+        Band('VT', 0.18, range(24)),
+    ]),
+    # Low tariff also through the weekend, with a charge on the peak demand
+    'business': Tariff('Podnikateľský', [
+        Band('NT', 0.10, range(24), (5, 6)),
+        Band('NT', 0.10, (22, 23, 0, 1, 2, 3, 4, 5)),
+        Band('VT', 0.15, range(24)),
+    ], demand_price=4.5),
+}
+
+MeterSummary = namedtuple('MeterSummary', [
+    'name',
+    # Energy [Wh], peak and average power [W], average over peak
+    'energy', 'peak', 'peak_time', 'average', 'load_factor',
+    # Band name -> energy [Wh] and the total cost [€], {} and None without a tariff
+    'band_energy', 'cost',
+    # Samples read and cells that were missing or unreadable
+    'samples', 'missing',
+])
+
+_HEADER_UNIT = re.compile(r'\s*(?P<name>.*?)\s*\[(?P<unit>[^\]]+)\]\s*\Z')
+
+_TIMESTAMP_FORMATS = ('%d.%m.%Y %H:%M', '%d.%m.%Y %H:%M:%S')
+
+
+class ProfileError(ValueError):
+    """A load profile can't be read or has invalid data"""
+
+
+def parse_timestamp(text):
+    """datetime of an ISO 8601 or "31.12.2024 23:45" timestamp, ProfileError otherwise"""
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for timestamp_format in _TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(text.strip(), timestamp_format)
+        except ValueError:
+            pass
+    raise ProfileError(f"{text!r} is not a timestamp")
+
+
+def tariff_table(tariff):
+    """Tuple of the index of the band in tariff.bands for every hour of the week"""
+    table = []
+    for hour in range(HOURS_PER_WEEK):
+        weekday, hour_of_day = divmod(hour, 24)
+        for index, band in enumerate(tariff.bands):
+            if hour_of_day in band.hours and weekday in band.weekdays:
+                table.append(index)
+                break
+        else:
+            raise ValueError(f"tariff {tariff.name}: no band covers day {weekday} hour {hour_of_day}")
+    return tuple(table)
+
+
+def _week_seconds(moment):
+    """Seconds since Monday 00:00 of the week of moment"""
+    return ((moment.weekday() * 24 + moment.hour) * 60 + moment.minute) * 60 + moment.second
+
+
+def _unit_scale(unit, name):
+    """(factor to W or Wh, True for energy) of a meter unit"""
+    if unit in UNIT_FACTORS:
+        factor = convert_units(1, unit, 'W')
+        if factor is not None:
+            return factor, False
+        factor = convert_units(1, unit, 'Wh')
+        if factor is not None:
+            return factor, True
+    raise ProfileError(f"{name}: {unit!r} is not a unit of power or energy")
+
+
+def format_power(power):
+    """Format power in W, kW or MW with up to four significant digits"""
+    return _format_scaled(power, ('MW', 'kW', 'W'))
+
+
+def format_energy(energy):
+    """Format energy in Wh, kWh or MWh with up to four significant digits"""
+    return _format_scaled(energy, ('MWh', 'kWh', 'Wh'))
+
+
+def _format_scaled(value, units):
+    for unit in units:
+        if abs(value) >= UNIT_FACTORS[unit]:
+            break
+    return f"{value / UNIT_FACTORS[unit]:.4g} {unit}"
+
+
+class ProfileReader:
+    """Reads a load profile chunk by chunk and keeps running totals per meter
+
+    source is a path or an open text file. Call step() until it returns
+    False, or use summarize(). step() processes one chunk, so a UI can
+    read a large file a chunk per frame and show the progress in rows.
+    """
+
+    def __init__(self, source, tariff=None, unit='W', interval=None, chunk_rows=CHUNK_ROWS):
+        self.tariff = tariff
+        self.chunk_rows = chunk_rows
+        # Sampling interval [s], inferred from the first two samples when None
+        self.interval = None if interval is None else round(interval * 60)
+        self.rows = 0
+        self.start = None
+        self.end = None
+        self._table = tariff_table(tariff) if tariff is not None else None
+
+        if hasattr(source, 'read'):
+            self._file = None
+            f = source
+        else:
+            try:
+                # utf-8-sig drops the byte order mark spreadsheet programs write
+                self._file = f = open(source, encoding='utf-8-sig', newline='')
+            except OSError as e:
+                raise ProfileError(f"{source}: {e}") from None
+        try:
+            header_line = f.readline()
+        except UnicodeDecodeError as e:
+            self.close()
+            raise ProfileError(f"header: {e}") from None
+        self._delimiter = delimiter = max(',;\t', key=header_line.count)
+        header = next(csv.reader([header_line], delimiter=delimiter), [])
+        if len(header) < 2:
+            self.close()
+            raise ProfileError("expected a timestamp column and at least one meter column")
+        self._lines = f
+        self._width = len(header)
+
+        self.names = []
+        self._scales = []
+        for column in header[1:]:
+            match = _HEADER_UNIT.match(column)
+            name, column_unit = (match['name'], match['unit']) if match else (column.strip(), unit)
+            self.names.append(name)
+            try:
+                self._scales.append(_unit_scale(column_unit, name))
+            except ProfileError:
+                self.close()
+                raise
+
+        meters = len(self.names)
+        self._totals = [0.0] * meters
+        self._peaks = [None] * meters
+        self._peak_times = [None] * meters
+        self._samples = [0] * meters
+        self._missing = [0] * meters
+        bands = len(tariff.bands) if tariff is not None else 0
+        self._band_totals = [[0.0] * bands for _ in range(meters)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def step(self):
+        """Process the next chunk, False once the whole profile is read"""
+        try:
+            lines = list(islice(self._lines, self.chunk_rows))
+            if not lines:
+                self.close()
+                if self.rows == 0:
+                    raise ProfileError("the profile has no samples")
+                if self.interval is None:
+                    raise ProfileError("set the interval of a profile with a single sample")
+                return False
+            self._process(lines)
+        except UnicodeDecodeError as e:
+            self.close()
+            raise ProfileError(f"row {self.rows + 2}: {e}") from None
+        except ProfileError:
+            self.close()
+            raise
+        return True
+
+    def _columns(self, lines):
+        """Cell columns of a chunk of lines, [] if it only has blank lines"""
+        delimiter = self._delimiter
+        width = self._width
+        text = ''.join(lines)
+        if '"' not in text and all(line.count(delimiter) == width - 1 for line in lines):
+            # One split of the whole chunk, every column is then a slice with a stride
+            if '\r' in text:
+                text = text.replace('\r', '')
+            cells = text.rstrip('\n').replace('\n', delimiter).split(delimiter)
+            return [cells[column::width] for column in range(width)]
+        # Quoted cells, blank lines or rows of the wrong width
+        try:
+            rows = [row for row in csv.reader(lines, delimiter=delimiter) if row]
+        except csv.Error as e:
+            raise ProfileError(f"row {self.rows + 2}: {e}") from None
+        for index, row in enumerate(rows):
+            if len(row) != width:
+                raise ProfileError(f"row {self.rows + index + 2}: expected {width} cells, got {len(row)}")
+        return list(zip(*rows))
+
+    def _process(self, lines):
+        columns = self._columns(lines)
+        if not columns:
+            return
+        count = len(columns[0])
+        timestamps = columns[0]
+        moments = self._moments(timestamps)
+        regular = self._check_order(moments)
+        if self.start is None:
+            self.start = moments[0]
+        self.end = moments[-1]
+        runs = self._band_runs(moments, regular) if self._table is not None else ()
+
+        for meter, column in enumerate(columns[1:]):
+            try:
+                values = list(map(float, column))
+                total = sum(values)
+                if total - total != 0:
+                    # nan or inf, which float() accepts but aren't readings
+                    raise ValueError
+                peak = max(values)
+                readings = values
+            except ValueError:
+                # Decimal commas, gaps and junk: parse cell by cell, missing cells add nothing
+                readings = parse_column(column)
+                values = [0.0 if value is None else value for value in readings]
+                total = sum(values)
+                peak = max((value for value in readings if value is not None), default=None)
+            missing = readings.count(None) if readings is not values else 0
+            self._missing[meter] += missing
+            if peak is None:
+                continue
+            self._totals[meter] += total
+            self._samples[meter] += count - missing
+            if self._peaks[meter] is None or peak > self._peaks[meter]:
+                self._peaks[meter] = peak
+                self._peak_times[meter] = timestamps[readings.index(peak)]
+            band_totals = self._band_totals[meter]
+            for band, begin, end in runs:
+                band_totals[band] += total if end - begin == count else sum(values[begin:end])
+        self.rows += count
+
+    @staticmethod
+    def _moments(timestamps):
+        """datetime of every timestamp of a chunk"""
+        try:
+            return list(map(datetime.fromisoformat, timestamps))
+        except ValueError:
+            return list(map(parse_timestamp, timestamps))
+
+    def _check_order(self, moments):
+        """Raise ProfileError unless moments ascend from the end of the previous chunk
+
+        Infers the interval from the first two samples, which may be in
+        different chunks. True when the chunk is sampled at exactly the
+        interval.
+        """
+        previous = self.end is not None
+        sequence = [self.end] + moments if previous else moments
+        try:
+            steps = list(map(operator.sub, sequence[1:], sequence))
+        except TypeError:
+            raise ProfileError("timestamps mix local times and times with a UTC offset") from None
+        if steps and min(steps) <= timedelta(0):
+            index = next(index for index, step in enumerate(steps) if step <= timedelta(0))
+            # Line of the later timestamp, the header is line 1
+            raise ProfileError(f"row {self.rows + index + (2 if previous else 3)}: timestamps must ascend")
+        if self.interval is None and steps:
+            self.interval = round(steps[0].total_seconds())
+        if self.interval is not None and self.interval <= 0:
+            raise ProfileError("the interval must be at least a second")
+        return bool(steps) and steps.count(timedelta(seconds=self.interval)) == len(steps)
+
+    def _band_runs(self, moments, regular):
+        """List of (band, begin, end) row ranges of the chunk with the same band"""
+        count = len(moments)
+        interval = self.interval
+        table = self._table
+        runs = []
+        if regular:
+            # Regular samples: step from one hour boundary to the next
+            start = _week_seconds(moments[0])
+            begin = 0
+            while begin < count:
+                hour = (start + begin * interval) // 3600
+                # First row at or after the next hour boundary
+                end = min(count, -(-((hour + 1) * 3600 - start) // interval))
+                band = table[hour % HOURS_PER_WEEK]
+                if runs and runs[-1][0] == band:
+                    runs[-1][2] = end
+                else:
+                    runs.append([band, begin, end])
+                begin = end
+            return runs
+        # Gaps or a clock change: every timestamp decides its own band
+        for index, moment in enumerate(moments):
+            band = table[moment.weekday() * 24 + moment.hour]
+            if runs and runs[-1][0] == band:
+                runs[-1][2] = index + 1
+            else:
+                runs.append([band, index, index + 1])
+        return runs
+
+    def summaries(self):
+        """List of MeterSummary of the rows read so far"""
+        hours = (self.interval or 0) / 3600
+        summaries = []
+        for meter, name in enumerate(self.names):
+            factor, is_energy = self._scales[meter]
+            samples = self._samples[meter]
+            if samples == 0:
+                summaries.append(MeterSummary(name, 0.0, None, None, None, None, {}, None, 0, self._missing[meter]))
+                continue
+            # Readings to mean power [W] of a sample
+            scale = factor / hours if is_energy else factor
+            energy = self._totals[meter] * scale * hours
+            peak = self._peaks[meter] * scale
+            average = energy / (samples * hours)
+            band_energy = {}
+            cost = None
+            if self.tariff is not None:
+                cost = self.tariff.demand_price * max(peak, 0) / 1000
+                for band, total in zip(self.tariff.bands, self._band_totals[meter]):
+                    band_energy[band.name] = band_energy.get(band.name, 0.0) + total * scale * hours
+                    cost += total * scale * hours / 1000 * band.price
+            summaries.append(MeterSummary(
+                name, energy, peak, self._peak_times[meter], average, average / peak if peak > 0 else None,
+                band_energy, cost, samples, self._missing[meter]))
+        return summaries
+
+
+def summarize(source, tariff=None, unit='W', interval=None, chunk_rows=CHUNK_ROWS):
+    """List of MeterSummary of a whole load profile, see ProfileReader"""
+    with ProfileReader(source, tariff, unit, interval, chunk_rows) as reader:
+        while reader.step():
+            pass
+    return reader.summaries()
+
+
+def _summarize_path(path, options):
+    return summarize(path, **options)
+
+
+def summarize_many(paths, workers=None, **options):
+    """List of the summarize() results of several profile files, in order
+
+    The files are read by a pool of worker processes, one file per task,
+    e.g. one file per meter of a site. options are those of summarize().
+    """
+    paths = list(paths)
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return [summarize(path, **options) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_summarize_path, paths, [options] * len(paths)))
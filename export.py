@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""Export of calculation results as structured records.
+
+A record has the inputs, the outputs and the error code of one
+calculation, each column described by a Field with its unit. Writers
+collect rows or column slices into chunks of at most chunk_rows rows and
+write each chunk as a whole, so memory stays bounded however many rows
+are exported:
+
+    csv      one header line "name [unit]", missing values as empty cells
+    arrow    Arrow IPC file, one record batch per chunk (needs pyarrow)
+    parquet  Parquet file, one row group per chunk (needs pyarrow)
+
+Results of parallel.run export directly:
+
+    result = parallel.run('voltage_drop', inputs)
+    export_batch('drops.csv', 'voltage_drop', inputs, result)
+"""
+
+import abc
+import os
+from collections import namedtuple
+
+NUMBER = 'number'
+TEXT = 'text'
+
+Field = namedtuple('Field', 'name unit kind', defaults=('', NUMBER))
+
+# Column with the error code of the row, empty for valid rows
+ERROR_FIELD = Field('error', '', TEXT)
+
+# Rows per written chunk
+CHUNK_ROWS = 65536
+
+# Distinct texts a CSV writer keeps quoted
+QUOTE_CACHE_SIZE = 4096
+
+# Fields of the inputs and outputs of every kernel in parallel.KERNELS
+KERNEL_FIELDS = {
+    'current': ([Field('power', 'W'), Field('voltage', 'V')], [Field('current', 'A')]),
+    'wire': ([Field('current', 'A')], [Field('cross_section', 'mm²')]),
+    'voltage_drop': ([Field('current', 'A'), Field('length', 'm'), Field('cross_section', 'mm²')],
+                     [Field('voltage_drop', 'V')]),
+    'ohms_law': ([Field('voltage', 'V'), Field('current', 'A'), Field('resistance', 'Ω'), Field('power', 'W')],
+                 [Field('voltage_out', 'V'), Field('current_out', 'A'),
+                  Field('resistance_out', 'Ω'), Field('power_out', 'W')]),
+    'motor': ([Field('power', 'W'), Field('voltage', 'V'), Field('cos_phi'), Field('efficiency')],
+              [Field('current', 'A'), Field('starting_current', 'A'), Field('breaker', 'A'),
+               Field('cross_section', 'mm²')]),
+}
+
+
+class _ChunkedWriter(abc.ABC):
+    """Buffers rows into column chunks of at most chunk_rows rows"""
+
+    def __init__(self, fields, chunk_rows=CHUNK_ROWS):
+        self.fields = list(fields)
+        self.chunk_rows = chunk_rows
+        self.rows_written = 0
+        self._buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_row(self, values):
+        """Buffer one row, a sequence with a value per field"""
+        self._buffer.append(values)
+        if len(self._buffer) >= self.chunk_rows:
+            self.flush()
+
+    def write_columns(self, columns):
+        """Write equally long columns, one per field, chunk by chunk"""
+        self.flush()
+        if len(columns) != len(self.fields):
+            raise ValueError(f"expected {len(self.fields)} columns, got {len(columns)}")
+        rows = len(columns[0]) if columns else 0
+        if any(len(column) != rows for column in columns):
+            raise ValueError("columns differ in length")
+        for start in range(0, rows, self.chunk_rows):
+            stop = min(start + self.chunk_rows, rows)
+            self._write_chunk([self._column_chunk(field, column[start:stop])
+                               for field, column in zip(self.fields, columns)])
+            self.rows_written += stop - start
+
+    def flush(self):
+        """Write the buffered rows"""
+        if self._buffer:
+            columns = [list(column) for column in zip(*self._buffer)]
+            self._write_chunk([self._column_chunk(field, column) for field, column in zip(self.fields, columns)])
+            self.rows_written += len(self._buffer)
+            self._buffer = []
+
+    def close(self):
+        self.flush()
+
+    def _column_chunk(self, field, values):
+        """A chunk of a column as the writer needs it"""
+        return values
+
+    @abc.abstractmethod
+    def _write_chunk(self, columns):
+        """Write a chunk given as one column chunk per field"""
+
+
+class CSVWriter(_ChunkedWriter):
+    """Streams records to a CSV file
+
+    Numbers are written with repr, which round-trips exactly; precision
+    writes that many significant digits instead, which formats about twice
+    as fast. Missing numbers (None or NaN) are empty cells.
+    """
+
+    def __init__(self, path, fields, chunk_rows=CHUNK_ROWS, precision=None):
+        super().__init__(fields, chunk_rows)
+        self._format_number = repr if precision is None else f"%.{precision}g".__mod__
+        # Text columns repeat a few values (error codes, names), each is quoted once
+        self._quoted = {None: ''}
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._file.write(','.join(self._quote(f"{field.name} [{field.unit}]" if field.unit else field.name)
+                                  for field in self.fields) + '\r\n')
+
+    def _quote(self, value):
+        quoted = self._quoted.get(value)
+        if quoted is None:
+            text = str(value)
+            quoted = text
+            if any(character in text for character in ',"\r\n'):
+                quoted = '"' + text.replace('"', '""') + '"'
+            if len(self._quoted) >= QUOTE_CACHE_SIZE:
+                # Unique texts such as names would otherwise grow the cache without bound
+                self._quoted = {None: ''}
+            self._quoted[value] = quoted
+        return quoted
+
+    def _column_chunk(self, field, values):
+        if field.kind == NUMBER:
+            format_number = self._format_number
+            # parallel.run marks missing numbers with NaN
+            return ['' if value is None or value != value else format_number(value) for value in values]
+        quote = self._quote
+        return [quote(value) for value in values]
+
+    def _write_chunk(self, columns):
+        # One join and one write per chunk instead of a csv.writer call per row
+        self._file.write('\r\n'.join(map(','.join, zip(*columns))) + '\r\n')
+
+    def close(self):
+        if not self._file.closed:
+            super().close()
+            self._file.close()
+
+
+def _arrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("the arrow and parquet formats need pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+
+def _arrow_schema(pa, fields):
+    return pa.schema([
+        pa.field(field.name, pa.float64() if field.kind == NUMBER else pa.string(),
+                 metadata={'unit': field.unit} if field.unit else None)
+        for field in fields
+    ])
+
+
+class _ArrowChunkedWriter(_ChunkedWriter):
+
+    def __init__(self, path, fields, chunk_rows=CHUNK_ROWS):
+        super().__init__(fields, chunk_rows)
+        self._pa = _arrow()
+        self.schema = _arrow_schema(self._pa, self.fields)
+        self._writer = self._open(path)
+
+    @abc.abstractmethod
+    def _open(self, path):
+        """The pyarrow writer of the file at path"""
+
+    def _column_chunk(self, field, values):
+        # from_pandas turns NaN into null, so no pass over the values is needed here
+        if not isinstance(values, list):
+            values = list(values)
+        return self._pa.array(values, type=self.schema.field(field.name).type, from_pandas=True)
+
+    def _batch(self, columns):
+        return self._pa.record_batch(columns, schema=self.schema)
+
+    def close(self):
+        if self._writer is not None:
+            super().close()
+            self._writer.close()
+            self._writer = None
+
+
+class ArrowWriter(_ArrowChunkedWriter):
+    """Streams records to an Arrow IPC file, one record batch per chunk"""
+
+    def _open(self, path):
+        return self._pa.ipc.new_file(path, self.schema)
+
+    def _write_chunk(self, columns):
+        self._writer.write_batch(self._batch(columns))
+
+
+class ParquetWriter(_ArrowChunkedWriter):
+    """Streams records to a Parquet file, one row group per chunk"""
+
+    def _open(self, path):
+        import pyarrow.parquet
+        return pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def _write_chunk(self, columns):
+        self._writer.write_table(self._pa.Table.from_batches([self._batch(columns)]))
+
+
+FORMATS = {'csv': CSVWriter, 'arrow': ArrowWriter, 'parquet': ParquetWriter}
+
+# File extension -> format
+_EXTENSIONS = {'.csv': 'csv', '.arrow': 'arrow', '.feather': 'arrow', '.parquet': 'parquet'}
+
+
+def open_writer(path, fields, format=None, chunk_rows=CHUNK_ROWS, **options):
+    """Writer of the given format, by default the one of the file extension
+
+    options go to the writer, e.g. precision for CSV.
+    """
+    if format is None:
+        format = _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"unknown export format of {path!r}, use one of {', '.join(FORMATS)}")
+    return FORMATS[format](path, fields, chunk_rows, **options)
+
+
+def export_batch(path, kernel_name, inputs, result, format=None, chunk_rows=CHUNK_ROWS, **options):
+    """Write the inputs, outputs and error codes of a parallel.run job, returns the row count"""
+    input_fields, output_fields = KERNEL_FIELDS[kernel_name]
+    with open_writer(path, input_fields + output_fields + [ERROR_FIELD], format, chunk_rows, **options) as writer:
+        writer.write_columns(list(inputs) + list(result.columns) + [result.errors])
+    return writer.rows_written
+
+
+def export_rows(path, fields, rows, format=None, chunk_rows=CHUNK_ROWS, **options):
+    """Write an iterable of rows, e.g. a generator, returns the row count"""
+    with open_writer(path, fields, format, chunk_rows, **options) as writer:
+        for row in rows:
+            writer.write_row(row)
+    return writer.rows_written
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Persistent calculation history.
+
+The history is an append-only log split into segments. Each segment is a
+pair of files:
+
+    history-NNNNNN.log  records: timestamp f64, kind u8, inputs length u16,
+                        result length u16, inputs and result as UTF-8
+    history-NNNNNN.idx  byte offset u64 of every record in the .log file
+
+Records are written by a background thread which batches writes and fsyncs
+at most once per fsync_interval, so append() never blocks the UI thread.
+When a segment grows over max_segment_bytes a new one is started and the
+oldest segments beyond max_segments are deleted, which bounds the size on
+disk. Reading a record seeks through the index, the log is never loaded
+as a whole.
+"""
+
+import os
+import queue
+import struct
+import threading
+import time
+from bisect import bisect_right
+from collections import namedtuple
+
+# Calculation kinds, stored as their position in this tuple
+KINDS = ('ohms_law', 'power', 'wire', 'resistor', 'converter', 'reactance', 'design', 'machines', 'earthing', 'energy')
+
+_RECORD = struct.Struct('<dBHH')
+_OFFSET = struct.Struct('<Q')
+
+HistoryRecord = namedtuple('HistoryRecord', 'timestamp kind inputs result')
+
+
+def _encode(text):
+    # Lengths are stored as u16, longer texts are cut on a character boundary
+    data = text.encode('utf-8')
+    if len(data) > 0xFFFF:
+        data = data[:0xFFFF].decode('utf-8', 'ignore').encode('utf-8')
+    return data
+
+
+class _Segment:
+    """One .log/.idx file pair"""
+
+    def __init__(self, directory, number):
+        self.number = number
+        base = os.path.join(directory, f"history-{number:06d}")
+        self.log_path = base + '.log'
+        self.idx_path = base + '.idx'
+        self.log = open(self.log_path, 'a+b')
+        self.idx = open(self.idx_path, 'a+b')
+        # Drop a partially written index entry left by a crash
+        idx_size = os.fstat(self.idx.fileno()).st_size
+        if idx_size % _OFFSET.size:
+            self.idx.truncate(idx_size - idx_size % _OFFSET.size)
+        self.count = os.fstat(self.idx.fileno()).st_size // _OFFSET.size
+        self.size = os.fstat(self.log.fileno()).st_size
+
+    def read(self, index):
+        self.idx.seek(index * _OFFSET.size)
+        offset, = _OFFSET.unpack(self.idx.read(_OFFSET.size))
+        self.log.seek(offset)
+        timestamp, kind, inputs_length, result_length = _RECORD.unpack(self.log.read(_RECORD.size))
+        payload = self.log.read(inputs_length + result_length)
+        return HistoryRecord(
+            timestamp,
+            KINDS[kind] if kind < len(KINDS) else str(kind),
+            payload[:inputs_length].decode('utf-8'),
+            payload[inputs_length:].decode('utf-8')
+        )
+
+    def sync(self):
+        self.log.flush()
+        self.idx.flush()
+        os.fsync(self.log.fileno())
+        os.fsync(self.idx.fileno())
+
+    def close(self):
+        self.log.close()
+        self.idx.close()
+
+    def remove(self):
+        self.close()
+        os.remove(self.log_path)
+        os.remove(self.idx_path)
+
+
+class CalculationHistory:
+    """Append-only calculation log with indexed random access"""
+
+    def __init__(self, directory, max_segment_bytes=1 << 20, max_segments=8, fsync_interval=1.0):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        self.fsync_interval = fsync_interval
+        os.makedirs(directory, exist_ok=True)
+
+        numbers = sorted(
+            int(name[8:14]) for name in os.listdir(directory)
+            if name.startswith('history-') and name.endswith('.idx')
+        )
+        self._segments = [_Segment(directory, number) for number in numbers] or [_Segment(directory, 1)]
+        self._lock = threading.Lock()
+        self._update_starts()
+
+        self._queue = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name='history-writer', daemon=True)
+        self._writer.start()
+
+    def _update_starts(self):
+        # Index of the first record of each segment, for bisecting a global index
+        starts = []
+        total = 0
+        for segment in self._segments:
+            starts.append(total)
+            total += segment.count
+        self._starts = starts
+        self._count = total
+
+    def append(self, kind, inputs, result):
+        """Queue a record for writing, returns immediately"""
+        if not self._closed:
+            self._queue.put((time.time(), KINDS.index(kind), _encode(inputs), _encode(result)))
+
+    def __len__(self):
+        return self._count
+
+    def record(self, index):
+        """Record number index, 0 is the oldest kept record"""
+        with self._lock:
+            if index < 0:
+                index += self._count
+            if not 0 <= index < self._count:
+                raise IndexError(index)
+            return self._read(index)
+
+    def recent(self, start, count):
+        """Up to count records from start-th newest backwards, newest first"""
+        # One lock for the whole page, a rotation in between would shift the indexes
+        with self._lock:
+            last = self._count - 1 - start
+            return [self._read(index) for index in range(last, max(-1, last - count), -1)]
+
+    def _read(self, index):
+        # Caller holds the lock
+        position = bisect_right(self._starts, index) - 1
+        return self._segments[position].read(index - self._starts[position])
+
+    def flush(self):
+        """Wait until all queued records are written"""
+        self._queue.join()
+
+    def close(self):
+        """Write pending records and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+
+    def _write_loop(self):
+        last_sync = time.monotonic()
+        dirty = False
+        while True:
+            timeout = max(0, self.fsync_interval - (time.monotonic() - last_sync)) if dirty else None
+            try:
+                items = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []
+
+            # Drain whatever else is queued so one batch costs one write per file
+            while items and items[-1] is not None:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = bool(items) and items[-1] is None
+            batch = items[:-1] if stop else items
+
+            if batch:
+                self._write_batch(batch)
+                dirty = True
+            if dirty and (stop or time.monotonic() - last_sync >= self.fsync_interval):
+                with self._lock:
+                    self._segments[-1].sync()
+                last_sync = time.monotonic()
+                dirty = False
+            for _ in items:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch):
+        with self._lock:
+            segment = self._segments[-1]
+            log_data = bytearray()
+            idx_data = bytearray()
+            offset = segment.size
+            for timestamp, kind, inputs, result in batch:
+                idx_data += _OFFSET.pack(offset)
+                record = _RECORD.pack(timestamp, kind, len(inputs), len(result)) + inputs + result
+                log_data += record
+                offset += len(record)
+            # Log before index, so an indexed record is always complete
+            segment.log.write(log_data)
+            segment.log.flush()
+            segment.idx.write(idx_data)
+            segment.idx.flush()
+            segment.size = offset
+            segment.count += len(batch)
+            if segment.size >= self.max_segment_bytes:
+                self._rotate()
+            self._update_starts()
+
+    def _rotate(self):
+        self._segments[-1].sync()
+        self._segments.append(_Segment(self.directory, self._segments[-1].number + 1))
+        while len(self._segments) > self.max_segments:
+            self._segments.pop(0).remove()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Enlarged symbol image popup.
+
+Kept out of app.py so ModalView is only imported when a symbol is first
+tapped, not during startup. One popup is created and reused: showing
+another symbol swaps its texts and image, and the neighbouring symbols'
+images are decoded in advance, so swiping through the list is instant.
+"""
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.image import Image
+from kivy.uix.label import Label
+from kivy.uix.modalview import ModalView
+from kivy.metrics import dp
+
+from resources import load_image, preload_image
+from theme import BUTTON_HEIGHT, FONT_BODY, FONT_LARGE, FONT_SMALL, PADDING, SPACING, theme
+
+# Horizontal distance of a swipe to the previous or next symbol
+SWIPE_DISTANCE = dp(60)
+
+_modal = None
+
+
+class ImageModal(ModalView):
+    """Modal popup for enlarged image view, reused for every symbol"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint = (0.9, 0.8)
+        theme.style(self, background_color='surface')
+        self.rows = []
+        self.index = 0
+        
+        # Main layout for modal
+        layout = BoxLayout(orientation='vertical', padding=PADDING, spacing=SPACING)
+        
+        # Header with symbol info
+        header_layout = BoxLayout(
+            orientation='vertical', 
+            size_hint_y=None, 
+            height=dp(100),
+            spacing=dp(5)
+        )
+        
+        # Symbol number
+        self.number_label = theme.style(Label(
+            font_size=FONT_LARGE,
+            bold=True,
+            size_hint_y=None,
+            height=dp(25)
+        ), color='accent')
+        
+        # Symbol name
+        self.name_label = theme.style(Label(
+            font_size=FONT_SMALL,
+            text_size=(None, None),
+            halign='center',
+            size_hint_y=None,
+            height=dp(60)
+        ), color='text')
+        self.name_label.bind(size=self.name_label.setter('text_size'))
+        
+        header_layout.add_widget(self.number_label)
+        header_layout.add_widget(self.name_label)
+        layout.add_widget(header_layout)
+        
+        # Enlarged image, the slot shows either the image or the placeholder
+        self.image_slot = BoxLayout()
+        self.enlarged_image = Image(
+            allow_stretch=True,
+            keep_ratio=True
+        )
+        self.placeholder = theme.style(Label(
+            text="[size=72sp][font=DejaVuSans]📷[/font][/size]",
+            markup=True
+        ), color='muted')
+        layout.add_widget(self.image_slot)
+        
+        # Close button
+        close_button = theme.style(Button(
+            text="Zavrieť",
+            size_hint_y=None,
+            height=BUTTON_HEIGHT,
+            font_size=FONT_BODY,
+            bold=True
+        ), background_color='accent', color='on_accent')
+        close_button.bind(on_press=lambda x: self.dismiss())
+        layout.add_widget(close_button)
+        
+        self.add_widget(layout)
+        self._preload_trigger = Clock.create_trigger(self._preload_neighbours)
+    
+    def show(self, rows, index):
+        """Show the symbol of rows[index] and open the popup if it's closed
+        
+        rows are symbol list rows (dicts with 'symbol_id', 'symbol_name' and
+        'image'); rows of other view classes, e.g. section headers, are
+        skipped when swiping.
+        """
+        self.rows = rows
+        self.index = index
+        self._display()
+        if self._window is None:
+            self.open()
+    
+    def _display(self):
+        row = self.rows[self.index]
+        image = row.get('image') or f"images/{row['symbol_id']}.png"
+        self.number_label.text = f"#{row['symbol_id']}"
+        self.name_label.text = row['symbol_name']
+        
+        self.image_slot.clear_widgets()
+        if load_image(self.enlarged_image, image, self._image_size()):
+            self.image_slot.add_widget(self.enlarged_image)
+        else:
+            self.image_slot.add_widget(self.placeholder)
+        # Decode the neighbours after this frame, the current image comes first
+        self._preload_trigger()
+    
+    def _image_size(self):
+        """Largest size the image can take in the popup [px]"""
+        return Window.width * self.size_hint_x, Window.height * self.size_hint_y
+    
+    def _neighbour(self, step):
+        """Index of the nearest symbol row in direction step, or None"""
+        index = self.index + step
+        while 0 <= index < len(self.rows):
+            if 'symbol_id' in self.rows[index]:
+                return index
+            index += step
+        return None
+    
+    def show_neighbour(self, step):
+        """Show the next (1) or previous (-1) symbol, if there is one"""
+        index = self._neighbour(step)
+        if index is not None:
+            self.index = index
+            self._display()
+    
+    def _preload_neighbours(self, dt):
+        for step in (1, -1):
+            index = self._neighbour(step)
+            if index is not None:
+                row = self.rows[index]
+                preload_image(row.get('image') or f"images/{row['symbol_id']}.png", self._image_size())
+    
+    def on_touch_up(self, touch):
+        # A mostly horizontal drag inside the popup moves to a neighbour
+        distance = touch.x - touch.ox
+        if (self.collide_point(touch.ox, touch.oy) and abs(distance) > SWIPE_DISTANCE
+                and abs(distance) > abs(touch.y - touch.oy)):
+            self.show_neighbour(-1 if distance > 0 else 1)
+            return True
+        return super().on_touch_up(touch)
+
+
+def show_symbol(rows, index):
+    """Show rows[index] in the shared popup, creating it on first use"""
+    global _modal
+    if _modal is None:
+        _modal = ImageModal()
+    _modal.show(rows, index)
+    return _modal
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Build step generating smaller variants of the symbol images.
+
+Every images/{id}.png is scaled down to the widths in VARIANT_WIDTHS that
+are smaller than the original and saved as images/w{width}/{id}.png. Vector
+sources, images/{id}.svg, are rasterised first at the largest width. The
+variants and original sizes are listed in images/variants.json, which
+resources.load_image uses to pick the smallest image that is still sharp at
+the size it is shown.
+
+Run from the repository root before packing the resource archive:
+
+    python image_variants.py images
+
+Needs Pillow; SVG sources also need cairosvg.
+"""
+
+import json
+import os
+import sys
+
+# Widths of the generated variants [px]
+VARIANT_WIDTHS = (64, 128, 256, 512, 1024)
+
+MANIFEST_NAME = 'variants.json'
+
+
+def rasterise_svg(source, destination, width):
+    """Render an SVG file to a PNG of the given width"""
+    try:
+        import cairosvg
+    except ImportError:
+        sys.exit(f"{source}: rasterising SVG sources needs cairosvg (pip install cairosvg)")
+    cairosvg.svg2png(url=source, write_to=destination, output_width=width)
+
+
+def build_variants(directory, widths=VARIANT_WIDTHS):
+    """Write the variants of every image in directory and the manifest.
+
+    Returns the manifest: image path -> {'size': [width, height],
+    'widths': [variant widths]}, paths relative to the directory's parent.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        sys.exit("building image variants needs Pillow (pip install pillow)")
+
+    prefix = os.path.basename(os.path.normpath(directory))
+    names = sorted(os.listdir(directory))
+    for name in names:
+        stem, extension = os.path.splitext(name)
+        if extension.lower() == '.svg' and f"{stem}.png" not in names:
+            rasterise_svg(os.path.join(directory, name), os.path.join(directory, f"{stem}.png"), max(widths))
+
+    manifest = {}
+    for name in sorted(os.listdir(directory)):
+        if os.path.splitext(name)[1].lower() != '.png':
+            continue
+        with Image.open(os.path.join(directory, name)) as image:
+            image.load()
+            size = image.size
+            variant_widths = []
+            for width in widths:
+                if width >= size[0]:
+                    break
+                height = max(1, round(size[1] * width / size[0]))
+                variant_directory = os.path.join(directory, f"w{width}")
+                os.makedirs(variant_directory, exist_ok=True)
+                image.resize((width, height), Image.LANCZOS).save(
+                    os.path.join(variant_directory, name), optimize=True)
+                variant_widths.append(width)
+        manifest[f"{prefix}/{name}"] = {'size': list(size), 'widths': variant_widths}
+
+    with open(os.path.join(directory, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return manifest
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        sys.exit(f"usage: {sys.argv[0]} IMAGE_DIRECTORY")
+    manifest = build_variants(sys.argv[1])
+    print(f"Wrote {sum(len(entry['widths']) for entry in manifest.values())} variants "
+          f"of {len(manifest)} images")
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""Load schedule: consumers aggregated per circuit and per phase.
+
+Like calculations.py this module doesn't import Kivy. LoadSchedule keeps
+running sums of active and reactive power per circuit and per phase, so
+adding, editing or removing a row costs the same for ten rows as for ten
+thousand; recompute() re-sums everything once the edits outnumber the loads.
+"""
+
+import heapq
+import math
+from collections import namedtuple
+
+from calculations import find_wire
+
+PHASES = ('L1', 'L2', 'L3')
+# A three-phase consumer, split evenly between L1, L2 and L3
+THREE_PHASE = '3f'
+
+PHASE_VOLTAGE = 230
+
+# Largest allowed difference of phase currents, as a fraction of the mean
+PHASE_UNBALANCE_LIMIT = 0.15
+
+# Rated currents of miniature circuit breakers and fuses [A]
+BREAKER_RATINGS = [6, 10, 13, 16, 20, 25, 32, 40, 50, 63, 80, 100, 125, 160, 200, 250, 315, 400]
+
+# Edits before the running sums are re-summed, at least as many as there are loads
+RECOMPUTE_EDITS = 1000
+
+Load = namedtuple('Load', 'name power phase cos_phi demand_factor circuit', defaults=(1.0, 1.0, ''))
+
+Totals = namedtuple('Totals', 'active reactive apparent cos_phi')
+
+
+def _totals(active, reactive):
+    apparent = math.hypot(active, reactive)
+    return Totals(active, reactive, apparent, active / apparent if apparent else 1.0)
+
+
+def validate_load(load):
+    """Raise ValueError if a load's values are out of range"""
+    if load.power < 0:
+        raise ValueError("power must not be negative")
+    if load.phase not in PHASES and load.phase != THREE_PHASE:
+        raise ValueError(f"phase must be one of {', '.join(PHASES + (THREE_PHASE,))}")
+    if not 0 < load.cos_phi <= 1:
+        raise ValueError("cos φ must be in (0, 1]")
+    if not 0 <= load.demand_factor <= 1:
+        raise ValueError("demand factor must be in [0, 1]")
+
+
+def load_demand(load):
+    """(active [W], reactive [var]) demand of a load"""
+    active = load.power * load.demand_factor
+    return active, active * math.tan(math.acos(load.cos_phi))
+
+
+class LoadSchedule:
+    """Consumers with incrementally updated per-circuit and per-phase totals
+
+    simultaneity is the coincidence factor applied to the whole schedule on
+    top of each load's own demand factor.
+    """
+
+    def __init__(self, loads=(), simultaneity=1.0):
+        self.simultaneity = simultaneity
+        self._loads = {}
+        self._next_id = 0
+        # circuit -> [active, reactive, number of loads]
+        self._circuits = {}
+        # phase -> [active, reactive]
+        self._phases = {phase: [0.0, 0.0] for phase in PHASES}
+        self._edits = 0
+        for load in loads:
+            self.add(load)
+
+    def __len__(self):
+        return len(self._loads)
+
+    def __iter__(self):
+        return iter(self._loads.items())
+
+    def __getitem__(self, load_id):
+        return self._loads[load_id]
+
+    def _apply(self, load, sign):
+        active, reactive = load_demand(load)
+        active *= sign
+        reactive *= sign
+
+        circuit = self._circuits.setdefault(load.circuit, [0.0, 0.0, 0])
+        circuit[0] += active
+        circuit[1] += reactive
+        circuit[2] += sign
+        if circuit[2] == 0:
+            del self._circuits[load.circuit]
+
+        if load.phase == THREE_PHASE:
+            for phase in PHASES:
+                self._phases[phase][0] += active / 3
+                self._phases[phase][1] += reactive / 3
+        else:
+            self._phases[load.phase][0] += active
+            self._phases[load.phase][1] += reactive
+
+    def _edited(self):
+        # Re-summing after as many edits as there are loads keeps an edit O(1)
+        # on average and rounding drift from piling up
+        self._edits += 1
+        if not self._loads or self._edits >= max(len(self._loads), RECOMPUTE_EDITS):
+            self.recompute()
+
+    def add(self, load):
+        """Add a load, returns its id"""
+        validate_load(load)
+        load_id = self._next_id
+        self._next_id += 1
+        self._loads[load_id] = load
+        self._apply(load, 1)
+        self._edited()
+        return load_id
+
+    def update(self, load_id, load):
+        """Replace the load with the given id"""
+        validate_load(load)
+        self._apply(self._loads[load_id], -1)
+        self._loads[load_id] = load
+        self._apply(load, 1)
+        self._edited()
+
+    def remove(self, load_id):
+        self._apply(self._loads.pop(load_id), -1)
+        self._edited()
+
+    def recompute(self):
+        """Re-sum all totals, clearing rounding drift after many edits"""
+        self._circuits = {}
+        self._phases = {phase: [0.0, 0.0] for phase in PHASES}
+        self._edits = 0
+        for load in self._loads.values():
+            self._apply(load, 1)
+
+    def circuit_count(self):
+        return len(self._circuits)
+
+    def circuit_totals(self, count=None):
+        """Circuit name -> Totals, before simultaneity
+
+        With count only the first count circuits by name, without sorting
+        the others.
+        """
+        if count is None:
+            names = sorted(self._circuits)
+        else:
+            names = heapq.nsmallest(count, self._circuits)
+        return {name: _totals(*self._circuits[name][:2]) for name in names}
+
+    def phase_totals(self):
+        """Phase -> Totals, including simultaneity"""
+        return {phase: _totals(active * self.simultaneity, reactive * self.simultaneity)
+                for phase, (active, reactive) in self._phases.items()}
+
+    def totals(self):
+        """Totals of the whole schedule, including simultaneity"""
+        active = sum(active for active, _ in self._phases.values())
+        reactive = sum(reactive for _, reactive in self._phases.values())
+        return _totals(active * self.simultaneity, reactive * self.simultaneity)
+
+    def phase_currents(self, voltage=PHASE_VOLTAGE):
+        """Phase -> current [A]"""
+        return {phase: totals.apparent / voltage for phase, totals in self.phase_totals().items()}
+
+    def phase_unbalance(self, voltage=PHASE_VOLTAGE):
+        """Difference of the largest and smallest phase current over their mean"""
+        currents = self.phase_currents(voltage).values()
+        mean = sum(currents) / len(PHASES)
+        return (max(currents) - min(currents)) / mean if mean else 0.0
+
+    def size_supply(self, voltage=PHASE_VOLTAGE):
+        """Dict with the design current, breaker rating and wire cross section
+
+        The most loaded phase sets the design current. breaker and
+        cross_section are None when no rating is large enough.
+        """
+        currents = self.phase_currents(voltage)
+        design_current = max(currents.values())
+        breaker = next((rating for rating in BREAKER_RATINGS if rating >= design_current), None)
+        unbalance = self.phase_unbalance(voltage)
+        return {
+            'design_current': design_current,
+            'phase_currents': currents,
+            'breaker': breaker,
+            'cross_section': find_wire(breaker) if breaker is not None else None,
+            'unbalance': unbalance,
+            'balanced': unbalance <= PHASE_UNBALANCE_LIMIT,
+        }
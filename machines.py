@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Nameplate calculations of motors and transformers.
+
+Like calculations.py this module doesn't import Kivy. Powers are in W,
+apparent powers in VA, voltages are line voltages for three-phase machines.
+motor_batch() evaluates a whole equipment register at once and returns
+columns, like the *_batch functions of calculations.py.
+"""
+
+import math
+from bisect import bisect_left
+from collections import namedtuple
+
+from calculations import (
+    ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE, ERROR_UNKNOWN, ERROR_ZERO, MAX_INPUT, SQRT3, Result,
+    find_wire
+)
+from loads import BREAKER_RATINGS
+
+# Starting current over rated current by starting method
+STARTING_CURRENT_RATIOS = {
+    'direct': 7.0,
+    # A star-delta starter draws a third of the direct starting current
+    'star_delta': 7.0 / 3,
+    'soft_start': 3.5,
+    'frequency_converter': 1.5,
+}
+
+# Breaker rating over rated current, so the starting current doesn't trip it
+PROTECTION_FACTORS = {'direct': 1.25, 'star_delta': 1.15, 'soft_start': 1.15, 'frequency_converter': 1.1}
+
+MotorColumns = namedtuple('MotorColumns', 'current starting_current breaker cross_section')
+
+
+def motor_current(power, voltage, cos_phi, efficiency, three_phase=True):
+    """Rated current [A] of a motor with rated output power [W]
+
+    The input power is power / efficiency, the current
+    P / (√3 U cos φ η) for a three-phase motor and P / (U cos φ η) otherwise.
+    """
+    denominator = cos_phi * efficiency * voltage
+    if three_phase:
+        return power / (SQRT3 * denominator)
+    return power / denominator
+
+
+def breaker_for(current):
+    """Smallest rating of BREAKER_RATINGS at least current, or None"""
+    i = bisect_left(BREAKER_RATINGS, current)
+    return BREAKER_RATINGS[i] if i < len(BREAKER_RATINGS) else None
+
+
+def _motor_error(power, voltage, cos_phi, efficiency):
+    for value in (power, voltage, cos_phi, efficiency):
+        if value is None:
+            return ERROR_MISSING
+        if not -MAX_INPUT <= value <= MAX_INPUT:
+            return ERROR_RANGE
+        if value < 0:
+            return ERROR_NEGATIVE
+    if voltage == 0 or cos_phi == 0 or efficiency == 0:
+        return ERROR_ZERO
+    if cos_phi > 1 or efficiency > 1:
+        return ERROR_RANGE
+    # The current divides by U cos φ η, which mustn't underflow to zero nor the current
+    # or the input power overflow
+    denominator = cos_phi * efficiency * voltage
+    if not 0 < denominator < math.inf or not power / denominator < math.inf or not power / efficiency < math.inf:
+        return ERROR_RANGE
+    return None
+
+
+def motor_result(power, voltage, cos_phi, efficiency, three_phase=True, start='direct'):
+    """Result with a dict of the rated and starting current and the protection
+
+    Keys: 'current', 'starting_current', 'input_power' [W], 'breaker' [A]
+    and 'cross_section' [mm², string], the last two None when the motor is
+    beyond the tables. ERROR_UNKNOWN for an unknown starting method.
+    """
+    error = _motor_error(power, voltage, cos_phi, efficiency)
+    if error is not None:
+        return Result(None, error)
+    if start not in STARTING_CURRENT_RATIOS:
+        return Result(None, ERROR_UNKNOWN)
+    current = motor_current(power, voltage, cos_phi, efficiency, three_phase)
+    breaker = breaker_for(current * PROTECTION_FACTORS[start])
+    return Result({
+        'current': current,
+        'starting_current': current * STARTING_CURRENT_RATIOS[start],
+        'input_power': power / efficiency,
+        'breaker': breaker,
+        'cross_section': find_wire(breaker) if breaker is not None else None,
+    }, None)
+
+
+def motor_batch(powers, voltages, cos_phis, efficiencies, three_phase=True, start='direct'):
+    """(MotorColumns, errors) for the columns of an equipment register
+
+    Rows that fail validation get None in every column and an error code.
+    The starting method and three_phase apply to every row.
+    """
+    rows = len(powers)
+    if start not in STARTING_CURRENT_RATIOS:
+        return MotorColumns([None] * rows, [None] * rows, [None] * rows, [None] * rows), [ERROR_UNKNOWN] * rows
+    # Constants of the whole register, hoisted out of the loop
+    scale = SQRT3 if three_phase else 1
+    starting_ratio = STARTING_CURRENT_RATIOS[start]
+    protection = PROTECTION_FACTORS[start]
+    largest_breaker = BREAKER_RATINGS[-1]
+    currents = []
+    starting_currents = []
+    breakers = []
+    cross_sections = []
+    errors = []
+    for power, voltage, cos_phi, efficiency in zip(powers, voltages, cos_phis, efficiencies):
+        error = _motor_error(power, voltage, cos_phi, efficiency)
+        if error is not None:
+            currents.append(None)
+            starting_currents.append(None)
+            breakers.append(None)
+            cross_sections.append(None)
+            errors.append(error)
+            continue
+        current = power / (scale * (cos_phi * efficiency * voltage))
+        required = current * protection
+        if required <= largest_breaker:
+            breaker = BREAKER_RATINGS[bisect_left(BREAKER_RATINGS, required)]
+            cross_section = find_wire(breaker)
+        else:
+            breaker = cross_section = None
+        currents.append(current)
+        starting_currents.append(current * starting_ratio)
+        breakers.append(breaker)
+        cross_sections.append(cross_section)
+        errors.append(None)
+    return MotorColumns(currents, starting_currents, breakers, cross_sections), errors
+
+
+def transformer_currents(rating, primary_voltage, secondary_voltage, three_phase=True):
+    """(primary, secondary) rated currents [A] of a transformer of rating [VA]"""
+    scale = SQRT3 if three_phase else 1
+    return rating / (scale * primary_voltage), rating / (scale * secondary_voltage)
+
+
+def short_circuit_impedance(rating, voltage, impedance_voltage):
+    """Short-circuit impedance [Ω] seen from the side of voltage
+
+    impedance_voltage is the nameplate u_k in %: Zk = u_k U² / S.
+    """
+    return impedance_voltage / 100 * voltage ** 2 / rating
+
+
+def transformer_result(rating, primary_voltage, secondary_voltage, impedance_voltage=None, three_phase=True):
+    """Result with a dict of the rated currents, turns ratio and short circuit values
+
+    Keys: 'primary_current', 'secondary_current', 'turns_ratio' and, with
+    the nameplate u_k [%], 'impedance' (secondary side) [Ω] and
+    'short_circuit_current' [A], the secondary current of a bolted short
+    circuit fed from a stiff network; otherwise those two are None.
+    """
+    for value in (rating, primary_voltage, secondary_voltage):
+        if value is None:
+            return Result(None, ERROR_MISSING)
+        if not -MAX_INPUT <= value <= MAX_INPUT:
+            return Result(None, ERROR_RANGE)
+        if value < 0:
+            return Result(None, ERROR_NEGATIVE)
+        if value == 0:
+            return Result(None, ERROR_ZERO)
+    if impedance_voltage is not None and not 0 < impedance_voltage <= 100:
+        return Result(None, ERROR_RANGE)
+
+    primary_current, secondary_current = transformer_currents(
+        rating, primary_voltage, secondary_voltage, three_phase)
+    impedance = short_circuit_current = None
+    if impedance_voltage is not None:
+        impedance = short_circuit_impedance(rating, secondary_voltage, impedance_voltage)
+        short_circuit_current = secondary_current * 100 / impedance_voltage
+    if not all(math.isfinite(value) for value in (primary_current, secondary_current,
+                                                   primary_voltage / secondary_voltage,
+                                                   impedance or 0, short_circuit_current or 0)):
+        return Result(None, ERROR_RANGE)
+    return Result({
+        'primary_current': primary_current,
+        'secondary_current': secondary_current,
+        # Ratio of the line voltages; the winding ratio also depends on the vector group
+        'turns_ratio': primary_voltage / secondary_voltage,
+        'impedance': impedance,
+        'short_circuit_current': short_circuit_current,
+    }, None)
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Entry point for buildozer (source.main_py), the app itself is in app.py"""
+
+from app import ElectricalHelperApp
+
+if __name__ == '__main__':
+    ElectricalHelperApp().run()
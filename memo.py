@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Bounded LRU memoization with hit, miss and eviction counters.
+
+Used to cache the calculator functions in calculations.py, so repeated
+queries from the GUI handlers, batch jobs and the calculation service are
+answered from memory. Cached results are shared between callers and must
+not be mutated.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+CacheStats = namedtuple('CacheStats', 'hits misses evictions size maxsize')
+
+# Every cache created by memoize(), by function name, for cache_stats()
+_registry = {}
+
+
+class LRUCache:
+    """Mapping with a maximum size that evicts the least recently used key"""
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key):
+        """(True, value) for a cached key, (False, None) otherwise"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def store(self, key, value):
+        """Cache value under key, evicting the oldest entry when full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+    def __len__(self):
+        return len(self._data)
+
+
+def memoize(maxsize=1024, key=None):
+    """Decorator caching results in an LRUCache.
+
+    key, if given, is called with the function's arguments and returns the
+    normalised cache key, so equivalent calls share one entry. Without it
+    the positional and keyword arguments are used as they are.
+    The cache is available as the wrapper's ``cache`` attribute.
+    """
+    def decorator(func):
+        cache = LRUCache(maxsize)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if key is not None:
+                cache_key = key(*args, **kwargs)
+            elif kwargs:
+                cache_key = (args, tuple(sorted(kwargs.items())))
+            else:
+                cache_key = args
+            try:
+                found, value = cache.lookup(cache_key)
+            except TypeError:
+                # Unhashable arguments are computed without caching
+                return func(*args, **kwargs)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            cache.store(cache_key, value)
+            return value
+
+        wrapper.cache = cache
+        _registry[func.__qualname__] = cache
+        return wrapper
+    return decorator
+
+
+def cache_stats():
+    """Statistics of every memoized function, by function name"""
+    return {name: cache.stats()._asdict() for name, cache in _registry.items()}
+
+
+def clear_caches():
+    """Empty every memoized function's cache"""
+    for cache in _registry.values():
+        cache.clear()
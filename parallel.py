@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Parallel execution of the batch calculations for large jobs.
+
+run() splits the input columns into chunks and hands them to a pool of
+worker processes. Inputs and outputs are arrays of doubles in shared
+memory: the pool only pickles the (start, stop) bounds of each chunk, and
+every worker writes its results straight into their rows of the output,
+so the merged result is in input order no matter which chunk finished
+first.
+
+Missing inputs (None) and invalid outputs are stored as NaN in the
+shared arrays; error codes are stored as one byte per row, an index into
+ERROR_CODES.
+
+Usage from a script or nightly job (no Kivy needed):
+
+    from parallel import run
+    result = run('voltage_drop', [currents, lengths, cross_sections], three_phase=True)
+    result.columns[0]   # array('d') of voltage drops, NaN where invalid
+    result.errors       # list of error codes, None for valid rows
+    result.workers      # per-worker rows, busy time and throughput
+"""
+
+import math
+import os
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from calculations import (
+    ERROR_INCOMPATIBLE, ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE, ERROR_UNDERDETERMINED,
+    ERROR_UNKNOWN, ERROR_ZERO, current_batch, ohms_law_result, voltage_drop_batch, wire_batch
+)
+from machines import motor_batch
+
+# Error code of every byte value in the shared error array, 0 is a valid row
+ERROR_CODES = (None, ERROR_MISSING, ERROR_ZERO, ERROR_NEGATIVE, ERROR_RANGE, ERROR_UNKNOWN,
+               ERROR_INCOMPATIBLE, ERROR_UNDERDETERMINED)
+_ERROR_INDEX = {code: index for index, code in enumerate(ERROR_CODES)}
+
+# Chunks per worker, enough to even out uneven chunks without much dispatch overhead
+CHUNKS_PER_WORKER = 8
+
+MIN_CHUNK_SIZE = 10000
+
+_DOUBLE_SIZE = array('d').itemsize
+
+BatchResult = namedtuple('BatchResult', 'columns errors workers seconds')
+
+WorkerStats = namedtuple('WorkerStats', 'chunks rows seconds rows_per_second')
+
+
+def _current_kernel(columns, three_phase=False):
+    currents, errors = current_batch(columns[0], columns[1], three_phase)
+    return [currents], errors
+
+
+def _wire_kernel(columns, installation=None):
+    if installation is None:
+        cross_sections, errors = wire_batch(columns[0])
+    else:
+        cross_sections, errors = wire_batch(columns[0], installation)
+    # The wire table holds cross sections as strings, the shared output holds numbers
+    return [[None if value is None else float(value) for value in cross_sections]], errors
+
+
+def _voltage_drop_kernel(columns, **options):
+    drops, errors = voltage_drop_batch(columns[0], columns[1], columns[2], **options)
+    return [drops], errors
+
+
+def _motor_kernel(columns, **options):
+    motors, errors = motor_batch(*columns, **options)
+    cross_sections = [None if value is None else float(value) for value in motors.cross_section]
+    return [motors.current, motors.starting_current, motors.breaker, cross_sections], errors
+
+
+def _ohms_law_kernel(columns):
+    outputs = ([], [], [], [])
+    errors = []
+    for row in zip(*columns):
+        result = ohms_law_result(*row)
+        values = result.value
+        if values is None:
+            for output in outputs:
+                output.append(None)
+        else:
+            for output, key in zip(outputs, 'UIRP'):
+                output.append(values[key])
+        errors.append(result.error)
+    return outputs, errors
+
+
+# name -> (kernel, number of input columns, number of output columns)
+KERNELS = {
+    'current': (_current_kernel, 2, 1),
+    'wire': (_wire_kernel, 1, 1),
+    'voltage_drop': (_voltage_drop_kernel, 3, 1),
+    # Inputs and outputs are U, I, R, P; unknown inputs are None
+    'ohms_law': (_ohms_law_kernel, 4, 4),
+    # Inputs power, voltage, cos φ, efficiency; outputs current, starting current, breaker, cross section
+    'motor': (_motor_kernel, 4, 4),
+}
+
+
+# Shared memory and kernel of the job, set in every worker by _attach
+_job = {}
+
+
+def _attach(kernel_name, options, rows, input_name, output_name):
+    inputs = shared_memory.SharedMemory(name=input_name)
+    outputs = shared_memory.SharedMemory(name=output_name)
+    _job.update(
+        kernel=KERNELS[kernel_name],
+        options=options,
+        rows=rows,
+        # Keep the blocks referenced, their buffers are only valid while they are open
+        blocks=(inputs, outputs),
+        inputs=inputs.buf.cast('d'),
+        outputs=outputs.buf[:_output_bytes(rows, KERNELS[kernel_name][2])].cast('d'),
+        errors=outputs.buf[_output_bytes(rows, KERNELS[kernel_name][2]):],
+    )
+
+
+def _output_bytes(rows, output_count):
+    return rows * output_count * _DOUBLE_SIZE
+
+
+def _run_chunk(start, stop):
+    """Run the job's kernel on rows [start, stop), returns (pid, rows, seconds)"""
+    began = time.perf_counter()
+    kernel, input_count, output_count = _job['kernel']
+    rows = _job['rows']
+    inputs = _job['inputs']
+    columns = []
+    for index in range(input_count):
+        offset = index * rows
+        columns.append([None if value != value else value
+                        for value in inputs[offset + start:offset + stop].tolist()])
+
+    outputs, errors = kernel(columns, **_job['options'])
+
+    shared = _job['outputs']
+    for index, values in enumerate(outputs):
+        offset = index * rows
+        shared[offset + start:offset + stop] = array(
+            'd', [math.nan if value is None else value for value in values])
+    _job['errors'][start:stop] = bytes(_ERROR_INDEX[error] for error in errors)
+    return os.getpid(), stop - start, time.perf_counter() - began
+
+
+def _chunks(rows, chunk_size):
+    return [(start, min(start + chunk_size, rows)) for start in range(0, rows, chunk_size)]
+
+
+def _fill_inputs(block, columns, rows):
+    view = block.buf.cast('d')
+    try:
+        for index, column in enumerate(columns):
+            if len(column) != rows:
+                raise ValueError("input columns differ in length")
+            view[index * rows:(index + 1) * rows] = array(
+                'd', [math.nan if value is None else value for value in column])
+    finally:
+        view.release()
+
+
+def run(kernel_name, columns, workers=None, chunk_size=None, **options):
+    """Run a kernel of KERNELS over equally long input columns in parallel.
+
+    options are passed to the kernel, e.g. three_phase=True. workers
+    defaults to the number of CPUs, chunk_size to a size giving each worker
+    CHUNKS_PER_WORKER chunks. Returns a BatchResult with the output columns
+    as arrays of doubles, the error codes, per-worker WorkerStats by
+    process id and the wall time in seconds.
+    """
+    kernel, input_count, output_count = KERNELS[kernel_name]
+    if len(columns) != input_count:
+        raise ValueError(f"kernel {kernel_name!r} takes {input_count} input columns")
+    rows = len(columns[0])
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, math.ceil(rows / (workers * CHUNKS_PER_WORKER)))
+
+    began = time.perf_counter()
+    # SharedMemory refuses size 0, an empty job still gets one double
+    inputs = shared_memory.SharedMemory(create=True, size=max(_DOUBLE_SIZE, rows * input_count * _DOUBLE_SIZE))
+    outputs = shared_memory.SharedMemory(create=True, size=max(_DOUBLE_SIZE, _output_bytes(rows, output_count) + rows))
+    try:
+        _fill_inputs(inputs, columns, rows)
+        stats = {}
+        chunks = _chunks(rows, chunk_size)
+        if chunks:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_attach,
+                                     initargs=(kernel_name, options, rows, inputs.name, outputs.name)) as pool:
+                starts, stops = zip(*chunks)
+                for pid, chunk_rows, seconds in pool.map(_run_chunk, starts, stops):
+                    chunk_count, total_rows, busy = stats.get(pid, (0, 0, 0.0))
+                    stats[pid] = (chunk_count + 1, total_rows + chunk_rows, busy + seconds)
+
+        shared = outputs.buf[:_output_bytes(rows, output_count)].cast('d')
+        result_columns = [array('d', shared[index * rows:(index + 1) * rows]) for index in range(output_count)]
+        shared.release()
+        errors = [ERROR_CODES[code] for code in outputs.buf[_output_bytes(rows, output_count):][:rows]]
+    finally:
+        inputs.close()
+        inputs.unlink()
+        outputs.close()
+        outputs.unlink()
+
+    workers_stats = {pid: WorkerStats(chunk_count, total_rows, busy, total_rows / busy if busy else 0.0)
+                     for pid, (chunk_count, total_rows, busy) in stats.items()}
+    return BatchResult(result_columns, errors, workers_stats, time.perf_counter() - began)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Parsing of numbers typed by the user or read from CSV files.
+
+Besides plain numbers the parser accepts a decimal comma ("2,5"), SI
+prefixes ("2.2k", "10 mA"), unit suffixes ("16 A", "230V") and RKM notation
+as printed on components ("4k7", "R47", "2M2"). Everything is matched by a
+single compiled pattern in one pass; plain integers skip even that. Values
+are returned in base units, e.g. "10 mA" -> 0.01.
+"""
+
+import re
+
+# SI prefixes and their powers of ten, 'u' stands for 'µ'
+PREFIXES = {
+    'p': -12, 'n': -9, 'u': -6, 'µ': -6, 'μ': -6, 'm': -3,
+    'k': 3, 'K': 3, 'M': 6, 'G': 9,
+}
+
+# Multiplier letters of RKM notation (IEC 60062), the letter marks the decimal point
+RKM_LETTERS = dict(PREFIXES, R=0, r=0)
+
+# Unit symbols the parser accepts, with their aliases
+UNIT_ALIASES = {
+    'V': 'V', 'A': 'A', 'W': 'W', 'Ω': 'Ω', 'ohm': 'Ω', 'Ohm': 'Ω', 'Hz': 'Hz',
+    'F': 'F', 'H': 'H', 'VA': 'VA', 'var': 'var', 'Wh': 'Wh', 's': 's', 'm': 'm',
+}
+
+_QUANTITY = re.compile(r'''
+    \s*(?P<sign>[+-]?)
+    (?:
+        (?P<whole>\d*)(?P<rkm>[RrpnuµμmkKMG])(?P<fraction>\d+)
+      | (?P<number>(?:\d+(?:[.,]\d*)?|[.,]\d+)(?:[eE][+-]?\d+)?)
+    )
+    \s*(?P<suffix>[^\W\d_]*)\s*$
+''', re.VERBOSE)
+
+# (power of ten, unit) of every suffix the parser understands
+_SUFFIXES = {'': (0, None)}
+for _alias, _unit in UNIT_ALIASES.items():
+    _SUFFIXES[_alias] = (0, _unit)
+for _prefix, _exponent in PREFIXES.items():
+    _SUFFIXES.setdefault(_prefix, (_exponent, None))
+    for _alias, _unit in UNIT_ALIASES.items():
+        _SUFFIXES.setdefault(_prefix + _alias, (_exponent, _unit))
+del _alias, _unit, _prefix, _exponent
+
+_BASE_UNITS = frozenset(UNIT_ALIASES.values())
+
+_MISSING = object()
+
+
+def parse_quantity(text, unit=None):
+    """Value of text in base units, or None if it isn't a valid number.
+
+    With unit, a unit written in the text must be that unit ("16 A" is
+    accepted for 'A', "16 V" is not); text without a unit always matches.
+    A prefixed unit such as 'kV' applies to plain numbers ("5" is 5000),
+    a prefix in the text replaces it ("5 mV" is 0.005, not 5 V).
+    """
+    if not text:
+        return None
+    scale = 0
+    if unit is not None and unit not in _BASE_UNITS:
+        scale, unit = _SUFFIXES.get(unit, (0, unit))
+    if text.isascii() and text.isdigit():
+        return _scaled(float(text), scale) if scale else float(text)
+    match = _QUANTITY.match(text)
+    if match is None:
+        return None
+    sign, whole, rkm, fraction, number, suffix = match.groups()
+
+    resolved = _SUFFIXES.get(suffix)
+    if resolved is None:
+        return None
+    exponent, suffix_unit = resolved
+    if suffix == 'm' and unit != 'm':
+        # A lone "m" is the metre only where a length is expected, elsewhere the milli prefix ("5m" is 5 mA)
+        exponent, suffix_unit = PREFIXES['m'], None
+    if unit is not None and suffix_unit is not None and suffix_unit != unit:
+        return None
+
+    if rkm is None:
+        value = float(number.replace(',', '.'))
+        if not suffix:
+            exponent = scale
+    else:
+        if not whole and rkm not in 'Rr':
+            return None
+        value = float(f"{whole or 0}.{fraction}")
+        exponent += RKM_LETTERS[rkm]
+    value = _scaled(value, exponent)
+    return -value if sign == '-' else value
+
+
+def _scaled(value, exponent):
+    # Dividing by an exact power of ten keeps "1n5" at 1.5e-09, not 1.5000000000000002e-09
+    if exponent > 0:
+        return value * 10.0 ** exponent
+    if exponent < 0:
+        return value / 10.0 ** -exponent
+    return value
+
+
+def parse_float(text, unit=None):
+    """Like parse_quantity, but raises ValueError like float() does"""
+    value = parse_quantity(text, unit)
+    if value is None:
+        raise ValueError(f"could not convert string to float: {text!r}")
+    return value
+
+
+def parse_column(cells, unit=None):
+    """List of parse_quantity results for a column of strings, e.g. CSV cells.
+
+    Columns repeat values, so each distinct cell is parsed once.
+    """
+    parsed = {}
+    results = []
+    append = results.append
+    for cell in cells:
+        value = parsed.get(cell, _MISSING)
+        if value is _MISSING:
+            value = parsed[cell] = parse_quantity(cell, unit)
+        append(value)
+    return results
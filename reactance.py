@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Reactance, impedance, time constants and resonance of R, L and C circuits.
+
+Like calculations.py this module doesn't import Kivy. Units are base SI
+units: Hz, Ω, H, F and s; phases are in degrees. The series circuit of
+rlc_result() and frequency_sweep() is R, L and C in series driven by a
+voltage source, a missing component (None) is left out of the circuit.
+"""
+
+import cmath
+import math
+from array import array
+from collections import namedtuple
+
+from calculations import (
+    ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE, ERROR_UNDERDETERMINED, ERROR_UNKNOWN, ERROR_ZERO,
+    MAX_INPUT, Result
+)
+
+TWO_PI = 2 * math.pi
+
+# Points of a frequency sweep
+SWEEP_POINTS = 10000
+
+# Where the output of a swept circuit is taken and the filter it makes
+OUTPUTS = {'resistor': 'pásmová priepust', 'capacitor': 'dolná priepust', 'inductor': 'horná priepust'}
+
+Sweep = namedtuple('Sweep', 'frequencies gain_db phase')
+
+
+def capacitive_reactance(frequency, capacitance):
+    """Xc = 1 / (2π f C) [Ω]"""
+    return 1 / (TWO_PI * frequency * capacitance)
+
+
+def inductive_reactance(frequency, inductance):
+    """Xl = 2π f L [Ω]"""
+    return TWO_PI * frequency * inductance
+
+
+def series_impedance(frequency, resistance=0, inductance=None, capacitance=None):
+    """Complex impedance [Ω] of R, L and C in series"""
+    reactance = 0
+    if inductance is not None:
+        reactance += inductive_reactance(frequency, inductance)
+    if capacitance is not None:
+        reactance -= capacitive_reactance(frequency, capacitance)
+    return complex(resistance, reactance)
+
+
+def magnitude_phase(impedance):
+    """(|Z| [Ω], phase [°]) of a complex impedance"""
+    magnitude, phase = cmath.polar(impedance)
+    return magnitude, math.degrees(phase)
+
+
+def rc_time_constant(resistance, capacitance):
+    """τ = R C [s]"""
+    return resistance * capacitance
+
+
+def rl_time_constant(resistance, inductance):
+    """τ = L / R [s]"""
+    return inductance / resistance
+
+
+def charge_fraction(time, time_constant):
+    """Fraction of the final value an RC or RL step response reaches after time [s]"""
+    return 1 - math.exp(-time / time_constant)
+
+
+def time_to_fraction(fraction, time_constant):
+    """Time [s] an RC or RL step response takes to reach a fraction (0-1) of the final value"""
+    return -time_constant * math.log(1 - fraction)
+
+
+def resonant_frequency(inductance, capacitance):
+    """f0 = 1 / (2π √(L C)) [Hz]"""
+    return 1 / (TWO_PI * math.sqrt(inductance * capacitance))
+
+
+def quality_factor(resistance, inductance, capacitance, parallel=False):
+    """Q of a series (1/R √(L/C)) or parallel (R √(C/L)) RLC circuit"""
+    if parallel:
+        return resistance * math.sqrt(capacitance / inductance)
+    return math.sqrt(inductance / capacitance) / resistance
+
+
+def _value_error(value):
+    if not -MAX_INPUT <= value <= MAX_INPUT:
+        return ERROR_RANGE
+    if value < 0:
+        return ERROR_NEGATIVE
+    return None
+
+
+def _usable_product(a, b):
+    """False if a product the formulas divide by underflows to zero or overflows"""
+    return a is None or b is None or 0 < a * b < math.inf
+
+
+def rlc_result(frequency=None, resistance=None, inductance=None, capacitance=None):
+    """Result with a dict of everything the given values determine
+
+    Keys are 'Xl', 'Xc', 'Z', 'phase', 'tau', 'f0' and 'Q', None where the
+    inputs don't determine a value. ERROR_MISSING without inputs,
+    ERROR_UNDERDETERMINED (with the dict) when nothing could be derived.
+    """
+    inputs = (frequency, resistance, inductance, capacitance)
+    if all(value is None for value in inputs):
+        return Result(None, ERROR_MISSING)
+    for value in inputs:
+        if value is not None:
+            error = _value_error(value)
+            if error is not None:
+                return Result(None, error)
+    if 0 in (frequency, inductance, capacitance):
+        return Result(None, ERROR_ZERO)
+    # Xc divides by f C, f0 by √(L C)
+    if not _usable_product(frequency, capacitance) or not _usable_product(inductance, capacitance):
+        return Result(None, ERROR_RANGE)
+
+    values = dict.fromkeys(('Xl', 'Xc', 'Z', 'phase', 'tau', 'f0', 'Q'))
+    if frequency is not None:
+        if inductance is not None:
+            values['Xl'] = inductive_reactance(frequency, inductance)
+        if capacitance is not None:
+            values['Xc'] = capacitive_reactance(frequency, capacitance)
+        if resistance is not None or inductance is not None or capacitance is not None:
+            values['Z'], values['phase'] = magnitude_phase(
+                series_impedance(frequency, resistance or 0, inductance, capacitance))
+    if resistance is not None:
+        if capacitance is not None and inductance is None:
+            values['tau'] = rc_time_constant(resistance, capacitance)
+        elif inductance is not None and capacitance is None and resistance != 0:
+            values['tau'] = rl_time_constant(resistance, inductance)
+    if inductance is not None and capacitance is not None:
+        values['f0'] = resonant_frequency(inductance, capacitance)
+        if resistance:
+            values['Q'] = quality_factor(resistance, inductance, capacitance)
+
+    if all(value is None for value in values.values()):
+        return Result(values, ERROR_UNDERDETERMINED)
+    if any(value is not None and not math.isfinite(value) for value in values.values()):
+        return Result(None, ERROR_RANGE)
+    return Result(values, None)
+
+
+def log_frequencies(start, stop, points=SWEEP_POINTS):
+    """array of points frequencies [Hz] spaced evenly on a log scale from start to stop"""
+    if points == 1:
+        return array('d', [start])
+    log_start = math.log10(start)
+    step = (math.log10(stop) - log_start) / (points - 1)
+    # Each point from its own exponent, so rounding doesn't accumulate along the sweep
+    return array('d', [10 ** (log_start + i * step) for i in range(points)])
+
+
+def frequency_sweep(resistance, inductance=None, capacitance=None, start=10, stop=1e6,
+                    points=SWEEP_POINTS, output='resistor'):
+    """Result with the Bode response of the series circuit as a Sweep
+
+    The response is the voltage across output ('resistor', 'capacitor' or
+    'inductor') over the source voltage, gain in dB and phase in degrees,
+    at points log-spaced frequencies. Gain and phase are computed in one
+    pass over the frequencies.
+    """
+    if output not in OUTPUTS:
+        return Result(None, ERROR_UNKNOWN)
+    for value in (resistance, inductance, capacitance, start, stop):
+        if value is not None:
+            error = _value_error(value)
+            if error is not None:
+                return Result(None, error)
+    if resistance is None or start is None or stop is None:
+        return Result(None, ERROR_MISSING)
+    if {'resistor': resistance, 'capacitor': capacitance, 'inductor': inductance}[output] is None:
+        # The output is taken across a component the circuit doesn't have
+        return Result(None, ERROR_MISSING)
+    if 0 in (resistance, inductance, capacitance, start, stop) or points < 1:
+        return Result(None, ERROR_ZERO)
+    # Xc divides by ω C, smallest at the lowest frequency
+    if not _usable_product(min(start, stop), capacitance) or (
+            capacitance is not None and not 1 / capacitance < math.inf):
+        return Result(None, ERROR_RANGE)
+
+    frequencies = log_frequencies(start, stop, points)
+    gain_db = array('d', bytes(8 * points))
+    phase = array('d', bytes(8 * points))
+    # Hoisted out of the loop: per point only ω changes
+    has_c = capacitance is not None
+    inductance = inductance or 0.0
+    inverse_capacitance = 1 / capacitance if has_c else 0.0
+    log10 = math.log10
+    atan2 = math.atan2
+    degrees = 180 / math.pi
+    for i, frequency in enumerate(frequencies):
+        omega = TWO_PI * frequency
+        reactance_l = omega * inductance
+        reactance_c = inverse_capacitance / omega
+        impedance = complex(resistance, reactance_l - reactance_c)
+        if output == 'resistor':
+            response = resistance / impedance
+        elif output == 'capacitor':
+            response = complex(0, -reactance_c) / impedance
+        else:
+            response = complex(0, reactance_l) / impedance
+        magnitude = abs(response)
+        gain_db[i] = 20 * log10(magnitude) if magnitude else -math.inf
+        phase[i] = atan2(response.imag, response.real) * degrees
+    return Result(Sweep(frequencies, gain_db, phase), None)
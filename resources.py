@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""Bundled resources: file paths and the indexed resource archive.
+
+For the APK the symbol images are packed into resources.zip, an
+uncompressed zip built by this module. The archive's central directory is
+read once into a name -> (offset, size) index; file contents are then
+memoryview slices of the memory-mapped archive, nothing is extracted or
+decompressed. Loose files next to the app still take precedence, so the
+source tree runs without building the archive.
+
+Build the archive from the repository root, after generating the image
+variants (see image_variants.py):
+
+    python resources.py resources.zip images
+"""
+
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+import zipfile
+
+from image_variants import MANIFEST_NAME
+from memo import LRUCache
+
+# Directory of the application's modules, also the root of its resources
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ARCHIVE_NAME = 'resources.zip'
+
+# Sizes of the symbol images and their smaller variants, see image_variants.py
+VARIANTS_MANIFEST = f"images/{MANIFEST_NAME}"
+
+# Zip local file header up to the file name, see the zip APPNOTE 4.3.7
+_LOCAL_HEADER = struct.Struct('<4sHHHHHIIIHH')
+_LOCAL_HEADER_MAGIC = b'PK\x03\x04'
+
+_archive = None
+
+# Decoded textures of archived images, for revisited and preloaded symbols
+_textures = LRUCache(maxsize=32)
+
+_variants = None
+
+
+class ResourceArchive:
+    """Read-only view of an uncompressed zip archive through mmap"""
+
+    def __init__(self, path):
+        self.path = path
+        with zipfile.ZipFile(path) as archive:
+            infos = [info for info in archive.infolist() if not info.is_dir()]
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index = {}
+        for info in infos:
+            if info.compress_type != zipfile.ZIP_STORED:
+                self.close()
+                raise ValueError(f"{path}: {info.filename} is compressed, rebuild the archive")
+            (magic, _, _, _, _, _, _, _, _,
+             name_length, extra_length) = _LOCAL_HEADER.unpack_from(self._map, info.header_offset)
+            if magic != _LOCAL_HEADER_MAGIC:
+                self.close()
+                raise ValueError(f"{path}: bad local header for {info.filename}")
+            offset = info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+            self._index[info.filename] = (offset, info.file_size)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def names(self):
+        return list(self._index)
+
+    def read(self, name):
+        """Contents of a file as a memoryview into the archive"""
+        offset, size = self._index[name]
+        return memoryview(self._map)[offset:offset + size]
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+def get_resource_path(relative_path):
+    """Absolute path of a loose resource file, relative to the app directory"""
+    return os.path.join(APP_DIR, relative_path)
+
+
+def get_archive():
+    """The bundled resource archive, or None when the app runs from loose files"""
+    global _archive
+    if _archive is None:
+        path = get_resource_path(ARCHIVE_NAME)
+        if not os.path.exists(path):
+            return None
+        _archive = ResourceArchive(path)
+    return _archive
+
+
+def resource_exists(relative_path):
+    """True if the resource is a loose file or in the archive"""
+    if os.path.exists(get_resource_path(relative_path)):
+        return True
+    archive = get_archive()
+    return archive is not None and relative_path in archive
+
+
+def read_resource(relative_path):
+    """Contents of a loose or archived resource, or None if it doesn't exist"""
+    path = get_resource_path(relative_path)
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return f.read()
+    archive = get_archive()
+    if archive is None or relative_path not in archive:
+        return None
+    return archive.read(relative_path)
+
+
+def image_variant(relative_path, width, height):
+    """Smallest variant of an image that stays sharp fitted into width x height px"""
+    global _variants
+    if _variants is None:
+        manifest = read_resource(VARIANTS_MANIFEST)
+        _variants = json.loads(bytes(manifest)) if manifest is not None else {}
+    entry = _variants.get(relative_path)
+    if not entry:
+        return relative_path
+    original_width, original_height = entry['size']
+    # Width at which the image is drawn when scaled to fit, keeping its ratio
+    shown_width = original_width * min(width / original_width, height / original_height)
+    directory, name = os.path.split(relative_path)
+    for variant_width in entry['widths']:
+        if variant_width >= shown_width:
+            return f"{directory}/w{variant_width}/{name}"
+    return relative_path
+
+
+def image_texture(relative_path):
+    """Decoded texture of an archived image, or None if it isn't archived"""
+    found, texture = _textures.lookup(relative_path)
+    if found:
+        return texture
+    archive = get_archive()
+    if archive is None or relative_path not in archive:
+        return None
+
+    from kivy.core.image import Image as CoreImage
+
+    extension = os.path.splitext(relative_path)[1][1:].lower()
+    texture = CoreImage(io.BytesIO(archive.read(relative_path)), ext=extension,
+                        filename=relative_path).texture
+    _textures.store(relative_path, texture)
+    return texture
+
+
+def load_image(image_widget, relative_path, size=None):
+    """Show a resource image in a Kivy Image widget.
+
+    With size, the (width, height) in pixels the image is shown at, the
+    smallest sufficient variant is loaded. Returns False if the resource
+    doesn't exist.
+    """
+    if size is not None:
+        relative_path = image_variant(relative_path, *size)
+    path = get_resource_path(relative_path)
+    if os.path.exists(path):
+        image_widget.source = path
+        return True
+    texture = image_texture(relative_path)
+    if texture is None:
+        return False
+    image_widget.source = ''
+    image_widget.texture = texture
+    return True
+
+
+def preload_image(relative_path, size=None):
+    """Decode an image ahead of time, so showing it later needs no decoding"""
+    if size is not None:
+        relative_path = image_variant(relative_path, *size)
+    path = get_resource_path(relative_path)
+    if os.path.exists(path):
+        from kivy.core.image import Image as CoreImage
+        # Kivy keeps the texture in its cache under the file name
+        CoreImage(path)
+    else:
+        image_texture(relative_path)
+
+
+def build_archive(path, directories):
+    """Pack the files under directories into an uncompressed archive"""
+    count = 0
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for directory in directories:
+            for root, dirs, files in os.walk(directory):
+                dirs.sort()
+                for filename in sorted(files):
+                    source = os.path.join(root, filename)
+                    name = os.path.relpath(source, os.path.dirname(os.path.abspath(directory)))
+                    archive.write(source, name.replace(os.sep, '/'))
+                    count += 1
+    return count
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        sys.exit(f"usage: {sys.argv[0]} ARCHIVE DIRECTORY...")
+    count = build_archive(sys.argv[1], sys.argv[2:])
+    print(f"Packed {count} files into {sys.argv[1]}")
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""Local HTTP/JSON service exposing the calculators to other tools.
+
+Run from the repository root:
+
+    python server.py --port 8765
+
+Endpoints (POST with a JSON object, or an array of objects for a batch):
+
+    /ohms-law   {"voltage", "current", "resistance", "power"}, any two
+    /current    {"power", "voltage", "three_phase": false}
+    /wire       {"current", "installation": "air" | "ground"}
+    /resistor   {"first", "second", "multiplier"} band colour names
+    /convert    {"value", "from", "to"}
+
+Invalid items get {"error": message, "code": error code} in place of their
+result, so a batch with bad rows is answered like any other batch. Results
+are always finite numbers, values that overflow get the code "range".
+
+GET /stats returns request counts, throughput, latency percentiles and the
+calculator cache statistics. Connections are kept alive (HTTP/1.1). Batches
+larger than --batch-threshold items are computed in a bounded process pool
+so they don't stall the event loop.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from calculations import (
+    ERROR_INCOMPATIBLE, ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE,
+    ERROR_UNDERDETERMINED, ERROR_UNKNOWN, ERROR_ZERO, INSTALLATION_AIR,
+    INSTALLATION_GROUND, conversion_result, current_result, ohms_law_result,
+    resistor_result, wire_result
+)
+from memo import cache_stats
+
+# Number of recent request latencies kept for the percentiles
+LATENCY_SAMPLES = 10000
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+_INSTALLATIONS = {
+    'air': INSTALLATION_AIR, 'ground': INSTALLATION_GROUND,
+    INSTALLATION_AIR: INSTALLATION_AIR, INSTALLATION_GROUND: INSTALLATION_GROUND,
+}
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+# Messages for the calculators' error codes
+_ERROR_MESSAGES = {
+    ERROR_MISSING: "missing value",
+    ERROR_ZERO: "voltage must not be zero",
+    ERROR_NEGATIVE: "value must not be negative",
+    ERROR_RANGE: "value out of range",
+    ERROR_UNKNOWN: "unknown band colour, unit or installation",
+    ERROR_INCOMPATIBLE: "incompatible units",
+    ERROR_UNDERDETERMINED: "the values given don't determine the others",
+}
+
+
+def _numbers(item, names):
+    """(values, error) of numeric fields, absent fields are None"""
+    values = []
+    for name in names:
+        value = item.get(name)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            return None, {'error': f"'{name}' must be a number", 'code': ERROR_MISSING}
+        values.append(value)
+    return values, None
+
+
+def _text(item, name):
+    """String field of a request item, None for anything else"""
+    value = item.get(name)
+    return value if isinstance(value, str) else None
+
+
+def _response(result, name):
+    if result.error is not None:
+        return {'error': _ERROR_MESSAGES[result.error], 'code': result.error}
+    return {name: result.value}
+
+
+def _ohms_law(item):
+    values, error = _numbers(item, ('voltage', 'current', 'resistance', 'power'))
+    if error is not None:
+        return error
+    result = ohms_law_result(*values)
+    if result.error == ERROR_MISSING:
+        return {'error': "at least two of voltage, current, resistance, power are required",
+                'code': ERROR_MISSING}
+    if result.error is not None:
+        return _response(result, None)
+    return {'voltage': result.value['U'], 'current': result.value['I'],
+            'resistance': result.value['R'], 'power': result.value['P']}
+
+
+def _current(item):
+    values, error = _numbers(item, ('power', 'voltage'))
+    if error is not None:
+        return error
+    return _response(current_result(*values, three_phase=item.get('three_phase') is True), 'current')
+
+
+def _wire(item):
+    values, error = _numbers(item, ('current',))
+    if error is not None:
+        return error
+    installation = _INSTALLATIONS.get(_text(item, 'installation') or 'air')
+    result = wire_result(values[0], installation)
+    if result.error is not None:
+        return _response(result, None)
+    # The wire table holds cross sections as display strings
+    return {'cross_section': float(result.value)}
+
+
+def _resistor(item):
+    result = resistor_result(_text(item, 'first'), _text(item, 'second'), _text(item, 'multiplier'))
+    return _response(result, 'resistance')
+
+
+def _convert(item):
+    values, error = _numbers(item, ('value',))
+    if error is not None:
+        return error
+    return _response(conversion_result(values[0], _text(item, 'from'), _text(item, 'to')), 'value')
+
+
+ENDPOINTS = {
+    '/ohms-law': _ohms_law,
+    '/current': _current,
+    '/wire': _wire,
+    '/resistor': _resistor,
+    '/convert': _convert,
+}
+
+
+def evaluate(path, items):
+    """Results for a list of request items, errors are reported per item"""
+    handler = ENDPOINTS[path]
+    return [handler(item) if isinstance(item, dict)
+            else {'error': "item must be a JSON object", 'code': ERROR_MISSING}
+            for item in items]
+
+
+class Metrics:
+    """Request counters and a window of recent latencies"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.items = 0
+        self.errors = 0
+        self.by_endpoint = {}
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, path, items, status, latency):
+        self.requests += 1
+        self.items += items
+        if status >= 400:
+            self.errors += 1
+        self.by_endpoint[path] = self.by_endpoint.get(path, 0) + 1
+        self.latencies.append(latency)
+
+    def snapshot(self):
+        uptime = time.monotonic() - self.started
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+        return {
+            'uptime_s': uptime,
+            'requests': self.requests,
+            'items': self.items,
+            'errors': self.errors,
+            'requests_per_s': self.requests / uptime if uptime else 0,
+            'items_per_s': self.items / uptime if uptime else 0,
+            'by_endpoint': self.by_endpoint,
+            'latency_ms': {'p50': percentile(0.5), 'p90': percentile(0.9),
+                           'p99': percentile(0.99), 'samples': len(latencies)},
+            'cache': cache_stats(),
+        }
+
+
+class CalculationServer:
+    """asyncio HTTP/1.1 server for the calculator endpoints"""
+
+    def __init__(self, host='127.0.0.1', port=8765, workers=None, batch_threshold=1000):
+        self.host = host
+        self.port = port
+        self.batch_threshold = batch_threshold
+        self.metrics = Metrics()
+        workers = workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(max_workers=workers)
+        # Bounds the batches waiting for the pool, the rest wait in the event loop
+        self._pool_slots = asyncio.Semaphore(workers * 2)
+
+    async def serve(self):
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self._pool.shutdown()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                started = time.perf_counter()
+                request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = request_line.split(' ', 2)
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "malformed request line"}, False)
+                    break
+                headers = {}
+                for line in header_lines:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                try:
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {'error': "invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {'error': "request body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                path = target.split('?', 1)[0]
+                status, payload, items = await self._dispatch(method, path, body)
+                await self._respond(writer, status, payload, keep_alive)
+                self.metrics.record(path, items, status, time.perf_counter() - started)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, path, body):
+        """(status, JSON payload, number of items) for a request"""
+        if path == '/stats':
+            if method != 'GET':
+                return 405, {'error': "use GET"}, 0
+            return 200, self.metrics.snapshot(), 0
+        if path not in ENDPOINTS:
+            return 404, {'error': f"unknown endpoint {path}"}, 0
+        if method != 'POST':
+            return 405, {'error': "use POST"}, 0
+        try:
+            request = json.loads(body)
+        except ValueError:
+            return 400, {'error': "body is not valid JSON"}, 0
+
+        if isinstance(request, list):
+            if len(request) > self.batch_threshold:
+                async with self._pool_slots:
+                    loop = asyncio.get_running_loop()
+                    results = await loop.run_in_executor(self._pool, evaluate, path, request)
+            else:
+                results = evaluate(path, request)
+            return 200, results, len(request)
+
+        result = evaluate(path, [request])[0]
+        return (400 if 'error' in result else 200), result, 1
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        try:
+            # NaN and Infinity aren't JSON, clients would reject the whole response
+            body = json.dumps(payload, ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+        except ValueError:
+            status = 500
+            body = json.dumps({'error': "result is not a finite number", 'code': ERROR_RANGE})
+        body = body.encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode('latin-1')
+        writer.write(head + body)
+        await writer.drain()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON calculation service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="processes for large batches (default: CPU count)")
+    parser.add_argument('--batch-threshold', type=int, default=1000,
+                        help="batches with more items are computed in the process pool")
+    args = parser.parse_args(argv)
+
+    server = CalculationServer(args.host, args.port, args.workers, args.batch_threshold)
+    print(f"Serving calculators on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
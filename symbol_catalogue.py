@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""Compact indexed symbol catalogue file.
+
+The catalogue source is a tab separated text file (data/symbols.tsv) that is
+compiled into a binary file (data/symbols.bin) read through mmap. Opening the
+catalogue only parses the fixed-size header; rows, names and the name index
+are paged in by the OS when they are first touched.
+
+File layout (little endian):
+
+    header      MAGIC, version, row count, category count and section offsets
+    categories  per category: name offset u32, name length u16, first
+                position u32 and row count u32 in the category index
+    rows        per symbol, sorted by id: id u32, name offset u32,
+                image offset u32, name length u16, image length u16,
+                category u16, padding
+    name index  row numbers u32 sorted by casefolded name
+    category    row numbers u32 grouped by category, in category order,
+    index       so each category is one contiguous slice
+    strings     UTF-8 names and image paths referenced by offset
+
+To rebuild the binary file after editing the source:
+
+    python symbol_catalogue.py data/symbols.tsv data/symbols.bin
+"""
+
+import mmap
+import os
+import struct
+import sys
+from collections import namedtuple
+
+MAGIC = b'ETSC'
+VERSION = 2
+
+_HEADER = struct.Struct('<4sHHIIIIIII')
+_CATEGORY = struct.Struct('<IH2xII')
+_ROW = struct.Struct('<IIIHHH2x')
+_INDEX = struct.Struct('<I')
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'symbols.bin')
+
+Symbol = namedtuple('Symbol', 'id name category image')
+
+# Contiguous run of positions in a display order, e.g. one category
+Section = namedtuple('Section', 'title start count')
+
+
+class SymbolCatalogue:
+    """Read-only mapping of symbol id -> name backed by a compiled catalogue"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _, self._count, category_count, categories_offset,
+         self._rows_offset, self._index_offset, self._category_index_offset,
+         self._strings_offset) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a symbol catalogue")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported catalogue version {version}")
+        # View of the row table so id lookups can bisect without unpacking whole rows
+        self._ids = memoryview(self._mmap)[self._rows_offset:self._index_offset]
+        self._categories = None
+        self._sections = None
+        self._category_count = category_count
+        self._categories_offset = categories_offset
+
+    def close(self):
+        """Release the mapping"""
+        self._ids.release()
+        self._mmap.close()
+
+    def _string(self, offset, length):
+        start = self._strings_offset + offset
+        return self._mmap[start:start + length].decode('utf-8')
+
+    def _row(self, index):
+        return _ROW.unpack_from(self._mmap, self._rows_offset + index * _ROW.size)
+
+    def _name(self, index):
+        _, name_offset, _, name_length, _, _ = self._row(index)
+        return self._string(name_offset, name_length)
+
+    def _row_id(self, index):
+        return _INDEX.unpack_from(self._ids, index * _ROW.size)[0]
+
+    def _find(self, symbol_id):
+        """Row number of symbol_id or -1"""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._row_id(middle) < symbol_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._row_id(low) == symbol_id:
+            return low
+        return -1
+
+    def _load_categories(self):
+        categories = []
+        sections = []
+        for i in range(self._category_count):
+            offset, length, start, count = _CATEGORY.unpack_from(
+                self._mmap, self._categories_offset + i * _CATEGORY.size
+            )
+            name = self._string(offset, length)
+            categories.append(name)
+            sections.append(Section(name, start, count))
+        self._categories = categories
+        self._sections = sections
+
+    @property
+    def categories(self):
+        """Category names in catalogue order"""
+        if self._categories is None:
+            self._load_categories()
+        return self._categories
+
+    @property
+    def sections(self):
+        """Section per category with its slice of the category order"""
+        if self._sections is None:
+            self._load_categories()
+        return self._sections
+
+    def by_category(self, position):
+        """Symbol at position of the category order"""
+        return self.symbol(_INDEX.unpack_from(self._mmap, self._category_index_offset + position * _INDEX.size)[0])
+
+    def by_name(self, position):
+        """Symbol at position of the name order"""
+        return self.symbol(_INDEX.unpack_from(self._mmap, self._index_offset + position * _INDEX.size)[0])
+
+    def symbol(self, index):
+        """Symbol at row number index"""
+        symbol_id, name_offset, image_offset, name_length, image_length, category = self._row(index)
+        return Symbol(
+            symbol_id,
+            self._string(name_offset, name_length),
+            self.categories[category],
+            self._string(image_offset, image_length)
+        )
+
+    def get_symbol(self, symbol_id):
+        """Symbol with the given id or None"""
+        index = self._find(symbol_id)
+        return self.symbol(index) if index >= 0 else None
+
+    def search(self, prefix):
+        """Symbols whose name starts with prefix (case insensitive)"""
+        prefix = prefix.casefold()
+
+        def index_at(position):
+            return _INDEX.unpack_from(self._mmap, self._index_offset + position * _INDEX.size)[0]
+
+        def name_at(position):
+            return self._name(index_at(position)).casefold()
+
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if name_at(middle) < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        matches = []
+        while low < self._count and name_at(low).startswith(prefix):
+            matches.append(self.symbol(index_at(low)))
+            low += 1
+        return matches
+
+    # Mapping interface so the catalogue can stand in for the old dict literal
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._row_id(i)
+
+    def __contains__(self, symbol_id):
+        return self._find(symbol_id) >= 0
+
+    def __getitem__(self, symbol_id):
+        index = self._find(symbol_id)
+        if index < 0:
+            raise KeyError(symbol_id)
+        return self._name(index)
+
+    def get(self, symbol_id, default=None):
+        index = self._find(symbol_id)
+        return self._name(index) if index >= 0 else default
+
+    def keys(self):
+        return iter(self)
+
+    def items(self):
+        for i in range(self._count):
+            yield self._row_id(i), self._name(i)
+
+    def values(self):
+        for _, name in self.items():
+            yield name
+
+
+def read_source(path):
+    """Read (id, category, name, image) rows from a catalogue source file"""
+    rows = []
+    with open(path, encoding='utf-8') as f:
+        header = f.readline().rstrip('\n').split('\t')
+        if header != ['id', 'category', 'name', 'image']:
+            raise ValueError(f"{path}: unexpected header {header}")
+        for line_number, line in enumerate(f, start=2):
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            fields = line.split('\t')
+            if len(fields) != 4:
+                raise ValueError(f"{path}:{line_number}: expected 4 columns, got {len(fields)}")
+            symbol_id, category, name, image = fields
+            rows.append((int(symbol_id), category, name, image or f"images/{symbol_id}.png"))
+    return rows
+
+
+def write_catalogue(rows, path):
+    """Compile (id, category, name, image) rows into a binary catalogue"""
+    rows = sorted(rows, key=lambda row: row[0])
+    ids = [row[0] for row in rows]
+    if len(set(ids)) != len(ids):
+        raise ValueError("duplicate symbol ids in catalogue")
+
+    strings = bytearray()
+    string_offsets = {}
+
+    def add_string(text):
+        if text not in string_offsets:
+            data = text.encode('utf-8')
+            if len(data) > 0xFFFF:
+                raise ValueError(f"string too long for catalogue: {text[:40]}...")
+            string_offsets[text] = (len(strings), len(data))
+            strings.extend(data)
+        return string_offsets[text]
+
+    categories = []
+    category_numbers = {}
+    for _, category, _, _ in rows:
+        if category not in category_numbers:
+            category_numbers[category] = len(categories)
+            categories.append(category)
+
+    category_order = sorted(range(len(rows)), key=lambda i: category_numbers[rows[i][1]])
+    category_index = b''.join(_INDEX.pack(i) for i in category_order)
+    category_counts = [0] * len(categories)
+    for _, category, _, _ in rows:
+        category_counts[category_numbers[category]] += 1
+
+    category_table = bytearray()
+    start = 0
+    for category, count in zip(categories, category_counts):
+        category_table += _CATEGORY.pack(*add_string(category), start, count)
+        start += count
+
+    row_table = bytearray()
+    for symbol_id, category, name, image in rows:
+        name_offset, name_length = add_string(name)
+        image_offset, image_length = add_string(image)
+        row_table += _ROW.pack(symbol_id, name_offset, image_offset, name_length,
+                               image_length, category_numbers[category])
+
+    name_order = sorted(range(len(rows)), key=lambda i: rows[i][2].casefold())
+    name_index = b''.join(_INDEX.pack(i) for i in name_order)
+
+    categories_offset = _HEADER.size
+    rows_offset = categories_offset + len(category_table)
+    index_offset = rows_offset + len(row_table)
+    category_index_offset = index_offset + len(name_index)
+    strings_offset = category_index_offset + len(category_index)
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(rows), len(categories), categories_offset,
+                             rows_offset, index_offset, category_index_offset, strings_offset))
+        f.write(category_table)
+        f.write(row_table)
+        f.write(name_index)
+        f.write(category_index)
+        f.write(strings)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit(f"usage: {sys.argv[0]} SOURCE.tsv OUTPUT.bin")
+    source_rows = read_source(sys.argv[1])
+    write_catalogue(source_rows, sys.argv[2])
+    print(f"{len(source_rows)} symbols written to {sys.argv[2]}")
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""Reference tables (wire ampacity, colour codes, voltages) from data files.
+
+Every table edition is one JSON file, data/tables/{edition}.json:
+
+    format                file format version, must be FORMAT
+    edition, title        edition id (the file name) and the name shown to users
+    revision              revision of the data, increased on every change
+    wires                 [cross section mm², max current in ground A,
+                          max current in air A], ascending
+    resistor_colors       [colour name, digit 0-9, "#RRGGBB"]
+    tolerance_colors      [colour name, tolerance %]
+    voltages              voltages of the quick table [V]
+    three_phase_voltages  those of voltages that are three-phase line voltages
+
+A file is validated and parsed once into a Tables tuple with numeric
+columns, a broken file raises TableError and never replaces the active
+tables. The edition is DEFAULT_EDITION, the ELECTRICAL_HELPER_TABLES
+environment variable or whatever select() was last called with, so a
+project can switch editions by adding a file. reload_if_changed() re-reads
+the active file when it changed on disk, for hot reload during
+development. Like calculations.py this module doesn't import Kivy.
+"""
+
+import json
+import os
+import re
+import weakref
+from array import array
+from collections import namedtuple
+
+FORMAT = 1
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'tables')
+
+DEFAULT_EDITION = os.environ.get('ELECTRICAL_HELPER_TABLES', 'default')
+
+Tables = namedtuple('Tables', [
+    'edition', 'title', 'revision', 'path', 'mtime',
+    # Wire table: rows of display strings, numeric columns for lookups
+    'wire_rows', 'cross_sections', 'ground_limits', 'air_limits',
+    # Colour name -> {'value': digit, 'hex': colour}, colour name -> tolerance [%]
+    'resistor_colors', 'tolerance_colors',
+    'voltages', 'three_phase_voltages',
+])
+
+_HEX_COLOUR = re.compile(r'#[0-9A-Fa-f]{6}\Z')
+
+
+class TableError(ValueError):
+    """A table file is missing, unreadable or has invalid data"""
+
+
+_active = None
+_listeners = []
+# Modification time of a changed file that failed to load, so it is reported once
+_rejected_mtime = None
+
+
+def edition_path(edition):
+    return os.path.join(TABLES_DIR, f"{edition}.json")
+
+
+def editions():
+    """Ids of the editions in TABLES_DIR"""
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(TABLES_DIR) if name.endswith('.json'))
+
+
+def _number(value, where, minimum=None):
+    # bool is an int, but true as a current is a typo
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TableError(f"{where}: {value!r} is not a number")
+    if minimum is not None and value < minimum:
+        raise TableError(f"{where}: {value!r} is less than {minimum}")
+    return value
+
+
+def _rows(data, key, width):
+    rows = data.get(key)
+    if not isinstance(rows, list) or not rows:
+        raise TableError(f"{key}: expected a non-empty list")
+    for index, row in enumerate(rows):
+        if not isinstance(row, list) or len(row) != width:
+            raise TableError(f"{key}[{index}]: expected a list of {width} values")
+    return rows
+
+
+def _ascending(values, where):
+    for previous, value in zip(values, values[1:]):
+        if value <= previous:
+            raise TableError(f"{where}: {value:g} after {previous:g}, values must ascend")
+
+
+def _display(value):
+    return f"{value:g}"
+
+
+def parse_tables(data, path='', mtime=None):
+    """Validate the decoded JSON of a table file and build its Tables"""
+    if not isinstance(data, dict):
+        raise TableError("expected a JSON object")
+    if data.get('format') != FORMAT:
+        raise TableError(f"unsupported format {data.get('format')!r}, expected {FORMAT}")
+    for key in ('edition', 'title'):
+        if not isinstance(data.get(key), str) or not data[key]:
+            raise TableError(f"{key}: expected a non-empty string")
+    revision = data.get('revision')
+    if isinstance(revision, bool) or not isinstance(revision, int):
+        raise TableError("revision: expected an integer")
+
+    wires = _rows(data, 'wires', 3)
+    columns = [[_number(row[column], f"wires[{index}][{column}]", minimum=0) for index, row in enumerate(wires)]
+               for column in range(3)]
+    for column, name in zip(columns, ('cross sections', 'ground currents', 'air currents')):
+        # find_wire bisects the current columns, so they must be sorted
+        _ascending(column, f"wires: {name}")
+
+    resistor_colors = {}
+    for index, (name, digit, colour) in enumerate(_rows(data, 'resistor_colors', 3)):
+        if not isinstance(name, str) or name in resistor_colors:
+            raise TableError(f"resistor_colors[{index}]: missing or repeated colour name {name!r}")
+        if isinstance(digit, bool) or digit not in range(10):
+            raise TableError(f"resistor_colors[{index}]: digit {digit!r} is not 0-9")
+        if not isinstance(colour, str) or not _HEX_COLOUR.match(colour):
+            raise TableError(f"resistor_colors[{index}]: {colour!r} is not a #RRGGBB colour")
+        resistor_colors[name] = {'value': digit, 'hex': colour}
+
+    tolerance_colors = {}
+    for index, (name, tolerance) in enumerate(_rows(data, 'tolerance_colors', 2)):
+        if not isinstance(name, str) or name in tolerance_colors:
+            raise TableError(f"tolerance_colors[{index}]: missing or repeated colour name {name!r}")
+        tolerance_colors[name] = _number(tolerance, f"tolerance_colors[{index}]", minimum=0)
+
+    voltages = data.get('voltages')
+    if not isinstance(voltages, list) or not voltages:
+        raise TableError("voltages: expected a non-empty list")
+    for index, voltage in enumerate(voltages):
+        if _number(voltage, f"voltages[{index}]") <= 0:
+            raise TableError(f"voltages[{index}]: {voltage!r} must be positive")
+    three_phase = data.get('three_phase_voltages', [])
+    if not isinstance(three_phase, list) or not set(three_phase) <= set(voltages):
+        raise TableError("three_phase_voltages: expected a list of values from voltages")
+
+    return Tables(
+        edition=data['edition'],
+        title=data['title'],
+        revision=revision,
+        path=path,
+        mtime=mtime,
+        wire_rows=tuple(tuple(_display(value) for value in row) for row in wires),
+        cross_sections=array('d', columns[0]),
+        ground_limits=array('d', columns[1]),
+        air_limits=array('d', columns[2]),
+        resistor_colors=resistor_colors,
+        tolerance_colors=tolerance_colors,
+        voltages=tuple(voltages),
+        three_phase_voltages=frozenset(three_phase),
+    )
+
+
+def load_tables(path):
+    """Tables of a table file, TableError if it can't be read or is invalid"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            # Taken before reading, so a change while reading is seen by the next reload
+            mtime = os.fstat(f.fileno()).st_mtime
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise TableError(f"{path}: {e}") from None
+    try:
+        return parse_tables(data, path, mtime)
+    except TableError as e:
+        raise TableError(f"{path}: {e}") from None
+
+
+def on_change(callback):
+    """Call callback(tables) whenever other tables become active
+
+    Bound methods are held weakly, so a registered widget can still be
+    garbage collected.
+    """
+    if hasattr(callback, '__self__'):
+        _listeners.append(weakref.WeakMethod(callback))
+    else:
+        _listeners.append(lambda: callback)
+
+
+def _activate(tables):
+    global _active
+    _active = tables
+    for reference in list(_listeners):
+        callback = reference()
+        if callback is None:
+            _listeners.remove(reference)
+        else:
+            callback(tables)
+    return tables
+
+
+def active():
+    """Tables of the active edition, loaded on first use"""
+    if _active is None:
+        return _activate(load_tables(edition_path(DEFAULT_EDITION)))
+    return _active
+
+
+def select(edition):
+    """Make an edition active, returns its Tables"""
+    return _activate(load_tables(edition_path(edition)))
+
+
+def reload_if_changed():
+    """Re-read the active file if it changed on disk, True if it was reloaded
+
+    Raises TableError once for a broken file, the active tables then stay.
+    """
+    global _rejected_mtime
+    tables = active()
+    try:
+        mtime = os.stat(tables.path).st_mtime
+    except OSError:
+        return False
+    if mtime == tables.mtime or mtime == _rejected_mtime:
+        return False
+    try:
+        loaded = load_tables(tables.path)
+    except TableError:
+        _rejected_mtime = mtime
+        raise
+    _activate(loaded)
+    return True
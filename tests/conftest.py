@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""The modules under test sit in the repository root, next to app.py"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
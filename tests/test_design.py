@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Table search, resistor combinations and the LED, Zener and divider designs"""
+
+import itertools
+import random
+
+import pytest
+
+from calculations import ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE, ERROR_UNKNOWN, ERROR_ZERO
+from design import (
+    best_combination, led_resistor, nearest, resistor_combination, series_values, voltage_divider,
+    zener_regulator
+)
+
+VALUES = (1.0, 2.2, 4.7, 10.0)
+
+
+@pytest.mark.parametrize('target, direction, value', [
+    (4.7, 0, 4.7),
+    (4.7, 1, 4.7),
+    (4.7, -1, 4.7),
+    (3.0, 0, 2.2),
+    (3.5, 0, 4.7),
+    (3.0, 1, 4.7),
+    (3.0, -1, 2.2),
+    (0.5, 0, 1.0),
+    (0.5, -1, None),
+    (0.5, 1, 1.0),
+    (20, 0, 10.0),
+    (20, 1, None),
+    (20, -1, 10.0),
+])
+def test_nearest(target, direction, value):
+    assert nearest(VALUES, target, direction) == value
+
+
+def _brute_force(target, values):
+    """Smallest relative error of one value or any pair in series or parallel"""
+    resistances = list(values)
+    for a, b in itertools.combinations_with_replacement(values, 2):
+        resistances += [a + b, a * b / (a + b)]
+    return min(abs(resistance - target) / target for resistance in resistances)
+
+
+@pytest.mark.parametrize('values', [series_values('E6'), series_values('E12')[:30], (1, 3, 7, 100, 220)])
+def test_best_combination_matches_brute_force(values):
+    rng = random.Random(11)
+    for _ in range(200):
+        target = 10 ** rng.uniform(-0.5, 4)
+        best = best_combination(target, values)
+        assert best.error == pytest.approx(_brute_force(target, values), abs=1e-12), target
+        assert best.error == pytest.approx(abs(best.resistance - target) / target)
+
+
+def test_resistor_combination():
+    result = resistor_combination(4700)
+    assert result.value.values == (4700,) and result.value.connection == 'single'
+    assert resistor_combination(1500, stock=[1000, 500]).value.connection == 'series'
+    assert resistor_combination(500, stock=[1000]).value.connection == 'parallel'
+    # Far above the largest series value
+    assert resistor_combination(5e7) == (None, ERROR_RANGE)
+    assert resistor_combination(1000, stock=[]) == (None, ERROR_MISSING)
+    assert resistor_combination(1000, 'E96') == (None, ERROR_UNKNOWN)
+
+
+def test_led_resistor():
+    result = led_resistor(12, 2, 0.02, 3).value
+    assert result['ideal'] == pytest.approx(300)
+    assert result['resistance'] == 300
+    assert result['current'] == pytest.approx(0.02)
+    assert result['rating'] == 0.25
+    # The next value up keeps the current below the target
+    result = led_resistor(5, 2.1, 0.02).value
+    assert result['resistance'] == 150 and result['current'] < 0.02
+    assert led_resistor(12, 2, 0.02, 1.5) == (None, ERROR_RANGE)
+    assert led_resistor(6, 2, 0.02, 3) == (None, ERROR_RANGE)
+    assert led_resistor(12, 2, 0) == (None, ERROR_ZERO)
+    assert led_resistor(12, None, 0.02) == (None, ERROR_MISSING)
+    assert led_resistor(12, 2, 0.02, series='E96') == (None, ERROR_UNKNOWN)
+
+
+def test_zener_regulator():
+    result = zener_regulator(9, 12, 5.1, 0.01).value
+    # 3.9 V over 11 mA
+    assert result['ideal'] == pytest.approx(3.9 / 0.011)
+    assert result['resistance'] == 330
+    worst_current = (12 - 5.1) / 330
+    assert result['resistor_power'] == pytest.approx(worst_current ** 2 * 330)
+    assert result['zener_power'] == pytest.approx(worst_current * 5.1)
+    assert zener_regulator(9, 12, 5.1, 0).error is None
+    assert zener_regulator(9, 12, 5.1, -0.01) == (None, ERROR_NEGATIVE)
+    assert zener_regulator(12, 9, 5.1, 0.01) == (None, ERROR_RANGE)
+    assert zener_regulator(5, 12, 5.1, 0.01) == (None, ERROR_RANGE)
+
+
+def test_voltage_divider():
+    result = voltage_divider(12, 4).value
+    assert result['output'] == pytest.approx(12 * result['r2'] / (result['r1'] + result['r2']))
+    assert result['error'] == pytest.approx(0)
+    assert result['current'] == pytest.approx(12 / (result['r1'] + result['r2']))
+
+    result = voltage_divider(12, 4, total=10000).value
+    assert 5000 <= result['r1'] + result['r2'] <= 20000
+    assert result['error'] < 0.01
+
+    assert voltage_divider(12, 12) == (None, ERROR_RANGE)
+    assert voltage_divider(12, 4, total=0) == (None, ERROR_ZERO)
+    # No pair of the stock is near the total
+    assert voltage_divider(12, 4, total=10, stock=[1000, 2000]) == (None, ERROR_RANGE)
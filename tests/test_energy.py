@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Reading load profiles: delimiters, units, timestamps and tariff bands"""
+
+import io
+
+import pytest
+
+from energy import TARIFFS, ProfileError, parse_timestamp, summarize
+
+PROFILE = (
+    "time;kitchen [kW];workshop\n"
+    "2024-01-01 00:00;1,2;400\n"
+    "2024-01-01 00:15;1,1;600\n"
+    "2024-01-01 00:30;;200\n"
+)
+
+
+def _summarize(text, **options):
+    return summarize(io.StringIO(text), **options)
+
+
+def test_summary():
+    kitchen, workshop = _summarize(PROFILE, tariff=TARIFFS['dual'])
+    assert kitchen.name == 'kitchen'
+    # kW readings of 15 minutes each
+    assert kitchen.energy == pytest.approx(2300 * 0.25)
+    assert kitchen.peak == pytest.approx(1200)
+    assert kitchen.peak_time == "2024-01-01 00:00"
+    assert (kitchen.samples, kitchen.missing) == (2, 1)
+    assert workshop.energy == pytest.approx(1200 * 0.25)
+    # Midnight is in the low tariff
+    assert workshop.band_energy == {'NT': pytest.approx(300), 'VT': 0}
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 2, 3])
+def test_chunks_give_the_same_summary(chunk_rows):
+    assert _summarize(PROFILE, tariff=TARIFFS['dual'], chunk_rows=chunk_rows) == \
+        _summarize(PROFILE, tariff=TARIFFS['dual'])
+
+
+def test_delimiters_and_energy_units():
+    text = "time,meter [kWh]\n01.01.2024 00:00,0.5\n01.01.2024 01:00,0.25\n"
+    summary, = _summarize(text)
+    assert summary.energy == pytest.approx(750)
+    assert summary.peak == pytest.approx(500)
+
+
+def test_bands_of_irregular_samples():
+    text = "time;a\n2024-01-01 05:00;1000\n2024-01-01 05:30;1000\n2024-01-01 06:30;1000\n"
+    summary, = _summarize(text, tariff=TARIFFS['dual'])
+    # Interval 30 min from the first pair; 05:00 and 05:30 are NT, 06:30 VT
+    assert summary.band_energy == {'NT': pytest.approx(1000), 'VT': pytest.approx(500)}
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 2, 100])
+def test_timestamps_must_ascend(chunk_rows):
+    text = "time;a\n2024-01-01 00:00;1\n2024-01-01 00:15;2\n2024-01-01 00:10;3\n"
+    with pytest.raises(ProfileError, match="row 4"):
+        _summarize(text, chunk_rows=chunk_rows)
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 100])
+def test_mixed_utc_offsets(chunk_rows):
+    text = "time;a\n2024-01-01 00:00;1\n2024-01-01 00:15+01:00;2\n"
+    with pytest.raises(ProfileError, match="UTC offset"):
+        _summarize(text, chunk_rows=chunk_rows)
+
+
+def test_single_sample_needs_interval():
+    text = "time;a\n2024-01-01 00:00;1000\n"
+    with pytest.raises(ProfileError, match="interval"):
+        _summarize(text)
+    summary, = _summarize(text, interval=15)
+    assert summary.energy == pytest.approx(250)
+
+
+@pytest.mark.parametrize('text', [
+    "",
+    "time\n2024-01-01 00:00\n",
+    "time;a\n",
+    "time;a\nyesterday;1\n",
+    "time;a [V]\n2024-01-01 00:00;1\n",
+])
+def test_invalid_profiles(text):
+    with pytest.raises(ProfileError):
+        _summarize(text)
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("31.12.2024 23:45").minute == 45
+    assert parse_timestamp("2024-12-31T23:45:10").second == 10
+    with pytest.raises(ProfileError):
+        parse_timestamp("late")
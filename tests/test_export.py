@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""CSV, Arrow and Parquet export of calculation records"""
+
+import csv
+import math
+from array import array
+
+import pytest
+
+from calculations import ERROR_ZERO
+from export import ERROR_FIELD, TEXT, Field, export_batch, export_rows, open_writer
+from parallel import BatchResult
+
+FIELDS = [Field('current', 'A'), Field('name', kind=TEXT)]
+
+
+def _read_csv(path):
+    with open(path, encoding='utf-8', newline='') as file:
+        return list(csv.reader(file))
+
+
+def test_rows_to_csv(tmp_path):
+    path = str(tmp_path / 'rows.csv')
+    assert export_rows(path, FIELDS, [(1.5, 'a'), (None, 'b'), (math.nan, None), (0.1, 'c')]) == 4
+    assert _read_csv(path) == [['current [A]', 'name'], ['1.5', 'a'], ['', 'b'], ['', ''], ['0.1', 'c']]
+
+
+def test_csv_quoting(tmp_path):
+    path = str(tmp_path / 'quoted.csv')
+    names = ['a,b', 'say "hi"', 'two\nlines', 'cr\rlf', 'plain']
+    export_rows(path, FIELDS, [(1, name) for name in names])
+    assert [row[1] for row in _read_csv(path)[1:]] == names
+
+
+def test_csv_precision(tmp_path):
+    path = str(tmp_path / 'precise.csv')
+    export_rows(path, FIELDS, [(1 / 3, 'a')], precision=4)
+    assert _read_csv(path)[1] == ['0.3333', 'a']
+    path = str(tmp_path / 'exact.csv')
+    export_rows(path, FIELDS, [(1 / 3, 'a')])
+    assert float(_read_csv(path)[1][0]) == 1 / 3
+
+
+@pytest.mark.parametrize('rows, chunk_rows', [(10, 3), (7, 7), (7, 2), (1, 4)])
+def test_chunk_boundaries(tmp_path, rows, chunk_rows):
+    path = str(tmp_path / 'chunks.csv')
+    values = [(float(i), str(i)) for i in range(rows)]
+    assert export_rows(path, FIELDS, values, chunk_rows=chunk_rows) == rows
+    assert _read_csv(path)[1:] == [[repr(value), name] for value, name in values]
+
+    path = str(tmp_path / 'columns.csv')
+    with open_writer(path, FIELDS, chunk_rows=chunk_rows) as writer:
+        writer.write_columns([[value for value, _ in values], [name for _, name in values]])
+    assert writer.rows_written == rows
+    assert _read_csv(path)[1:] == [[repr(value), name] for value, name in values]
+
+
+def test_batch_to_csv(tmp_path):
+    path = str(tmp_path / 'batch.csv')
+    inputs = [[2300, 100], [230, 0]]
+    result = BatchResult([array('d', [10.0, math.nan])], [None, ERROR_ZERO], {}, 0.0)
+    assert export_batch(path, 'current', inputs, result, chunk_rows=1) == 2
+    assert _read_csv(path) == [['power [W]', 'voltage [V]', 'current [A]', 'error'],
+                               ['2300', '230', '10.0', ''],
+                               ['100', '0', '', ERROR_ZERO]]
+
+
+def test_invalid_exports(tmp_path):
+    with pytest.raises(ValueError):
+        open_writer(str(tmp_path / 'rows.txt'), FIELDS)
+    with open_writer(str(tmp_path / 'rows.csv'), FIELDS) as writer:
+        with pytest.raises(ValueError):
+            writer.write_columns([[1, 2]])
+        with pytest.raises(ValueError):
+            writer.write_columns([[1, 2], ['a']])
+
+
+@pytest.mark.parametrize('extension', ['.arrow', '.parquet'])
+def test_arrow_round_trip(tmp_path, extension):
+    pa = pytest.importorskip('pyarrow')
+    path = str(tmp_path / ('rows' + extension))
+    fields = FIELDS + [ERROR_FIELD]
+    rows = [(1.5, 'a', None), (math.nan, 'b', ERROR_ZERO), (None, None, None), (2.0, 'c', None), (3.0, 'd', None)]
+    assert export_rows(path, fields, rows, chunk_rows=2) == 5
+    if extension == '.arrow':
+        table = pa.ipc.open_file(path).read_all()
+    else:
+        import pyarrow.parquet
+        table = pyarrow.parquet.read_table(path)
+    assert table.column_names == ['current', 'name', 'error']
+    assert table.column('current').to_pylist() == [1.5, None, None, 2.0, 3.0]
+    assert table.column('name').to_pylist() == ['a', 'b', None, 'c', 'd']
+    assert table.column('error').to_pylist() == [None, ERROR_ZERO, None, None, None]
+    assert table.schema.field('current').metadata == {b'unit': b'A'}
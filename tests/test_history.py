@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Segments, rotation and reading of the calculation history"""
+
+import os
+import threading
+
+import pytest
+
+from history import CalculationHistory
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = CalculationHistory(str(tmp_path), max_segment_bytes=1000, max_segments=3, fsync_interval=0.01)
+    yield history
+    history.close()
+
+
+def _fill(history, count, start=0):
+    for i in range(start, start + count):
+        history.append('wire', f"{i} A", f"{i} mm²")
+    history.flush()
+
+
+def test_records_in_order(history):
+    _fill(history, 5)
+    assert len(history) == 5
+    assert history.record(0).inputs == "0 A"
+    assert history.record(-1).result == "4 mm²"
+    assert [record.inputs for record in history.recent(1, 3)] == ["3 A", "2 A", "1 A"]
+    assert history.recent(10, 3) == []
+    with pytest.raises(IndexError):
+        history.record(5)
+
+
+def test_rotation_bounds_segments(history, tmp_path):
+    # Rotation happens between written batches, flushing keeps them small
+    for start in range(0, 1000, 50):
+        _fill(history, 50, start)
+    segments = [name for name in os.listdir(tmp_path) if name.endswith('.log')]
+    assert len(segments) <= 3
+    assert 0 < len(history) < 1000
+    # The newest records are kept, the oldest dropped
+    assert history.recent(0, 1)[0].inputs == "999 A"
+    assert history.record(0).inputs == f"{1000 - len(history)} A"
+
+
+def test_reopen_keeps_records(tmp_path):
+    history = CalculationHistory(str(tmp_path))
+    _fill(history, 3)
+    history.close()
+    history = CalculationHistory(str(tmp_path))
+    try:
+        assert [record.inputs for record in history.recent(0, 10)] == ["2 A", "1 A", "0 A"]
+    finally:
+        history.close()
+
+
+def test_recent_during_rotation(history):
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            try:
+                page = history.recent(0, 20)
+            except Exception as e:
+                errors.append(e)
+                return
+            inputs = [int(record.inputs.split()[0]) for record in page]
+            if inputs != sorted(inputs, reverse=True):
+                errors.append(inputs)
+                return
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        _fill(history, 3000)
+    finally:
+        done.set()
+        reader.join()
+    assert errors == []
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Running totals of the load schedule against sums from scratch"""
+
+import random
+
+import pytest
+
+from loads import PHASES, THREE_PHASE, Load, LoadSchedule, load_demand
+
+
+def _random_load(rng):
+    return Load(
+        "load",
+        rng.uniform(0, 5000),
+        rng.choice(PHASES + (THREE_PHASE,)),
+        rng.uniform(0.5, 1),
+        rng.uniform(0, 1),
+        rng.choice(['', 'kitchen', 'garage', 'bath', 'attic', 'cellar', 'office', 'yard']),
+    )
+
+
+def _summed(loads):
+    """Phase -> (active, reactive) and circuit -> (active, reactive), summed from scratch"""
+    phases = {phase: [0.0, 0.0] for phase in PHASES}
+    circuits = {}
+    for load in loads:
+        active, reactive = load_demand(load)
+        shares = PHASES if load.phase == THREE_PHASE else (load.phase,)
+        for phase in shares:
+            phases[phase][0] += active / len(shares)
+            phases[phase][1] += reactive / len(shares)
+        circuit = circuits.setdefault(load.circuit, [0.0, 0.0])
+        circuit[0] += active
+        circuit[1] += reactive
+    return phases, circuits
+
+
+def _assert_matches(schedule):
+    phases, circuits = _summed(load for _, load in schedule)
+    for phase, totals in schedule.phase_totals().items():
+        assert totals.active == pytest.approx(phases[phase][0], abs=1e-6)
+        assert totals.reactive == pytest.approx(phases[phase][1], abs=1e-6)
+    totals = schedule.circuit_totals()
+    assert list(totals) == sorted(circuits)
+    for name, circuit in totals.items():
+        assert circuit.active == pytest.approx(circuits[name][0], abs=1e-6)
+        assert circuit.reactive == pytest.approx(circuits[name][1], abs=1e-6)
+
+
+def test_add_edit_remove_match_sums():
+    rng = random.Random(7)
+    schedule = LoadSchedule()
+    ids = []
+    for step in range(3000):
+        action = rng.random()
+        if action < 0.5 or not ids:
+            ids.append(schedule.add(_random_load(rng)))
+        elif action < 0.8:
+            schedule.update(rng.choice(ids), _random_load(rng))
+        else:
+            schedule.remove(ids.pop(rng.randrange(len(ids))))
+        if step % 100 == 0:
+            _assert_matches(schedule)
+    _assert_matches(schedule)
+    assert len(schedule) == len(ids)
+
+
+def test_recompute_keeps_totals():
+    rng = random.Random(3)
+    schedule = LoadSchedule(_random_load(rng) for _ in range(50))
+    before = schedule.totals()
+    schedule.recompute()
+    assert schedule.totals() == pytest.approx(before)
+    _assert_matches(schedule)
+
+
+def test_empty_schedule_has_no_drift():
+    schedule = LoadSchedule()
+    ids = [schedule.add(Load("a", 0.1 * i, 'L1', 0.9, 0.7, 'x')) for i in range(1, 100)]
+    for load_id in ids:
+        schedule.remove(load_id)
+    assert schedule.totals().active == 0
+    assert schedule.circuit_count() == 0
+
+
+def test_first_circuits():
+    schedule = LoadSchedule(Load(name, 100, 'L2', circuit=name) for name in 'edcbagf')
+    assert list(schedule.circuit_totals(3)) == ['a', 'b', 'c']
+    assert schedule.circuit_count() == 7
+    assert schedule.circuit_totals(3)['a'].active == 100
+
+
+def test_three_phase_load_splits_evenly():
+    schedule = LoadSchedule([Load("motor", 3000, THREE_PHASE)])
+    assert [totals.active for totals in schedule.phase_totals().values()] == pytest.approx([1000] * 3)
+    assert schedule.phase_unbalance() == pytest.approx(0)
+
+
+def test_invalid_load():
+    with pytest.raises(ValueError):
+        LoadSchedule([Load("a", 100, 'L4')])
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Chunked parallel runs against the serial batch calculations"""
+
+import math
+
+import pytest
+
+from calculations import ohms_law_result, voltage_drop_batch
+from parallel import run
+
+
+def _same(parallel_value, serial_value):
+    if serial_value is None:
+        return math.isnan(parallel_value)
+    return parallel_value == pytest.approx(serial_value)
+
+
+def test_voltage_drop_matches_batch():
+    currents = [10, None, -1, 16, 1e150, 25, 32] * 3
+    lengths = [10, 20, 1, 0, 1e150, 50, 5] * 3
+    cross_sections = [1.5, 2.5, 1, 2.5, 1e-150, 0, 6] * 3
+    # 21 rows in chunks of 4 over two workers
+    result = run('voltage_drop', [currents, lengths, cross_sections], workers=2, chunk_size=4)
+    drops, errors = voltage_drop_batch(currents, lengths, cross_sections)
+    assert result.errors == errors
+    assert len(result.columns[0]) == len(drops)
+    assert all(_same(value, drop) for value, drop in zip(result.columns[0], drops))
+    assert sum(stats.rows for stats in result.workers.values()) == 21
+    assert sum(stats.chunks for stats in result.workers.values()) == 6
+
+
+def test_ohms_law_matches_result():
+    rows = [(12, None, 6, None), (None, 2, None, 8), (12, None, None, None), (0, 0, None, None),
+            (None, None, 4, 100), (230, 10, None, None), (1e150, None, 1e-150, None)]
+    result = run('ohms_law', [list(column) for column in zip(*rows)], workers=2, chunk_size=3)
+    for index, row in enumerate(rows):
+        expected = ohms_law_result(*row)
+        assert result.errors[index] == expected.error
+        for column, key in zip(result.columns, 'UIRP'):
+            assert _same(column[index], None if expected.value is None else expected.value[key]), (row, key)
+
+
+def test_empty_input():
+    result = run('current', [[], []], workers=2)
+    assert [list(column) for column in result.columns] == [[]]
+    assert result.errors == []
+    assert result.workers == {}
+
+
+def test_column_lengths_must_match():
+    with pytest.raises(ValueError):
+        run('current', [[1, 2, 3], [230, 230]], workers=2)
+    with pytest.raises(ValueError):
+        run('current', [[1, 2, 3]], workers=2)
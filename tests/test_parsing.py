@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Numbers, prefixes, units and RKM notation of parse_quantity"""
+
+import pytest
+
+from parsing import parse_column, parse_float, parse_quantity
+
+
+@pytest.mark.parametrize('text, value', [
+    ("230", 230),
+    ("2,5", 2.5),
+    ("-1.5e3", -1500),
+    (".5", 0.5),
+    ("2.2k", 2200),
+    ("10 mA", 0.01),
+    ("4k7", 4700),
+    ("R47", 0.47),
+    ("2M2", 2.2e6),
+    ("1n5", 1.5e-9),
+    ("100 µF", 1e-4),
+    ("100uF", 1e-4),
+    ("10 ohm", 10),
+    ("5m", 0.005),
+])
+def test_values_in_base_units(text, value):
+    assert parse_quantity(text) == pytest.approx(value)
+
+
+@pytest.mark.parametrize('text', ["", "abc", "1.2.3", "5 parsec", "k7", "--5"])
+def test_invalid_text(text):
+    assert parse_quantity(text) is None
+
+
+@pytest.mark.parametrize('text, unit, value', [
+    ("16 A", 'A', 16),
+    ("16", 'A', 16),
+    ("16 V", 'A', None),
+    ("230V", 'V', 230),
+    ("1 kWh", 'Wh', 1000),
+    ("5 kWh", 'W', None),
+])
+def test_unit_must_match(text, unit, value):
+    assert parse_quantity(text, unit) == value
+
+
+@pytest.mark.parametrize('text, unit, value', [
+    # The lone "m" is a metre only where a length is expected
+    ("5m", 'm', 5),
+    ("5m", 'A', 0.005),
+    ("5 mm", 'm', 0.005),
+    ("5 km", 'm', 5000),
+])
+def test_metre_and_milli(text, unit, value):
+    assert parse_quantity(text, unit) == pytest.approx(value)
+
+
+@pytest.mark.parametrize('text, unit, value', [
+    # Plain numbers are in a prefixed unit, a prefix or unit in the text replaces it
+    ("5", 'kV', 5000),
+    ("5k", 'kV', 5000),
+    ("5 kV", 'kV', 5000),
+    ("5 V", 'kV', 5),
+    ("5 mV", 'kV', 0.005),
+    ("4k7", 'kΩ', 4700),
+    ("3", 'MWh', 3e6),
+    ("5 A", 'kV', None),
+])
+def test_prefixed_unit(text, unit, value):
+    result = parse_quantity(text, unit)
+    assert result == (None if value is None else pytest.approx(value))
+
+
+def test_parse_float_raises_like_float():
+    assert parse_float("2k2") == 2200
+    with pytest.raises(ValueError):
+        parse_float("2 kA", 'V')
+
+
+def test_parse_column():
+    assert parse_column(["1", "1,5", "", "x", "1"], 'W') == [1, 1.5, None, None, 1]
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Error codes of the validated *_result and *_batch calculators"""
+
+import itertools
+import math
+
+import pytest
+
+from calculations import (
+    ERROR_INCOMPATIBLE, ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE, ERROR_UNDERDETERMINED,
+    ERROR_UNKNOWN, ERROR_ZERO, MAX_INPUT, conversion_result, current_batch, current_result,
+    ohms_law_result, resistor_result, voltage_drop_batch, voltage_drop_result, wire_result
+)
+from earthing import electrode_result, rod_array_design, rod_array_result
+from machines import motor_batch, motor_result, transformer_result
+from reactance import frequency_sweep, rlc_result
+
+# Inputs at the edges of what the calculators accept
+EXTREMES = (None, 0, 1e-300, 1e-150, 1, 1e150, 1e200, math.inf, math.nan)
+
+
+def _finite(value):
+    """True if every number in a result value is finite"""
+    if isinstance(value, dict):
+        return all(_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_finite(item) for item in value)
+    if isinstance(value, float):
+        return math.isfinite(value)
+    return True
+
+
+@pytest.mark.parametrize('power, voltage, error', [
+    (None, 230, ERROR_MISSING),
+    (100, 0, ERROR_ZERO),
+    (1e200, 230, ERROR_RANGE),
+    (math.nan, 230, ERROR_RANGE),
+    (1e150, 1e-200, ERROR_RANGE),
+])
+def test_current_result_errors(power, voltage, error):
+    assert current_result(power, voltage) == (None, error)
+
+
+def test_current_result():
+    assert current_result(2300, 230).value == pytest.approx(10)
+    assert current_result(2300, 400, three_phase=True).value == pytest.approx(2300 / (math.sqrt(3) * 400))
+
+
+def test_ohms_law_result():
+    assert ohms_law_result(voltage=12, resistance=6) == ({'U': 12, 'I': 2.0, 'R': 6, 'P': 24.0}, None)
+    assert ohms_law_result(voltage=12).error == ERROR_MISSING
+    assert ohms_law_result(voltage=0, current=0).error == ERROR_UNDERDETERMINED
+    assert ohms_law_result(voltage=1e150, resistance=1e-150) == (None, ERROR_RANGE)
+    assert ohms_law_result(voltage=2 * MAX_INPUT, current=1) == (None, ERROR_RANGE)
+
+
+def test_wire_result():
+    assert wire_result(10) == ('1.5', None)
+    assert wire_result(-1) == (None, ERROR_NEGATIVE)
+    assert wire_result(1e6) == (None, ERROR_RANGE)
+    assert wire_result(10, 'somewhere') == (None, ERROR_UNKNOWN)
+
+
+def test_voltage_drop_result():
+    assert voltage_drop_result(10, 10, 0) == (None, ERROR_ZERO)
+    assert voltage_drop_result(10, -1, 1.5) == (None, ERROR_NEGATIVE)
+    assert voltage_drop_result(1e150, 1e150, 1e-150) == (None, ERROR_RANGE)
+
+
+def test_conversion_result():
+    assert conversion_result(5, 'kV', 'V') == (5000, None)
+    assert conversion_result(5, 'kV', 'A') == (None, ERROR_INCOMPATIBLE)
+    assert conversion_result(5, 'kV', 'parsec') == (None, ERROR_UNKNOWN)
+    assert conversion_result(None, 'kV', 'V') == (None, ERROR_MISSING)
+
+
+def test_resistor_result():
+    assert resistor_result('Hnedá', 'Čierna', 'Červená') == (1000, None)
+    assert resistor_result('Hnedá', 'Čierna', 'Zlatozelená') == (None, ERROR_UNKNOWN)
+
+
+def test_batches_match_results():
+    powers = [2300, None, 100, 1e200, 1e150]
+    voltages = [230, 230, 0, 230, 1e-150]
+    currents, errors = current_batch(powers, voltages)
+    assert errors == [current_result(p, u).error for p, u in zip(powers, voltages)]
+    assert currents[0] == pytest.approx(10)
+
+    drops, errors = voltage_drop_batch([10, None, -1, 1e150], [10, 1, 1, 1e150], [1.5, 1, 1, 1e-150])
+    assert errors == [None, ERROR_MISSING, ERROR_NEGATIVE, ERROR_RANGE]
+    assert drops[0] == pytest.approx(voltage_drop_result(10, 10, 1.5).value)
+
+
+def test_rlc_result():
+    result = rlc_result(50, 10, 0.1)
+    assert result.error is None
+    assert result.value['Xl'] == pytest.approx(2 * math.pi * 50 * 0.1)
+    assert rlc_result() == (None, ERROR_MISSING)
+    assert rlc_result(50).error == ERROR_UNDERDETERMINED
+    assert rlc_result(0, None, 0.1) == (None, ERROR_ZERO)
+    assert rlc_result(50, -1) == (None, ERROR_NEGATIVE)
+    # f C and L C underflow to zero
+    assert rlc_result(1e-200, None, None, 1e-200) == (None, ERROR_RANGE)
+    assert rlc_result(None, None, 1e-200, 1e-200) == (None, ERROR_RANGE)
+
+
+def test_motor_result():
+    result = motor_result(4000, 400, 0.85, 0.9)
+    assert result.error is None
+    assert result.value['current'] == pytest.approx(4000 / (math.sqrt(3) * 400 * 0.85 * 0.9))
+    assert motor_result(4000, 400, 1.2, 0.9) == (None, ERROR_RANGE)
+    assert motor_result(4000, 400, 0.85, 0.9, start='catapult') == (None, ERROR_UNKNOWN)
+    assert motor_result(4000, 0, 0.85, 0.9) == (None, ERROR_ZERO)
+    # U cos φ η underflows to zero
+    assert motor_result(1e-300, 1e-300, 1e-300, 1e-300) == (None, ERROR_RANGE)
+
+
+def test_motor_batch_matches_result():
+    rows = [(4000, 400, 0.85, 0.9), (None, 400, 0.85, 0.9), (1e-300, 1e-300, 1e-300, 1e-300)]
+    columns, errors = motor_batch(*zip(*rows))
+    assert errors == [motor_result(*row).error for row in rows]
+    assert columns.current[0] == pytest.approx(motor_result(*rows[0]).value['current'])
+
+
+def test_transformer_result():
+    result = transformer_result(100000, 22000, 400, 4)
+    assert result.error is None
+    assert result.value['turns_ratio'] == pytest.approx(55)
+    assert transformer_result(100000, 22000, 0) == (None, ERROR_ZERO)
+    assert transformer_result(100000, 22000, 400, 150) == (None, ERROR_RANGE)
+
+
+def test_earthing_results():
+    assert electrode_result('rod', 100, 3).error is None
+    assert electrode_result('mesh', 100, 3) == (None, ERROR_UNKNOWN)
+    assert electrode_result('strip', 100, 3) == (None, ERROR_MISSING)
+    # A rod shorter than its diameter is outside the formula
+    assert electrode_result('rod', 100, 0.001, 0.016) == (None, ERROR_RANGE)
+    # No grid of 10 rods
+    assert rod_array_result(100, 3, 10, 3, 'grid') == (None, ERROR_RANGE)
+    arrays = rod_array_design(100, 3, 5, [3, 6]).value
+    assert arrays and all(array.resistance <= 5 for array in arrays)
+    assert [array.count for array in arrays] == sorted(array.count for array in arrays)
+
+
+CALCULATORS = [
+    (current_result, 2),
+    (voltage_drop_result, 3),
+    (lambda *values: ohms_law_result(*values), 2),
+    (lambda *values: ohms_law_result(None, None, *values), 2),
+    (lambda *values: conversion_result(*values, 'MV', 'mV'), 1),
+    (rlc_result, 4),
+    (motor_result, 4),
+    (transformer_result, 4),
+    (lambda *values: electrode_result('rod', *values), 3),
+    (lambda *values: electrode_result('strip', *values), 4),
+    (lambda *values: rod_array_result(*values, 4, 'line'), 3),
+]
+
+
+@pytest.mark.parametrize('calculator, arguments', CALCULATORS)
+def test_extreme_inputs_give_finite_results_or_errors(calculator, arguments):
+    for values in itertools.product(EXTREMES, repeat=arguments):
+        result = calculator(*values)
+        assert result.error is not None or _finite(result.value), values
+
+
+@pytest.mark.parametrize('start, stop, capacitance', [(1e-200, 1e6, 1e-200), (10, 1e6, 1e-320)])
+def test_frequency_sweep_underflow(start, stop, capacitance):
+    assert frequency_sweep(10, None, capacitance, start, stop).error == ERROR_RANGE
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""HTTP framing and per-item errors of the calculation server"""
+
+import asyncio
+import json
+
+import pytest
+
+from calculations import ERROR_MISSING, ERROR_RANGE, ERROR_ZERO
+from server import MAX_BODY_BYTES, CalculationServer, evaluate
+
+
+async def _exchange(server, *requests):
+    """Send raw requests over one connection, list of (status, JSON body)"""
+    listener = await asyncio.start_server(server._handle_connection, '127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    responses = []
+    try:
+        for request in requests:
+            writer.write(request)
+            await writer.drain()
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except asyncio.IncompleteReadError:
+                break
+            status_line, *header_lines = head.decode('latin-1').split('\r\n')
+            headers = dict(line.split(': ', 1) for line in header_lines if line)
+            body = await reader.readexactly(int(headers['Content-Length']))
+            responses.append((int(status_line.split()[1]), json.loads(body)))
+    finally:
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+    return responses
+
+
+def _post(path, payload, connection='keep-alive'):
+    body = json.dumps(payload).encode('utf-8')
+    return (f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: {connection}\r\n\r\n").encode('latin-1') + body
+
+
+@pytest.fixture
+def server():
+    server = CalculationServer(workers=1)
+    yield server
+    server.close()
+
+
+def test_keep_alive(server):
+    responses = asyncio.run(_exchange(
+        server,
+        _post('/current', {'power': 2300, 'voltage': 230}),
+        _post('/wire', {'current': 10}),
+        b"GET /stats HTTP/1.1\r\n\r\n",
+    ))
+    assert responses[0] == (200, {'current': 10.0})
+    assert responses[1] == (200, {'cross_section': 1.5})
+    assert responses[2][0] == 200 and responses[2][1]['requests'] == 2
+
+
+@pytest.mark.parametrize('request_bytes, status', [
+    (b"NONSENSE\r\n\r\n", 400),
+    (b"POST /current HTTP/1.1\r\nContent-Length: -5\r\n\r\n", 400),
+    (b"POST /current HTTP/1.1\r\nContent-Length: ten\r\n\r\n", 400),
+    (f"POST /current HTTP/1.1\r\nContent-Length: {MAX_BODY_BYTES + 1}\r\n\r\n".encode(), 413),
+    (b"POST /current HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x}", 400),
+    (b"POST /nowhere HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}", 404),
+    (b"GET /current HTTP/1.1\r\n\r\n", 405),
+    (b"POST /stats HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}", 405),
+])
+def test_framing_errors(server, request_bytes, status):
+    responses = asyncio.run(_exchange(server, request_bytes))
+    assert responses[0][0] == status
+    assert 'error' in responses[0][1]
+
+
+def test_framing_error_closes_connection(server):
+    responses = asyncio.run(_exchange(
+        server,
+        b"POST /current HTTP/1.1\r\nContent-Length: -1\r\n\r\n",
+        _post('/current', {'power': 2300, 'voltage': 230}),
+    ))
+    assert len(responses) == 1
+
+
+def test_single_item_error_status(server):
+    responses = asyncio.run(_exchange(server, _post('/current', {'power': 100, 'voltage': 0}, 'close')))
+    assert responses == [(400, {'error': "voltage must not be zero", 'code': ERROR_ZERO})]
+
+
+def test_batch_reports_errors_per_item(server):
+    batch = [{'power': 2300, 'voltage': 230}, {'power': "a lot", 'voltage': 230}, 7,
+             {'power': 1e150, 'voltage': 1e-200}]
+    responses = asyncio.run(_exchange(server, _post('/current', batch, 'close')))
+    status, results = responses[0]
+    assert status == 200
+    assert results[0] == {'current': 10.0}
+    assert results[1]['code'] == ERROR_MISSING
+    assert results[2] == {'error': "item must be a JSON object", 'code': ERROR_MISSING}
+    assert results[3]['code'] == ERROR_RANGE
+
+
+def test_evaluate():
+    assert evaluate('/ohms-law', [{'voltage': 12, 'resistance': 6}]) == [
+        {'voltage': 12, 'current': 2.0, 'resistance': 6, 'power': 24.0}]
+    assert evaluate('/ohms-law', [{'voltage': 12}])[0]['code'] == ERROR_MISSING
+    assert evaluate('/convert', [{'value': 5, 'from': 'kV', 'to': 'V'}]) == [{'value': 5000}]
+    assert evaluate('/resistor', [{'first': 'Hnedá', 'second': 'Čierna', 'multiplier': 'Červená'}]) == [
+        {'resistance': 1000}]
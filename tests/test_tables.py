@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Validation, hot reload and change listeners of the reference tables"""
+
+import copy
+import gc
+import json
+import os
+
+import pytest
+
+import calculations
+import tables
+from tables import TableError, parse_tables
+
+with open(tables.edition_path('default'), encoding='utf-8') as f:
+    DEFAULT = json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def restore_tables(monkeypatch):
+    """Give each test its own listeners and reactivate the default tables afterwards"""
+    previous = tables.active()
+    monkeypatch.setattr(tables, '_listeners', [lambda: calculations._use_tables])
+    monkeypatch.setattr(tables, '_rejected_mtime', None)
+    yield
+    tables._activate(previous)
+
+
+def _edited(**changes):
+    data = copy.deepcopy(DEFAULT)
+    data.update(changes)
+    return data
+
+
+def _write(path, data, mtime):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.utime(path, (mtime, mtime))
+
+
+def test_default_tables_parse():
+    parsed = parse_tables(DEFAULT)
+    assert parsed.edition == 'default'
+    assert list(parsed.cross_sections) == [row[0] for row in DEFAULT['wires']]
+    assert parsed.wire_rows[0] == ('1.5', '16', '19')
+
+
+@pytest.mark.parametrize('changes, message', [
+    ({'format': 2}, "unsupported format"),
+    ({'title': ""}, "title"),
+    ({'revision': True}, "revision"),
+    ({'wires': []}, "wires"),
+    ({'wires': [[1.5, 16]]}, r"wires\[0\]"),
+    ({'wires': [[1.5, 16, "19"]]}, "not a number"),
+    ({'wires': [[1.5, 16, -1]]}, "less than 0"),
+    ({'wires': [[1.5, 16, 19], [2.5, 15, 27]]}, "must ascend"),
+    ({'resistor_colors': [["Čierna", 0, "#000000"], ["Čierna", 1, "#8B4513"]]}, "repeated"),
+    ({'resistor_colors': [["Čierna", 10, "#000000"]]}, "0-9"),
+    ({'resistor_colors': [["Čierna", 0, "black"]]}, "#RRGGBB"),
+    ({'tolerance_colors': [["Zlatá", "5"]]}, "not a number"),
+    ({'voltages': [230, 0]}, "must be positive"),
+    ({'three_phase_voltages': [500]}, "three_phase_voltages"),
+])
+def test_invalid_tables(changes, message):
+    with pytest.raises(TableError, match=message):
+        parse_tables(_edited(**changes))
+
+
+def test_tables_must_be_an_object():
+    with pytest.raises(TableError):
+        parse_tables([])
+
+
+def test_reload_if_changed(tmp_path, monkeypatch):
+    monkeypatch.setattr(tables, 'TABLES_DIR', str(tmp_path))
+    path = tables.edition_path('test')
+    _write(path, _edited(edition='test'), 1000)
+    tables.select('test')
+    assert not tables.reload_if_changed()
+
+    _write(path, _edited(edition='test', revision=2), 2000)
+    assert tables.reload_if_changed()
+    assert tables.active().revision == 2
+
+    # A broken file is reported once and the loaded tables stay active
+    _write(path, _edited(edition='test', revision=3, wires=[]), 3000)
+    with pytest.raises(TableError):
+        tables.reload_if_changed()
+    assert not tables.reload_if_changed()
+    assert tables.active().revision == 2
+
+    # The fixed file is picked up again
+    _write(path, _edited(edition='test', revision=4), 4000)
+    assert tables.reload_if_changed()
+    assert tables.active().revision == 4
+
+
+def test_tables_change_clears_cached_results():
+    assert calculations.find_wire(20) == '2.5'
+    assert calculations.voltage_table(2300)[0][0] == DEFAULT['voltages'][0]
+    wires = [[1.5, 16, 20]] + DEFAULT['wires'][1:]
+    tables._activate(parse_tables(_edited(wires=wires, voltages=[400], three_phase_voltages=[400])))
+    assert calculations.find_wire(20) == '1.5'
+    assert [voltage for voltage, _ in calculations.voltage_table(2300)] == [400]
+
+
+def test_listeners_of_collected_widgets_are_dropped():
+    calls = []
+
+    class Widget:
+        def refresh(self, changed):
+            calls.append(changed.revision)
+
+    widget = Widget()
+    tables.on_change(widget.refresh)
+    tables._activate(parse_tables(_edited(revision=5)))
+    assert calls == [5]
+    count = len(tables._listeners)
+
+    del widget
+    gc.collect()
+    tables._activate(parse_tables(_edited(revision=6)))
+    assert calls == [5]
+    assert len(tables._listeners) == count - 1
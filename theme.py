@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Shared theme: colour palettes, font sizes and dp metrics.
+
+Palettes are parsed once at import. Widgets take their colours from the
+theme's role properties instead of parsing hex strings themselves, and are
+registered with style(), so switching the theme at runtime restyles the
+existing widgets without rebuilding the widget tree.
+"""
+
+import weakref
+
+from kivy.event import EventDispatcher
+from kivy.metrics import dp
+from kivy.properties import ColorProperty, OptionProperty
+from kivy.utils import get_color_from_hex
+
+_PALETTES_HEX = {
+    'dark': {
+        'background': '#1a1a1a',
+        'surface': '#2d2d2d',
+        'surface_alt': '#252525',
+        'accent': '#ff8c00',
+        'text': '#ffffff',
+        'muted': '#666666',
+        'on_accent': '#1a1a1a',
+    },
+    'light': {
+        'background': '#f2f2f2',
+        'surface': '#ffffff',
+        'surface_alt': '#e6e6e6',
+        'accent': '#d97400',
+        'text': '#1a1a1a',
+        'muted': '#8c8c8c',
+        'on_accent': '#ffffff',
+    },
+    'high_contrast': {
+        'background': '#000000',
+        'surface': '#000000',
+        'surface_alt': '#1f1f1f',
+        'accent': '#ffff00',
+        'text': '#ffffff',
+        'muted': '#c0c0c0',
+        'on_accent': '#000000',
+    },
+}
+
+# Palette name -> role -> RGBA tuple
+PALETTES = {
+    name: {role: tuple(get_color_from_hex(value)) for role, value in palette.items()}
+    for name, palette in _PALETTES_HEX.items()
+}
+
+ROLES = tuple(_PALETTES_HEX['dark'])
+
+# Font sizes
+FONT_TITLE = '20sp'
+FONT_LARGE = '18sp'
+FONT_BODY = '16sp'
+FONT_SMALL = '14sp'
+FONT_NOTE = '12sp'
+
+# Metrics shared by the tabs
+PADDING = dp(20)
+SPACING = dp(15)
+TITLE_HEIGHT = dp(40)
+BUTTON_HEIGHT = dp(50)
+
+
+class Theme(EventDispatcher):
+    """Current palette as colour properties, one per role"""
+
+    name = OptionProperty('dark', options=list(PALETTES))
+
+    background = ColorProperty(PALETTES['dark']['background'])
+    surface = ColorProperty(PALETTES['dark']['surface'])
+    surface_alt = ColorProperty(PALETTES['dark']['surface_alt'])
+    accent = ColorProperty(PALETTES['dark']['accent'])
+    text = ColorProperty(PALETTES['dark']['text'])
+    muted = ColorProperty(PALETTES['dark']['muted'])
+    on_accent = ColorProperty(PALETTES['dark']['on_accent'])
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # owner -> list of (target, {attribute: role}); entries vanish with their owner
+        self._styled = weakref.WeakKeyDictionary()
+
+    def style(self, target, owner=None, **roles):
+        """Set target's attributes to role colours and keep them in sync
+
+        A role may be a tuple of roles for list-valued attributes. Canvas
+        instructions pass the widget they belong to as owner. Returns target.
+        """
+        for attribute, role in roles.items():
+            setattr(target, attribute, self._value(role))
+        self._styled.setdefault(target if owner is None else owner, []).append((target, roles))
+        return target
+
+    def _value(self, role):
+        if isinstance(role, tuple):
+            return [getattr(self, name) for name in role]
+        return getattr(self, role)
+
+    def on_name(self, instance, name):
+        """Switch palette and restyle every registered widget"""
+        palette = PALETTES[name]
+        for role in ROLES:
+            setattr(self, role, palette[role])
+        for entries in list(self._styled.values()):
+            for target, roles in entries:
+                for attribute, role in roles.items():
+                    setattr(target, attribute, self._value(role))
+
+    def next_theme(self):
+        """Cycle to the next palette"""
+        names = list(PALETTES)
+        self.name = names[(names.index(self.name) + 1) % len(names)]
+
+
+theme = Theme()
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""Lightweight widgets for static content.
+
+Ordinary Labels bound to their size re-render their text texture on every
+resize or rotation. The widgets here render text once into white textures,
+cache them by text, font and width bucket, and tint them with a Color
+instruction, so resizing within a bucket or changing colours costs no
+re-render.
+"""
+
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics import Color, InstructionGroup, Rectangle
+from kivy.metrics import dp
+from kivy.properties import (
+    BooleanProperty, ColorProperty, ListProperty, NumericProperty, OptionProperty, StringProperty
+)
+from kivy.uix.widget import Widget
+
+from memo import LRUCache
+
+# Wrapping width is rounded down to a multiple of this, textures are
+# re-rendered only when the widget crosses into another bucket
+WIDTH_BUCKET = dp(48)
+
+# Rendered text textures shared by all widgets
+_texture_cache = LRUCache(maxsize=1024)
+
+
+def text_texture(text, font_size, bold=False, halign='left', width=None):
+    """Cached white texture of text wrapped at width (None for no wrapping)"""
+    key = (text, font_size, bold, halign, width)
+    found, texture = _texture_cache.lookup(key)
+    if not found:
+        label = CoreLabel(
+            text=text,
+            font_size=font_size,
+            bold=bold,
+            halign=halign,
+            text_size=(width, None),
+            color=(1, 1, 1, 1)
+        )
+        label.refresh()
+        texture = label.texture
+        _texture_cache.store(key, texture)
+    return texture
+
+
+class StaticText(Widget):
+    """Text block drawn from a cached texture, for text that never changes"""
+
+    text = StringProperty('')
+    font_size = NumericProperty('14sp')
+    bold = BooleanProperty(False)
+    color = ColorProperty([1, 1, 1, 1])
+    halign = OptionProperty('left', options=['left', 'center', 'right'])
+    # Wrap lines at the widget width; otherwise the text keeps its natural width
+    wrap = BooleanProperty(True)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._bucket = None
+        with self.canvas:
+            self._color = Color(*self.color)
+            self._rect = Rectangle()
+        self.bind(color=self._update_color)
+        self.bind(text=self._invalidate, font_size=self._invalidate, bold=self._invalidate,
+                  halign=self._invalidate, wrap=self._invalidate)
+        self.bind(size=self._update_layout, pos=self._update_layout)
+        self._update_layout()
+
+    def _update_color(self, instance, value):
+        self._color.rgba = value
+
+    def _invalidate(self, *args):
+        self._bucket = None
+        self._update_layout()
+
+    def _update_layout(self, *args):
+        bucket = max(WIDTH_BUCKET, self.width // WIDTH_BUCKET * WIDTH_BUCKET) if self.wrap else None
+        if bucket != self._bucket or self._rect.texture is None:
+            self._bucket = bucket
+            texture = text_texture(self.text, self.font_size, self.bold, self.halign, bucket)
+            self._rect.texture = texture
+            self._rect.size = texture.size if texture is not None else (0, 0)
+
+        # Place the block inside the widget, vertically centred
+        text_width, text_height = self._rect.size
+        if self.halign == 'center':
+            x = self.x + (self.width - text_width) / 2
+        elif self.halign == 'right':
+            x = self.right - text_width
+        else:
+            x = self.x
+        self._rect.pos = (int(x), int(self.y + (self.height - text_height) / 2))
+
+
+class TableView(Widget):
+    """Table drawn as one canvas instruction group, with its own hit-testing
+
+    Rows, stripes and cell text are plain instructions, so the widget count
+    and the number of bindings stay the same for any number of rows. The
+    height follows the rows, put the table in a ScrollView for long tables.
+    Dispatches on_row_select(index) when a row is tapped.
+    """
+
+    columns = ListProperty([])
+    rows = ListProperty([])
+    row_height = NumericProperty(dp(35))
+    header_height = NumericProperty(dp(40))
+    font_size = NumericProperty('14sp')
+    text_color = ColorProperty([1, 1, 1, 1])
+    header_color = ColorProperty([1, 0.55, 0, 1])
+    stripe_colors = ListProperty([[0.176, 0.176, 0.176, 1], [0.145, 0.145, 0.145, 1]])
+    selection_color = ColorProperty([1, 0.55, 0, 0.35])
+    selected_row = NumericProperty(-1)
+
+    __events__ = ('on_row_select',)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint_y = None
+        self._group = InstructionGroup()
+        self.canvas.add(self._group)
+        self.bind(columns=self._rebuild, rows=self._rebuild, font_size=self._rebuild,
+                  row_height=self._rebuild, header_height=self._rebuild)
+        self.bind(size=self._layout, pos=self._layout, selected_row=self._layout)
+        self.bind(text_color=self._update_colors, header_color=self._update_colors,
+                  stripe_colors=self._update_colors, selection_color=self._update_colors)
+        self._rebuild()
+
+    def _rebuild(self, *args):
+        """Recreate the instructions after the content changed"""
+        group = self._group
+        group.clear()
+        self._stripes = ([], [])
+        self._header_cells = []
+        self._cells = []
+
+        self._stripe_instructions = []
+        for parity in (0, 1):
+            color = Color(*self.stripe_colors[parity])
+            self._stripe_instructions.append(color)
+            group.add(color)
+            for _ in range(parity, len(self.rows), 2):
+                rect = Rectangle()
+                self._stripes[parity].append(rect)
+                group.add(rect)
+
+        self._selection_instruction = Color(*self.selection_color)
+        group.add(self._selection_instruction)
+        self._selection = Rectangle(size=(0, 0))
+        group.add(self._selection)
+
+        self._header_instruction = Color(*self.header_color)
+        group.add(self._header_instruction)
+        for title in self.columns:
+            rect = self._text_rect(title, bold=True)
+            self._header_cells.append(rect)
+            group.add(rect)
+
+        self._text_instruction = Color(*self.text_color)
+        group.add(self._text_instruction)
+        for row in self.rows:
+            cells = []
+            for value in row:
+                rect = self._text_rect(str(value))
+                cells.append(rect)
+                group.add(rect)
+            self._cells.append(cells)
+
+        self.height = self.header_height + len(self.rows) * self.row_height
+        self._layout()
+
+    def _text_rect(self, text, bold=False):
+        texture = text_texture(text, self.font_size, bold=bold, halign='center')
+        return Rectangle(texture=texture, size=texture.size if texture is not None else (0, 0))
+
+    def _layout(self, *args):
+        """Move the instructions after a size, position or selection change"""
+        column_width = self.width / max(1, len(self.columns))
+        top = self.top
+
+        def center(rect, column, row_top, row_height):
+            width, height = rect.size
+            rect.pos = (int(self.x + column * column_width + (column_width - width) / 2),
+                        int(row_top - (row_height + height) / 2))
+
+        for column, rect in enumerate(self._header_cells):
+            center(rect, column, top, self.header_height)
+
+        rows_top = top - self.header_height
+        for index, cells in enumerate(self._cells):
+            row_top = rows_top - index * self.row_height
+            stripe = self._stripes[index % 2][index // 2]
+            stripe.pos = (self.x, row_top - self.row_height)
+            stripe.size = (self.width, self.row_height)
+            for column, rect in enumerate(cells):
+                center(rect, column, row_top, self.row_height)
+
+        if 0 <= self.selected_row < len(self.rows):
+            self._selection.pos = (self.x, rows_top - (self.selected_row + 1) * self.row_height)
+            self._selection.size = (self.width, self.row_height)
+        else:
+            self._selection.size = (0, 0)
+
+    def _update_colors(self, *args):
+        for parity, color in enumerate(self._stripe_instructions):
+            color.rgba = self.stripe_colors[parity]
+        self._selection_instruction.rgba = self.selection_color
+        self._header_instruction.rgba = self.header_color
+        self._text_instruction.rgba = self.text_color
+
+    def row_at(self, y):
+        """Index of the row at window y coordinate, or -1"""
+        offset = self.top - self.header_height - y
+        if offset < 0:
+            return -1
+        index = int(offset // self.row_height)
+        return index if index < len(self.rows) else -1
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+        index = self.row_at(touch.y)
+        if index >= 0:
+            self.selected_row = index
+            self.dispatch('on_row_select', index)
+            return True
+        return super().on_touch_down(touch)
+
+    def on_row_select(self, index):
+        pass